@@ -6,31 +6,39 @@
 
 import os
 import re
-import shutil
 import sys
+import threading
 import webbrowser
+from concurrent.futures import Future
 from pathlib import Path
-from stat import S_IREAD
-from stat import S_IRGRP
-from stat import S_IROTH
-from stat import S_IWUSR
 from tkinter import StringVar
 from tkinter import Tk
 from tkinter import filedialog
 from tkinter import messagebox as tkmsg
 from tkinter import simpledialog
+from typing import Optional
 
 from app.layout import Layout
 from app.state_setter import UISetter
 from app.vars import Variables
+from app.widgets.history import HistoryWindow
+from app.widgets.progress import ProgressWindow
+from const import BOUNDING_BOX_POLL
+from const import BOUNDING_BOX_TIMEOUT
 from const import PROP_DRAWING_PATH
 from const import REVISION_FOLDER
+from const import REVISION_POLL
 from const import SUFFIX_DRAWING
 from const import Source
 from handler.properties import Properties
+from handler.revisions import RevisionSnapshot
+from helper.files import file_checker
+from helper.launcher import CancelEvent
 from helper.launcher import launch_bounding_box_app
+from helper.launcher import wait_for_bounding_box_app
 from helper.lazy_loaders import LazyDocumentHelper
 from helper.values import calculate_definition
+from helper.values import get_linked_doc_path
 from helper.values import get_new_revision
 from material_manager import MaterialManager
 from pytia.log import log
@@ -39,7 +47,6 @@ from pytia_ui_tools.helper.values import add_current_value_to_combobox_list
 from resources import resource
 from resources.utils import create_path_symlink
 from resources.utils import create_path_workspace_level
-from resources.utils import expand_env_vars
 from win32api import SetFileAttributes
 from win32con import FILE_ATTRIBUTE_HIDDEN
 
@@ -123,6 +130,7 @@ class Callbacks:
         self.properties = properties
         self.workspace = workspace
         self.set_ui = ui_setter
+        self.material_manager: Optional[MaterialManager] = None
         self.readonly = bool(
             not resource.logon_exists()
             and not resource.settings.restrictions.allow_all_users
@@ -148,6 +156,7 @@ class Callbacks:
         self.layout.tools_menu.entryconfig(0, command=self.on_add_drawing_file)
         self.layout.tools_menu.entryconfig(1, command=self.on_remove_drawing_file)
         self.layout.tools_menu.entryconfig(3, command=self.on_calculate_bounding_box)
+        self.layout.tools_menu.entryconfig(5, command=self.on_revision_history)
 
     def _bind_widget_callbacks(self) -> None:
         """Binds all callbacks to the main windows widgets."""
@@ -173,6 +182,7 @@ class Callbacks:
         documents properties.
         """
         log.info("Callback for button 'Save'.")
+        self.vars.flush_traces()
         self.set_ui.loading()
 
         if resource.settings.restrictions.enable_information:
@@ -243,38 +253,6 @@ class Callbacks:
             try:
                 os.makedirs(name=revision_folder, exist_ok=True)
                 SetFileAttributes(str(revision_folder), FILE_ATTRIBUTE_HIDDEN)  # type: ignore
-
-                if os.path.exists(revision_file):
-                    os.chmod(revision_file, S_IWUSR | S_IREAD)
-                    os.remove(revision_file)
-                shutil.copy(self.doc_helper.path, revision_file)
-                os.chmod(revision_file, S_IREAD | S_IRGRP | S_IROTH)
-
-                self.vars.revision.set(new_revision)
-                self.vars.description.set(
-                    f"Revision {new_revision}: {user_input}{line_ending}{current_desc}"
-                )
-                if resource.settings.auto_definition.enable:
-                    self.vars.definition.set(
-                        calculate_definition(
-                            product_number=self.vars.product_number,
-                            partnumber=self.vars.partnumber,
-                            revision=self.vars.revision,
-                            prefix=self.workspace.elements.definition_prefix
-                            or resource.settings.auto_definition.prefix,
-                        )
-                    )
-
-                log.info(
-                    f"Created new revision ({new_revision}) for document "
-                    f"{self.doc_helper.name} and saved a copy of the old revision to "
-                    f"{revision_folder}."
-                )
-                if self.doc_helper.document.properties.exists(PROP_DRAWING_PATH):
-                    self.doc_helper.document.properties.delete(PROP_DRAWING_PATH)
-                    self.vars.linked_doc.set("")
-                    log.info(f"Removed property {PROP_DRAWING_PATH!r} from document.")
-
             except PermissionError as e:
                 log.error(f"Failed to create new revision: {e}")
                 tkmsg.showerror(
@@ -283,36 +261,210 @@ class Callbacks:
                         "Failed to create a new revision: Permission error in the file system."
                     ),
                 )
+                return
+
+            # The document is copied in the background, the revision is only changed after
+            # the copy has been verified.
+            self.set_ui.loading()
+            snapshot = RevisionSnapshot(
+                source=self.doc_helper.path,
+                target=revision_file,
+                revision=current_revision,
+                description=user_input,
+                properties=self.properties.snapshot(),
+                store=resource.settings.revision_store == "dedup",
+            )
+            snapshot.start()
+            progress_window = ProgressWindow(
+                master=self.root,
+                title=resource.settings.title,
+                text=f"Saving revision {current_revision} ...",
+            )
+            self.root.after(
+                REVISION_POLL,
+                lambda: self._poll_revision_snapshot(
+                    snapshot=snapshot,
+                    progress_window=progress_window,
+                    new_revision=new_revision,
+                    description=f"Revision {new_revision}: {user_input}"
+                    f"{line_ending}{current_desc}",
+                ),
+            )
         else:
             tkmsg.showwarning(
                 title=resource.settings.title,
                 message=("Failed to create a new revision: Invalid description."),
             )
 
+    def _poll_revision_snapshot(
+        self,
+        snapshot: RevisionSnapshot,
+        progress_window: ProgressWindow,
+        new_revision: str,
+        description: str,
+    ) -> None:
+        """
+        Polls the progress of the revision snapshot. Sets the new revision after the copy of the
+        document has been verified.
+
+        Args:
+            snapshot (RevisionSnapshot): The running snapshot.
+            progress_window (ProgressWindow): The window that shows the progress.
+            new_revision (str): The new revision of the document.
+            description (str): The new description of the document.
+        """
+        progress_window.set_progress(snapshot.progress)
+        if not snapshot.done:
+            self.root.after(
+                REVISION_POLL,
+                lambda: self._poll_revision_snapshot(
+                    snapshot, progress_window, new_revision, description
+                ),
+            )
+            return
+
+        progress_window.close()
+        self.set_ui.reset()
+
+        if snapshot.error is not None:
+            tkmsg.showerror(
+                title=resource.settings.title,
+                message=(
+                    "Failed to create a new revision: The document couldn't be copied to the "
+                    f"revision folder.\n\n{snapshot.error}"
+                ),
+            )
+            return
+
+        self.vars.revision.set(new_revision)
+        self.vars.description.set(description)
+        if resource.settings.auto_definition.enable:
+            self.vars.definition.set(
+                calculate_definition(
+                    product_number=self.vars.product_number,
+                    partnumber=self.vars.partnumber,
+                    revision=self.vars.revision,
+                    prefix=self.workspace.elements.definition_prefix
+                    or resource.settings.auto_definition.prefix,
+                )
+            )
+
+        log.info(
+            f"Created new revision ({new_revision}) for document "
+            f"{self.doc_helper.name} and saved a copy of the old revision to "
+            f"{snapshot.target.parent}."
+        )
+        if self.doc_helper.document.properties.exists(PROP_DRAWING_PATH):
+            self.doc_helper.document.properties.delete(PROP_DRAWING_PATH)
+            self.vars.linked_doc.set("")
+            log.info(f"Removed property {PROP_DRAWING_PATH!r} from document.")
+
     def on_btn_material(self) -> None:
-        """Callback function for the material button. Opens the material manager window."""
+        """
+        Callback function for the material button. Opens the material manager window.
+        The window is created on the first call and reused afterwards.
+        """
         log.info("Callback for button 'Material'.")
-        MaterialManager(
-            doc_helper=self.doc_helper,
-            ui_setter=self.set_ui,
-        )
+        if self.material_manager is None:
+            self.material_manager = MaterialManager(
+                master=self.root,
+                doc_helper=self.doc_helper,
+                ui_setter=self.set_ui,
+            )
+        self.material_manager.show()
 
     def on_calculate_bounding_box(self) -> None:
         """Callback function for the bounding box tool menu entry.
-        Launches the bounding box app."""
+        Launches the bounding box app and waits for it in the background."""
         log.info("Callback for button 'Bounding Box'.")
+        if (launched_at := launch_bounding_box_app()) is None:
+            return
+
         self.set_ui.loading()
+        cancel = CancelEvent()
+        waiting: Future = Future()
+
+        def wait() -> None:
+            try:
+                waiting.set_result(
+                    wait_for_bounding_box_app(
+                        timeout=BOUNDING_BOX_TIMEOUT,
+                        launched_at=launched_at,
+                        cancel=cancel,
+                    )
+                )
+            except Exception as e:  # pylint: disable=W0718
+                waiting.set_exception(e)
 
-        launch_bounding_box_app()
-        self.doc_helper.document.current()
-        self.doc_helper.setvar_property(
-            self.vars.base_size, resource.props.infra.base_size
+        threading.Thread(target=wait, name="BoundingBoxWait", daemon=True).start()
+        progress_window = ProgressWindow(
+            master=self.root,
+            title=resource.settings.title,
+            text="Waiting for the bounding box app ...",
+            indeterminate=True,
+            on_cancel=cancel.set,
         )
-        self.doc_helper.setvar_property(
-            self.vars.base_size_preset, resource.props.infra.base_size_preset
+        self.root.after(
+            BOUNDING_BOX_POLL,
+            lambda: self._poll_bounding_box(waiting, cancel, progress_window),
         )
 
+    def _poll_bounding_box(
+        self, waiting: Future, cancel: CancelEvent, progress_window: ProgressWindow
+    ) -> None:
+        """
+        Polls the wait for the bounding box app. Reloads the base size after the app has been
+        closed. Closes the cancel event after the wait has finished.
+
+        Args:
+            waiting (Future): The result of the wait, True if the app has been closed.
+            cancel (CancelEvent): The event that cancels the wait.
+            progress_window (ProgressWindow): The window that shows the waiting state.
+        """
+        if not waiting.done():
+            self.root.after(
+                BOUNDING_BOX_POLL,
+                lambda: self._poll_bounding_box(waiting, cancel, progress_window),
+            )
+            return
+
+        progress_window.close()
         self.set_ui.reset()
+        cancel.close()
+
+        if (error := waiting.exception()) is not None:
+            log.error(f"Failed waiting for the bounding box app: {error}")
+            tkmsg.showerror(
+                title=resource.settings.title,
+                message=f"Failed waiting for the bounding box app.\n\n{error}",
+            )
+        elif waiting.result():
+            # Only the properties written by the bounding box app are read again.
+            self.doc_helper.document.current()
+            self.doc_helper.setvar_property(
+                self.vars.base_size, resource.props.infra.base_size
+            )
+            self.doc_helper.setvar_property(
+                self.vars.base_size_preset, resource.props.infra.base_size_preset
+            )
+        elif not cancel.is_set():
+            tkmsg.showwarning(
+                title=resource.settings.title,
+                message=(
+                    "The bounding box app didn't open within "
+                    f"{BOUNDING_BOX_TIMEOUT:.0f} seconds."
+                ),
+            )
+
+    def on_revision_history(self) -> None:
+        """Callback function for the revision history tool menu entry."""
+        log.info("Callback for menu 'Revision History'.")
+        HistoryWindow(
+            master=self.root,
+            revision_folder=Path(self.doc_helper.folder, REVISION_FOLDER),
+            name=self.doc_helper.name,
+            current=self.properties.snapshot(),
+        )
 
     def on_btn_reload_source(self) -> None:
         """Callback function for the reload source button. Runs the on_source_bought function."""
@@ -338,15 +490,18 @@ class Callbacks:
         webbrowser.open(self.vars.weblink.get())
 
     def on_lbl_linked_doc(self) -> None:
-        """Opens the linked document, if there is one and closes the app."""
-        drawing_file_value = self.vars.linked_doc.get()
-        if drawing_file_value.startswith(".\\") and self.workspace.workspace_folder:
-            relative_path = Path(drawing_file_value[2:])
-            linked_doc = Path(self.workspace.workspace_folder, relative_path)
-        else:
-            linked_doc = Path(
-                expand_env_vars(drawing_file_value, ignore_not_found=True)
-            )
+        """
+        Opens the linked document, if there is one and closes the app. Links the suggested
+        drawing, if there's no linked document.
+        """
+        if not self.vars.linked_doc.get():
+            if suggestion := self.vars.linked_doc_suggestion.get():
+                self._link_suggested_drawing(Path(suggestion))
+            return
+
+        linked_doc = get_linked_doc_path(
+            self.vars.linked_doc.get(), self.workspace.workspace_folder
+        )
         log.debug(f"Linked doc path: {linked_doc}")
 
         # We have to check if the document is available in a window, otherwise a
@@ -355,10 +510,59 @@ class Callbacks:
             self.doc_helper.framework.catia.windows.item(linked_doc.name).activate()
             log.info("User opened linked document (window).")
             sys.exit()
-        if linked_doc.is_file() and linked_doc.suffix == SUFFIX_DRAWING:
+        if linked_doc.suffix == SUFFIX_DRAWING:
+            # The result is usually cached by the trace of the linked doc.
+            file_checker.check(
+                widget=self.root,
+                path=linked_doc,
+                callback=lambda exists: self._open_linked_doc(linked_doc, exists),
+            )
+
+    def _link_suggested_drawing(self, drawing_file: Path) -> None:
+        """
+        Links the suggested drawing to the document, if the user agrees.
+
+        Args:
+            drawing_file (Path): The path of the suggested drawing.
+        """
+        if not tkmsg.askyesno(
+            title=resource.settings.title,
+            message=(
+                f"Do you want to link the drawing {str(drawing_file)!r} to this "
+                "document?"
+            ),
+        ):
+            return
+        log.info(f"User linked the suggested drawing {str(drawing_file)!r}.")
+        self.vars.linked_doc.set(
+            create_path_workspace_level(
+                path=drawing_file,
+                workspace_folder=self.workspace.workspace_folder,
+                always_apply_relative=True,
+            )
+        )
+
+    def _open_linked_doc(self, linked_doc: Path, exists: Optional[bool]) -> None:
+        """
+        Opens the linked document and closes the app.
+
+        Args:
+            linked_doc (Path): The path of the linked document.
+            exists (Optional[bool]): The result of the existence check, None if the check \
+                timed out.
+        """
+        if exists:
             self.doc_helper.framework.catia.documents.open(linked_doc)
             log.info("User opened linked document (file).")
             sys.exit()
+        if exists is None:
+            tkmsg.showwarning(
+                title=resource.settings.title,
+                message=(
+                    f"The location of the linked document {str(linked_doc)!r} is not "
+                    "reachable at the moment."
+                ),
+            )
 
     def on_add_drawing_file(self) -> None:
         """Adds a drawing file to the doc properties"""
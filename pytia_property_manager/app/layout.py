@@ -51,6 +51,8 @@ class Layout:
         self._tools_menu.add_command(label="Remove Drawing File")
         self._tools_menu.add_separator()
         self._tools_menu.add_command(label="Calculate Bounding Box")
+        self._tools_menu.add_separator()
+        self._tools_menu.add_command(label="Revision History")
 
         menubar.add_cascade(label="Help", command=show_help)
         menubar.add_cascade(label="Appearance", menu=self._appearance_menu)
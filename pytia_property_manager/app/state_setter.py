@@ -8,20 +8,32 @@
     - Loading
     - Made
     - Bought
+
+    Each state is described as a table of (widget, option, value) entries. The UI setter keeps
+    track of the applied options and only configures the options that actually change.
 """
 
 import tkinter as tk
+from tkinter import StringVar
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
 
 from app.layout import Layout
 from app.vars import Variables
 from const import Source
 from helper.lazy_loaders import LazyDocumentHelper
+from helper.scheduler import redraw
 from helper.verifications import verify_url
 from pytia.log import log
 from pytia_ui_tools.handlers.workspace_handler import Workspace
 from resources import resource
 
 
+StateEntry = Tuple[Any, str, Any]
+
+
 class UISetter:
     """UI Setter class for the main window."""
 
@@ -48,6 +60,8 @@ class UISetter:
         self.vars = variables
         self.workspace = workspace
 
+        self._applied: Dict[Tuple[Any, str], Any] = {}
+
     def reset(self) -> None:
         """Resets the UI depending on the current chosen source."""
         log.info("Resetting main UI state...")
@@ -63,166 +77,112 @@ class UISetter:
 
     def loading(self) -> None:
         """Sets the UI to state 'loading'. Disables all widgets."""
-        self.root.config(cursor="wait")
-        self.root.update()
-        self.root.update_idletasks()
+        self._apply([(self.root, "cursor", "wait")])
         self.disabled()
 
+        # The loading state must be visible before the blocking work starts: Pending redraw
+        # requests are flushed and painted, without processing any user events.
+        redraw.flush()
+        self.root.update_idletasks()
+
     def unknown(self) -> None:
         """Sets the UI to state 'unknown'. Disabled almost all widgets and clears their content."""
         log.debug("Setting main UI to state 'unknown'.")
-
-        self.layout.input_partnumber.config(state="readonly")
-
-        self.layout.input_project.config(
-            state=(
-                "readonly"
-                if resource.settings.restrictions.strict_project
-                and self.workspace.elements.projects
-                else tk.NORMAL
-            )
+        layout = self.layout
+
+        self._set_vars(
+            [
+                (self.vars.material, ""),
+                (self.vars.material_meta, ""),
+                (self.vars.base_size, ""),
+                (self.vars.base_size_preset, ""),
+                (self.vars.mass, ""),
+                (self.vars.order_number, ""),
+                (self.vars.manufacturer, ""),
+                (self.vars.supplier, ""),
+                (self.vars.weblink, ""),
+                (self.vars.group, ""),
+                (self.vars.tolerance, ""),
+                (self.vars.spare_part_level, ""),
+                *[(note_var, "") for note_var in layout.notes.note_vars],
+            ]
         )
-
-        self.layout.input_product_number.config(
-            state=(
-                "readonly"
-                if resource.settings.restrictions.strict_product
-                and self.workspace.elements.product
-                else tk.NORMAL
-            )
+        self._apply(
+            [
+                *self._header_table(button_source=tk.DISABLED),
+                (layout.input_material, "state", tk.DISABLED),
+                (layout.button_material, "state", tk.DISABLED),
+                (layout.input_base_size, "state", tk.DISABLED),
+                (layout.input_base_size_preset, "state", tk.DISABLED),
+                (layout.input_mass, "state", tk.DISABLED),
+                (layout.button_mass, "state", tk.DISABLED),
+                (layout.input_order_number, "state", tk.DISABLED),
+                (layout.input_manufacturer, "state", tk.DISABLED),
+                (layout.input_supplier, "state", tk.DISABLED),
+                (layout.input_weblink, "state", tk.DISABLED),
+                (layout.input_group, "state", tk.DISABLED),
+                (layout.input_tolerance, "state", tk.DISABLED),
+                (layout.input_spare_part, "state", tk.DISABLED),
+                (layout.input_description, "state", tk.NORMAL),
+                *self._notes_table(tk.DISABLED),
+                (layout.button_abort, "state", tk.NORMAL),
+                (self.root, "cursor", "arrow"),
+            ]
         )
 
-        self.layout.input_revision.config(state="readonly")
-        self.layout.button_revision.configure(state=tk.NORMAL)
-
-        self.layout.input_source.config(state="readonly")
-        self.layout.button_source.configure(state=tk.DISABLED)
-
-        self.vars.material.set("")
-        self.vars.material_meta.set("")
-        self.layout.input_material.config(state=tk.DISABLED)
-        self.layout.button_material.configure(state=tk.DISABLED)
-
-        self.vars.base_size.set("")
-        self.vars.base_size_preset.set("")
-        self.layout.input_base_size.config(state=tk.DISABLED)
-        self.layout.input_base_size_preset.config(state=tk.DISABLED)
-
-        self.vars.mass.set("")
-        self.layout.input_mass.config(state=tk.DISABLED)
-        self.layout.button_mass.configure(state=tk.DISABLED)
-
-        self.vars.order_number.set("")
-        self.layout.input_order_number.config(state=tk.DISABLED)
-
-        self.vars.manufacturer.set("")
-        self.layout.input_manufacturer.config(state=tk.DISABLED)
-
-        self.vars.supplier.set("")
-        self.layout.input_supplier.config(state=tk.DISABLED)
-
-        self.vars.weblink.set("")
-        self.layout.input_weblink.config(state=tk.DISABLED)
-
-        self.vars.group.set("")
-        self.layout.input_group.config(state=tk.DISABLED)
-
-        self.vars.tolerance.set("")
-        self.layout.input_tolerance.config(state=tk.DISABLED)
-
-        self.vars.spare_part_level.set("")
-        self.layout.input_spare_part.config(state=tk.DISABLED)
-
-        self.layout.input_description.state = tk.NORMAL
-
-        self.layout.notes.clear()
-        self.layout.notes.state(tk.DISABLED)
-
-        self.layout.processes.clear()
-        self.layout.processes.state(tk.DISABLED)
+        layout.processes.clear()
+        layout.processes.state(tk.DISABLED)
 
-        self.layout.button_abort.configure(state=tk.NORMAL)
-
-        self.root.config(cursor="arrow")
-        self.root.update()
         log.info("Main UI state is now 'unknown'.")
 
     def made(self) -> None:
         """Sets the UI to state 'made'. Enables all made-related widgets."""
         log.debug("Setting main UI to state 'made'.")
-        self.layout.input_partnumber.config(state="readonly")
-
-        self.layout.input_project.config(
-            state=(
-                "readonly"
-                if resource.settings.restrictions.strict_project
-                and self.workspace.elements.projects
-                else tk.NORMAL
-            )
-        )
-
-        self.layout.input_product_number.config(
-            state=(
-                "readonly"
-                if resource.settings.restrictions.strict_product
-                and self.workspace.elements.product
-                else tk.NORMAL
-            ),
-            cursor=(
-                "arrow"
-                if resource.settings.restrictions.strict_product
-                and self.workspace.elements.product
-                else "xterm"
-            ),
+        layout = self.layout
+        strict_product = bool(
+            resource.settings.restrictions.strict_product
+            and self.workspace.elements.product
         )
 
-        self.layout.input_revision.config(state="readonly")
-        self.layout.button_revision.configure(state=tk.NORMAL)
-
-        self.layout.input_source.config(state="readonly")
-        self.layout.button_source.configure(state=tk.NORMAL)
-
-        self.layout.input_material.configure(state="readonly")
         self.doc_helper.setvar_material(self.vars.material, self.vars.material_meta)
-        self.layout.button_material.configure(state=tk.NORMAL)
-
-        self.layout.input_base_size.config(state="readonly")
-        self.layout.input_base_size_preset.config(state="readonly")
-
-        self.layout.input_mass.config(state="readonly")
-        self.layout.button_mass.configure(state=tk.NORMAL)
-
-        self.layout.input_order_number.config(state=tk.NORMAL)
-
-        self.layout.input_manufacturer.config(state=tk.NORMAL)
-
-        self.layout.input_supplier.config(state=tk.NORMAL)
+        self._apply(
+            [
+                *self._header_table(button_source=tk.NORMAL),
+                (
+                    layout.input_product_number,
+                    "cursor",
+                    "arrow" if strict_product else "xterm",
+                ),
+                (layout.input_material, "state", "readonly"),
+                (layout.button_material, "state", tk.NORMAL),
+                (layout.input_base_size, "state", "readonly"),
+                (layout.input_base_size_preset, "state", "readonly"),
+                (layout.input_mass, "state", "readonly"),
+                (layout.button_mass, "state", tk.NORMAL),
+                (layout.input_order_number, "state", tk.NORMAL),
+                (layout.input_manufacturer, "state", tk.NORMAL),
+                (layout.input_supplier, "state", tk.NORMAL),
+                (layout.input_weblink, "state", tk.NORMAL),
+                (layout.input_group, "state", tk.NORMAL),
+                (layout.input_tolerance, "state", tk.NORMAL),
+                (layout.input_spare_part, "state", "readonly"),
+                (layout.input_description, "state", tk.NORMAL),
+                *self._notes_table(tk.NORMAL),
+                (layout.button_save, "state", tk.NORMAL),
+                (self.root, "cursor", "arrow"),
+            ]
+        )
 
-        self.layout.input_weblink.config(state=tk.NORMAL)
-        self.layout.button_weblink.configure(
+        # The state of the weblink button depends on the weblink, it's also set by its trace.
+        layout.button_weblink.configure(
             state=tk.NORMAL if verify_url(self.vars.weblink.get()) else tk.DISABLED
         )
-
-        self.layout.input_group.config(state=tk.NORMAL)
-
-        self.layout.input_tolerance.config(state=tk.NORMAL)
         if not self.vars.tolerance.get():
-            self.layout.input_tolerance.current(0)
-
-        self.layout.input_spare_part.config(state="readonly")
+            layout.input_tolerance.current(0)
         if not self.vars.spare_part_level.get():
-            self.layout.input_spare_part.current(0)
-
-        self.layout.input_description.state = tk.NORMAL
-
-        self.layout.notes.state(tk.NORMAL)
+            layout.input_spare_part.current(0)
+        layout.processes.state(tk.NORMAL)
 
-        self.layout.processes.state(tk.NORMAL)
-
-        self.layout.button_save.configure(state=tk.NORMAL)
-
-        self.root.config(cursor="arrow")
-        self.root.update()
         log.info("Main UI state is now 'made'.")
 
     def bought(self) -> None:
@@ -230,84 +190,53 @@ class UISetter:
         Sets the UI to state 'bought'. Enables all bought-related widgets, disables all others.
         """
         log.debug("Setting main UI to state 'bought'.")
-        self.layout.input_partnumber.config(state="readonly")
-
-        self.layout.input_project.config(
-            state=(
-                "readonly"
-                if resource.settings.restrictions.strict_project
-                and self.workspace.elements.projects
-                else tk.NORMAL
-            )
-        )
-
-        self.layout.input_product_number.config(
-            state=(
-                "readonly"
-                if resource.settings.restrictions.strict_product
-                and self.workspace.elements.product
-                else tk.NORMAL
-            )
-        )
+        layout = self.layout
 
-        self.layout.input_revision.config(state="readonly")
-        self.layout.button_revision.configure(state=tk.NORMAL)
-
-        self.layout.input_source.config(state="readonly")
-        self.layout.button_source.configure(state=tk.NORMAL)
-
-        self.layout.input_material.config(state="readonly")
         self.doc_helper.setvar_material(self.vars.material, self.vars.material_meta)
-        self.layout.button_material.configure(state=tk.NORMAL)
-
-        self.vars.base_size.set("")
-        self.layout.input_base_size.config(state=tk.DISABLED)
-        self.layout.input_base_size_preset.config(state=tk.DISABLED)
-
-        self.layout.input_mass.config(state="readonly")
-        self.layout.button_mass.configure(state=tk.NORMAL)
-
-        self.layout.input_order_number.config(state=tk.NORMAL)
-
-        self.layout.input_manufacturer.config(state=tk.NORMAL)
-
-        self.layout.input_supplier.config(state=tk.NORMAL)
+        self._set_vars(
+            [
+                (self.vars.base_size, ""),
+                (self.vars.tolerance, ""),
+                (layout.notes.get("material").note_var, ""),
+                (layout.notes.get("base_size").note_var, ""),
+                (layout.notes.get("production").note_var, ""),
+            ]
+        )
+        self._apply(
+            [
+                *self._header_table(button_source=tk.NORMAL),
+                (layout.input_material, "state", "readonly"),
+                (layout.button_material, "state", tk.NORMAL),
+                (layout.input_base_size, "state", tk.DISABLED),
+                (layout.input_base_size_preset, "state", tk.DISABLED),
+                (layout.input_mass, "state", "readonly"),
+                (layout.button_mass, "state", tk.NORMAL),
+                (layout.input_order_number, "state", tk.NORMAL),
+                (layout.input_manufacturer, "state", tk.NORMAL),
+                (layout.input_supplier, "state", tk.NORMAL),
+                (layout.input_weblink, "state", tk.NORMAL),
+                (layout.input_group, "state", tk.NORMAL),
+                (layout.input_tolerance, "state", tk.DISABLED),
+                (layout.input_spare_part, "state", tk.NORMAL),
+                (layout.input_description, "state", tk.NORMAL),
+                (layout.notes.get("general"), "state", tk.NORMAL),
+                (layout.notes.get("material"), "state", tk.DISABLED),
+                (layout.notes.get("base_size"), "state", tk.DISABLED),
+                (layout.notes.get("supplier"), "state", tk.NORMAL),
+                (layout.notes.get("production"), "state", tk.DISABLED),
+                (layout.button_save, "state", tk.NORMAL),
+                (self.root, "cursor", "arrow"),
+            ]
+        )
 
-        self.layout.input_weblink.config(state=tk.NORMAL)
-        self.layout.button_weblink.configure(
+        # The state of the weblink button depends on the weblink, it's also set by its trace.
+        layout.button_weblink.configure(
             state=tk.NORMAL if verify_url(self.vars.weblink.get()) else tk.DISABLED
         )
+        layout.input_spare_part.current(0)
+        layout.processes.clear()
+        layout.processes.state(tk.DISABLED)
 
-        self.layout.input_group.config(state=tk.NORMAL)
-
-        self.vars.tolerance.set("")
-        self.layout.input_tolerance.config(state=tk.DISABLED)
-
-        self.layout.input_spare_part.config(state=tk.NORMAL)
-        self.layout.input_spare_part.current(0)
-
-        self.layout.input_description.state = tk.NORMAL
-
-        self.layout.notes.get("general").state = tk.NORMAL
-
-        self.layout.notes.get("material").note_var = ""
-        self.layout.notes.get("material").state = tk.DISABLED
-
-        self.layout.notes.get("base_size").note_var = ""
-        self.layout.notes.get("base_size").state = tk.DISABLED
-
-        self.layout.notes.get("supplier").state = tk.NORMAL
-
-        self.layout.notes.get("production").note_var = ""
-        self.layout.notes.get("production").state = tk.DISABLED
-
-        self.layout.processes.clear()
-        self.layout.processes.state(tk.DISABLED)
-
-        self.layout.button_save.configure(state=tk.NORMAL)
-
-        self.root.config(cursor="arrow")
-        self.root.update()
         log.info("Main UI state is now 'bought'.")
 
     def disabled(self) -> None:
@@ -315,49 +244,126 @@ class UISetter:
         Sets the UI to state 'disabled'.
         """
         log.debug("Setting main UI to state 'disabled'.")
-        self.layout.input_partnumber.config(state=tk.DISABLED)
-
-        self.layout.input_project.config(state=tk.DISABLED)
-
-        self.layout.input_product_number.config(state=tk.DISABLED)
-
-        self.layout.input_revision.config(state=tk.DISABLED)
-        self.layout.button_revision.configure(state=tk.DISABLED)
-
-        self.layout.input_source.config(state=tk.DISABLED)
-        self.layout.button_source.configure(state=tk.DISABLED)
-
-        self.layout.input_material.config(state=tk.DISABLED)
-        self.layout.button_material.configure(state=tk.DISABLED)
-
-        self.layout.input_base_size.config(state=tk.DISABLED)
-        self.layout.input_base_size_preset.config(state=tk.DISABLED)
-
-        self.layout.input_mass.config(state=tk.DISABLED)
-        self.layout.button_mass.configure(state=tk.DISABLED)
-
-        self.layout.input_order_number.config(state=tk.DISABLED)
+        layout = self.layout
+
+        self._apply(
+            [
+                (layout.input_partnumber, "state", tk.DISABLED),
+                (layout.input_project, "state", tk.DISABLED),
+                (layout.input_product_number, "state", tk.DISABLED),
+                (layout.input_revision, "state", tk.DISABLED),
+                (layout.button_revision, "state", tk.DISABLED),
+                (layout.input_source, "state", tk.DISABLED),
+                (layout.button_source, "state", tk.DISABLED),
+                (layout.input_material, "state", tk.DISABLED),
+                (layout.button_material, "state", tk.DISABLED),
+                (layout.input_base_size, "state", tk.DISABLED),
+                (layout.input_base_size_preset, "state", tk.DISABLED),
+                (layout.input_mass, "state", tk.DISABLED),
+                (layout.button_mass, "state", tk.DISABLED),
+                (layout.input_order_number, "state", tk.DISABLED),
+                (layout.input_manufacturer, "state", tk.DISABLED),
+                (layout.input_supplier, "state", tk.DISABLED),
+                (layout.input_weblink, "state", tk.DISABLED),
+                (layout.input_group, "state", tk.DISABLED),
+                (layout.input_tolerance, "state", tk.DISABLED),
+                (layout.input_spare_part, "state", tk.DISABLED),
+                (layout.input_description, "state", tk.DISABLED),
+                *self._notes_table(tk.DISABLED),
+                (layout.button_save, "state", tk.DISABLED),
+            ]
+        )
 
-        self.layout.input_manufacturer.config(state=tk.DISABLED)
+        layout.button_weblink.configure(state=tk.DISABLED)
+        layout.processes.state(tk.DISABLED)
 
-        self.layout.input_supplier.config(state=tk.DISABLED)
+        log.info("Main UI state is now 'disabled'.")
 
-        self.layout.input_weblink.config(state=tk.DISABLED)
-        self.layout.button_weblink.configure(state=tk.DISABLED)
+    def _header_table(self, button_source: str) -> List[StateEntry]:
+        """
+        Returns the state table of the widgets, that share the same state in the states
+        'unknown', 'made' and 'bought' (partnumber, project, product number, revision and source).
 
-        self.layout.input_group.config(state=tk.DISABLED)
+        Args:
+            button_source (str): The state of the source button.
 
-        self.layout.input_tolerance.config(state=tk.DISABLED)
+        Returns:
+            List[StateEntry]: The state table.
+        """
+        strict_project = bool(
+            resource.settings.restrictions.strict_project
+            and self.workspace.elements.projects
+        )
+        strict_product = bool(
+            resource.settings.restrictions.strict_product
+            and self.workspace.elements.product
+        )
+        return [
+            (self.layout.input_partnumber, "state", "readonly"),
+            (
+                self.layout.input_project,
+                "state",
+                "readonly" if strict_project else tk.NORMAL,
+            ),
+            (
+                self.layout.input_product_number,
+                "state",
+                "readonly" if strict_product else tk.NORMAL,
+            ),
+            (self.layout.input_revision, "state", "readonly"),
+            (self.layout.button_revision, "state", tk.NORMAL),
+            (self.layout.input_source, "state", "readonly"),
+            (self.layout.button_source, "state", button_source),
+        ]
 
-        self.layout.input_spare_part.config(state=tk.DISABLED)
+    def _notes_table(self, state: str) -> List[StateEntry]:
+        """
+        Returns the state table of all note widgets.
 
-        self.layout.input_description.state = tk.DISABLED
+        Args:
+            state (str): The state of the note widgets.
 
-        self.layout.notes.state(tk.DISABLED)
+        Returns:
+            List[StateEntry]: The state table.
+        """
+        return [
+            (self.layout.notes.get(name), "state", state)
+            for name in resource.props.notes.keys
+        ]
 
-        self.layout.processes.state(tk.DISABLED)
+    def _apply(self, table: List[StateEntry]) -> None:
+        """
+        Applies a state table. Only options, which differ from the currently applied value, are
+        set. Options that are properties of the target (like the state of a text widget) are
+        set as attribute, all others are configured on the widget.
 
-        self.layout.button_save.configure(state=tk.DISABLED)
+        Args:
+            table (List[StateEntry]): The (widget, option, value) entries to apply.
+        """
+        changes = 0
+        for target, option, value in table:
+            key = (target, option)
+            if key in self._applied and self._applied[key] == value:
+                continue
+
+            if isinstance(getattr(type(target), option, None), property):
+                setattr(target, option, value)
+            else:
+                target.configure(**{option: value})
+            self._applied[key] = value
+            changes += 1
+
+        log.debug(f"Applied {changes} of {len(table)} widget options.")
+
+    @staticmethod
+    def _set_vars(variables: List[Tuple[StringVar, str]]) -> None:
+        """
+        Sets the values of the given variables. Variables, which already have the value, are
+        omitted, this way their traces aren't triggered.
 
-        self.root.update()
-        log.info("Main UI state is now 'disabled'.")
+        Args:
+            variables (List[Tuple[StringVar, str]]): The variables and their values.
+        """
+        for variable, value in variables:
+            if variable.get() != value:
+                variable.set(value)
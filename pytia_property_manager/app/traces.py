@@ -6,6 +6,8 @@ from pathlib import Path
 from tkinter import DISABLED
 from tkinter import NORMAL
 from tkinter import messagebox as tkmsg
+from typing import List
+from typing import Optional
 
 from app.callbacks import on_source_bought
 from app.layout import Layout
@@ -15,12 +17,14 @@ from app.vars import Variables
 from const import PROP_DRAWING_PATH
 from const import SUFFIX_DRAWING
 from const import Source
+from helper.drawings import drawing_index
+from helper.files import file_checker
 from helper.lazy_loaders import LazyDocumentHelper
+from helper.values import get_linked_doc_path
 from helper.verifications import verify_url
 from pytia.log import log
 from pytia_ui_tools.handlers.workspace_handler import Workspace
 from resources import resource
-from resources.utils import expand_env_vars
 from ttkbootstrap import Style
 
 
@@ -56,16 +60,16 @@ class Traces:
 
     def _add_traces(self) -> None:
         """Adds all traces."""
-        self.vars.source.trace_add("write", self.trace_source)
-        self.vars.mass.trace_add("write", self.trace_mass)
-        self.vars.project.trace_add("write", self.trace_project)
-        self.vars.base_size.trace_add("write", self.trace_base_size)
-        self.vars.weblink.trace_add("write", self.trace_weblink)
-        self.vars.creator.trace_add("write", self.trace_creator)
-        self.vars.modifier.trace_add("write", self.trace_modifier)
-        self.vars.linked_doc.trace_add("write", self.trace_linked_doc)
-        self.vars.set_view.trace_add("write", self.trace_set_view)
-        self.vars.sync_color.trace_add("write", self.trace_sync_color)
+        self.vars.trace_write(self.vars.source, self.trace_source)
+        self.vars.trace_write(self.vars.mass, self.trace_mass, debounce=True)
+        self.vars.trace_write(self.vars.project, self.trace_project)
+        self.vars.trace_write(self.vars.base_size, self.trace_base_size, debounce=True)
+        self.vars.trace_write(self.vars.weblink, self.trace_weblink, debounce=True)
+        self.vars.trace_write(self.vars.creator, self.trace_creator)
+        self.vars.trace_write(self.vars.modifier, self.trace_modifier)
+        self.vars.trace_write(self.vars.linked_doc, self.trace_linked_doc)
+        self.vars.trace_write(self.vars.set_view, self.trace_set_view)
+        self.vars.trace_write(self.vars.sync_color, self.trace_sync_color)
 
     def trace_mass(self, *_) -> None:
         """Trace callback for the `mass` StringVar"""
@@ -77,17 +81,19 @@ class Traces:
         ...
 
     def trace_linked_doc(self, *_) -> None:
-        """Trace callback for the `linked_doc` StringVar"""
+        """
+        Trace callback for the `linked_doc` StringVar. The existence of the drawing is checked
+        in the background, the linked doc shows 'Checking...' in the meantime. If there's no
+        linked doc, a drawing with the name of the document is suggested from the drawing
+        index of the workspace.
+        """
         drawing_file_value = self.vars.linked_doc.get()
-        if drawing_file_value.startswith(".\\") and self.workspace.workspace_folder:
-            relative_path = Path(drawing_file_value[2:])
-            linked_doc = Path(self.workspace.workspace_folder, relative_path)
-        else:
-            linked_doc = Path(
-                expand_env_vars(drawing_file_value, ignore_not_found=True)
-            )
+        linked_doc = get_linked_doc_path(
+            drawing_file_value, self.workspace.workspace_folder
+        )
+        self.vars.linked_doc_suggestion.set("")
 
-        if self.vars.linked_doc.get() == "":
+        if drawing_file_value == "":
             self.vars.linked_doc_display.set("-")
             self.layout.label_linked_doc.configure(
                 cursor="", foreground=self.style.colors.fg  # type:ignore
@@ -96,8 +102,43 @@ class Traces:
                 widget=self.layout.label_linked_doc,
                 text="There's no drawing document linked to this file.",
             )
+            if self.workspace.workspace_folder:
+                drawing_index.find(
+                    widget=self.layout.label_linked_doc,
+                    stem=self.doc_helper.path.stem,
+                    callback=self._on_drawings_found,
+                )
+        elif linked_doc.suffix != SUFFIX_DRAWING:
+            self._on_linked_doc_checked(drawing_file_value, linked_doc, False)
+        else:
+            self.vars.linked_doc_display.set("Checking...")
+            self.layout.label_linked_doc.configure(
+                cursor="", foreground=self.style.colors.fg  # type:ignore
+            )
+            file_checker.check(
+                widget=self.layout.label_linked_doc,
+                path=linked_doc,
+                callback=lambda exists: self._on_linked_doc_checked(
+                    drawing_file_value, linked_doc, exists
+                ),
+            )
+
+    def _on_linked_doc_checked(
+        self, value: str, linked_doc: Path, exists: Optional[bool]
+    ) -> None:
+        """
+        Callback for the existence check of the linked doc. Results for an outdated value of
+        the `linked_doc` StringVar are omitted.
+
+        Args:
+            value (str): The value of the `linked_doc` StringVar, which has been checked.
+            linked_doc (Path): The path of the linked doc.
+            exists (Optional[bool]): The result of the check, None if the check timed out.
+        """
+        if self.vars.linked_doc.get() != value:
+            return
 
-        elif linked_doc.is_file() and linked_doc.suffix == SUFFIX_DRAWING:
+        if exists:
             self.vars.linked_doc_display.set(linked_doc.stem)
             self.layout.label_linked_doc.configure(
                 cursor="hand2", foreground=self.style.colors.info  # type:ignore
@@ -107,6 +148,18 @@ class Traces:
                 text=str(linked_doc),
             )
 
+        # The location didn't answer in time (e.g. an offline share), this doesn't mean that
+        # the drawing doesn't exist. Therefore the removal of the link isn't offered.
+        elif exists is None:
+            self.vars.linked_doc_display.set("Location not reachable")
+            self.layout.label_linked_doc.configure(
+                cursor="", foreground=self.style.colors.warning  # type:ignore
+            )
+            ToolTip(
+                widget=self.layout.label_linked_doc,
+                text=f"{str(linked_doc)} (location not reachable)",
+            )
+
         elif tkmsg.askyesno(
             title=resource.settings.title,
             message=(
@@ -134,19 +187,47 @@ class Traces:
                 text=f"{str(linked_doc)} (not found)",
             )
 
+    def _on_drawings_found(self, drawings: List[Path]) -> None:
+        """
+        Callback for the lookup of the drawing index. Suggests the drawing with the name of
+        the document, if there's still no linked doc. A drawing in the folder of the document
+        is preferred over drawings in other folders.
+
+        Args:
+            drawings (List[Path]): The drawings with the name of the document.
+        """
+        if self.vars.linked_doc.get() or not drawings:
+            return
+
+        folder = self.doc_helper.folder
+        drawings = sorted(drawings, key=lambda p: (p.parent != folder, len(p.parts)))
+        self.vars.linked_doc_suggestion.set(str(drawings[0]))
+        self.vars.linked_doc_display.set(f"Link {drawings[0].name}?")
+        self.layout.label_linked_doc.configure(
+            cursor="hand2", foreground=self.style.colors.secondary  # type:ignore
+        )
+        ToolTip(
+            widget=self.layout.label_linked_doc,
+            text=(
+                f"Found a drawing with the name of this document: {str(drawings[0])}"
+                + (f" ({len(drawings) - 1} more found)" if len(drawings) > 1 else "")
+                + ".\n\nClick to link the drawing to this document."
+            ),
+        )
+
     def trace_base_size(self, *_) -> None:
         """Trace callback for the `base_size` StringVar"""
         value = self.vars.base_size.get()
-        log.info(f"Trace callback for variable 'base_size': {value}")
+        log.debug(f"Trace callback for variable 'base_size': {value}")
         if not value:
             self.vars.base_size_preset.set("")
 
     def trace_weblink(self, *_) -> None:
         """Trace callback for the `weblink` StringVar"""
         value = self.vars.weblink.get()
-        log.info(f"Trace callback for variable 'weblink': {value}")
+        log.debug(f"Trace callback for variable 'weblink': {value}")
         self.layout.button_weblink.configure(
-            state=NORMAL if verify_url(self.vars.weblink.get()) else DISABLED
+            state=NORMAL if verify_url(value) else DISABLED
         )
 
     def trace_source(self, *_) -> None:
@@ -215,7 +296,9 @@ class Traces:
     def trace_set_view(self, *_) -> None:
         """Trace callback for the `set iso view` StringVar"""
         resource.appdata.set_view = self.vars.set_view.get()
+        resource.save_appdata()
 
     def trace_sync_color(self, *_) -> None:
         """Trace callback for the `sync color` StringVar"""
         resource.appdata.sync_color = self.vars.sync_color.get()
+        resource.save_appdata()
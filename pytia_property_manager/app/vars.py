@@ -2,11 +2,17 @@
     The variables submodule for the app.
 """
 
+from contextlib import AbstractContextManager
 from dataclasses import dataclass
 from tkinter import BooleanVar
 from tkinter import StringVar
 from tkinter import Tk
+from tkinter import Variable
+from typing import Callable
 
+from const import TRACE_DEBOUNCE_DELAY
+from helper.bulk import BulkUpdate
+from helper.scheduler import Debouncer
 from resources import resource
 
 
@@ -44,10 +50,14 @@ class Variables:
 
     linked_doc: StringVar
     linked_doc_display: StringVar
+    linked_doc_suggestion: StringVar
 
     set_view: BooleanVar
     sync_color: BooleanVar
 
+    _bulk: BulkUpdate
+    _debouncer: Debouncer
+
     def __init__(self, root: Tk) -> None:
         """
         Inits the variables.
@@ -88,6 +98,9 @@ class Variables:
         self.linked_doc_display = StringVar(
             master=root, name="linked_doc_display", value="-"
         )
+        self.linked_doc_suggestion = StringVar(
+            master=root, name="linked_doc_suggestion"
+        )
 
         self.set_view = BooleanVar(
             master=root, name="set_view", value=resource.appdata.set_view
@@ -95,3 +108,39 @@ class Variables:
         self.sync_color = BooleanVar(
             master=root, name="sync_color", value=resource.appdata.sync_color
         )
+
+        self._bulk = BulkUpdate()
+        self._debouncer = Debouncer(widget=root, delay=TRACE_DEBOUNCE_DELAY)
+
+    def trace_write(
+        self, variable: Variable, callback: Callable, debounce: bool = False
+    ) -> None:
+        """
+        Adds a write-trace to the variable. The callback is muted during bulk updates, and runs
+        once afterwards if the variable has been written.
+
+        Args:
+            variable (Variable): The variable to trace.
+            callback (Callable): The trace callback.
+            debounce (bool, optional): Collapses bursts of writes (e.g. typing into an entry)
+                into one call of the callback. Defaults to False.
+        """
+
+        def trace(*args) -> None:
+            if debounce and not self._bulk.active:
+                self._debouncer.call(callback, lambda: callback(*args))
+            else:
+                self._bulk.call(callback, lambda: callback(*args))
+
+        variable.trace_add("write", trace)
+
+    def flush_traces(self) -> None:
+        """Runs all pending debounced traces immediately. Call this before reading values."""
+        self._debouncer.flush()
+
+    def bulk_update(self) -> AbstractContextManager:
+        """
+        Returns a context manager that mutes all traces, which have been added with
+        `trace_write`, while many variables are set. Each muted trace runs once at the end.
+        """
+        return self._bulk()
@@ -0,0 +1,400 @@
+"""
+    History window for the revisions of the document and the window for the comparison of the
+    properties of two revisions.
+"""
+
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from tkinter import Tk
+from tkinter import filedialog
+from tkinter import messagebox as tkmsg
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from app.widgets.progress import ProgressWindow
+from const import REVISION_POLL
+from handler.revisions import HistoryEntry
+from handler.revisions import diff_properties
+from handler.revisions import read_history
+from handler.revisions import read_revision_properties
+from handler.revisions import restore_revision
+from pytia.log import log
+from pytia_ui_tools.window_manager import WindowManager
+from resources import resource
+from ttkbootstrap import Button
+from ttkbootstrap import Frame
+from ttkbootstrap import Scrollbar
+from ttkbootstrap import Toplevel
+from ttkbootstrap import Treeview
+
+
+class HistoryWindow(Toplevel):
+    """
+    A window that lists the revisions of the document from the history of the revision
+    folder. A selected revision can be restored to a new file. The properties of two selected
+    revisions, or of one selected revision and the current document, can be compared.
+    """
+
+    WIDTH = 720
+    HEIGHT = 320
+
+    COLUMNS = {
+        "revision": ("Rev", 50),
+        "timestamp": ("Date", 130),
+        "user": ("User", 90),
+        "size": ("Size", 80),
+        "description": ("Description", 340),
+    }
+
+    def __init__(
+        self,
+        master: Tk,
+        revision_folder: Path,
+        name: str,
+        current: Dict[str, str],
+    ) -> None:
+        """
+        Inits the history window and grabs all events of the app.
+
+        Args:
+            master (Tk): The main window.
+            revision_folder (Path): The revision folder of the document.
+            name (str): The name of the document, e.g. `Part.CATPart`.
+            current (Dict[str, str]): The current properties of the document.
+        """
+        Toplevel.__init__(self, master=master)
+        self.withdraw()
+        self.window_manager = WindowManager(self)
+
+        self._revision_folder = revision_folder
+        self._name = name
+        self._current = current
+        self._entries: List[HistoryEntry] = read_history(revision_folder, name=name)
+
+        self.title(f"Revision History - {name}")
+        self.attributes("-topmost", True)
+        self.attributes("-toolwindow", True)
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        frame_table = Frame(master=self)
+        frame_table.grid(row=0, column=0, sticky="nsew", padx=10, pady=(10, 5))
+        frame_table.grid_columnconfigure(0, weight=1)
+        frame_table.grid_rowconfigure(0, weight=1)
+
+        self._table = Treeview(
+            frame_table,
+            columns=list(HistoryWindow.COLUMNS),
+            show="headings",
+            selectmode="extended",
+        )
+        self._table.grid(row=0, column=0, sticky="nsew")
+        for column, (heading, width) in HistoryWindow.COLUMNS.items():
+            self._table.heading(column, text=heading, anchor="w")
+            self._table.column(column, width=width, stretch=column == "description")
+
+        scrollbar = Scrollbar(frame_table, orient="vertical", command=self._table.yview)
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        self._table.configure(yscrollcommand=scrollbar.set)
+
+        frame_buttons = Frame(master=self)
+        frame_buttons.grid(row=1, column=0, sticky="e", padx=10, pady=(5, 10))
+
+        self._btn_compare = Button(
+            frame_buttons,
+            text="Compare",
+            style="outline",
+            width=12,
+            command=self.on_btn_compare,
+        )
+        self._btn_compare.grid(row=0, column=0, padx=(0, 5))
+        self._btn_restore = Button(
+            frame_buttons,
+            text="Restore...",
+            style="outline",
+            width=12,
+            command=self.on_btn_restore,
+        )
+        self._btn_restore.grid(row=0, column=1, padx=(0, 5))
+        Button(
+            frame_buttons,
+            text="Close",
+            style="outline",
+            width=12,
+            command=self.close,
+        ).grid(row=0, column=2)
+
+        # Newest revision first.
+        for index, entry in reversed(list(enumerate(self._entries))):
+            self._table.insert(
+                "",
+                "end",
+                iid=str(index),
+                values=(
+                    entry.revision,
+                    entry.timestamp.replace("T", " "),
+                    entry.user,
+                    f"{entry.size / 1024:,.0f} KB",
+                    entry.description,
+                ),
+            )
+        if not self._entries:
+            self._btn_compare.configure(state="disabled")
+            self._btn_restore.configure(state="disabled")
+
+        screen_width = self.winfo_screenwidth()
+        screen_height = self.winfo_screenheight()
+        x_coordinate = int((screen_width / 2) - (HistoryWindow.WIDTH / 2))
+        y_coordinate = int((screen_height / 2) - (HistoryWindow.HEIGHT / 2))
+        self.geometry(
+            f"{HistoryWindow.WIDTH}x{HistoryWindow.HEIGHT}+{x_coordinate}+{y_coordinate}"
+        )
+
+        self.deiconify()
+        self.after_idle(self.window_manager.remove_window_buttons)
+        self.grab_set()
+
+    def on_btn_compare(self) -> None:
+        """
+        Compares the properties of the two selected revisions. If only one revision is
+        selected, it's compared with the current properties of the document.
+        """
+        selection = sorted(int(iid) for iid in self._table.selection())
+        if len(selection) not in (1, 2):
+            tkmsg.showinfo(
+                parent=self,
+                title=resource.settings.title,
+                message=(
+                    "Select two revisions to compare them, or one revision to compare "
+                    "it with the current document."
+                ),
+            )
+            return
+
+        old = self._entries[selection[0]]
+        if (old_properties := self._read_properties(old)) is None:
+            return
+        if len(selection) == 2:
+            new = self._entries[selection[1]]
+            if (new_properties := self._read_properties(new)) is None:
+                return
+            new_title = f"Revision {new.revision}"
+        else:
+            new_properties = self._current
+            new_title = "Current"
+
+        DiffWindow(
+            master=self,
+            old_title=f"Revision {old.revision}",
+            new_title=new_title,
+            diff=diff_properties(old_properties, new_properties),
+        )
+
+    def _read_properties(self, entry: HistoryEntry) -> Optional[Dict[str, str]]:
+        """
+        Reads the property snapshot of a revision. Shows a message if there is none.
+
+        Args:
+            entry (HistoryEntry): The revision.
+
+        Returns:
+            Optional[Dict[str, str]]: The properties of the revision, None if the revision has \
+                no property snapshot.
+        """
+        try:
+            properties = read_revision_properties(
+                Path(self._revision_folder, entry.file)
+            )
+        except (OSError, ValueError) as e:
+            log.error(f"Failed to read the properties of rev {entry.revision}: {e}")
+            properties = None
+        if properties is None:
+            tkmsg.showinfo(
+                parent=self,
+                title=resource.settings.title,
+                message=f"There are no saved properties for revision {entry.revision}.",
+            )
+        return properties
+
+    def on_btn_restore(self) -> None:
+        """Restores the selected revision to a file chosen by the user."""
+        if len(selection := self._table.selection()) != 1:
+            tkmsg.showinfo(
+                parent=self,
+                title=resource.settings.title,
+                message="Select the revision you want to restore.",
+            )
+            return
+
+        entry = self._entries[int(selection[0])]
+        name = Path(self._name)
+        target = filedialog.asksaveasfilename(
+            parent=self,
+            title=resource.settings.title,
+            initialdir=self._revision_folder.parent,
+            initialfile=f"{name.stem}_rev{entry.revision}{name.suffix}",
+            defaultextension=name.suffix,
+            filetypes=[(name.suffix.lstrip("."), f"*{name.suffix}")],
+        )
+        if not target:
+            return
+
+        # The revision is restored in the background, it may be stored on a network share.
+        restoring: Future = Future()
+
+        def restore() -> None:
+            try:
+                restore_revision(Path(self._revision_folder, entry.file), Path(target))
+                restoring.set_result(None)
+            except Exception as e:  # pylint: disable=W0718
+                restoring.set_exception(e)
+
+        threading.Thread(target=restore, name="RevisionRestore", daemon=True).start()
+        progress_window = ProgressWindow(
+            master=self,
+            title=resource.settings.title,
+            text=f"Restoring revision {entry.revision} ...",
+            indeterminate=True,
+        )
+        self.after(
+            REVISION_POLL,
+            lambda: self._poll_restore(restoring, progress_window, entry, target),
+        )
+
+    def _poll_restore(
+        self,
+        restoring: Future,
+        progress_window: ProgressWindow,
+        entry: HistoryEntry,
+        target: str,
+    ) -> None:
+        """
+        Polls the restore of a revision. Shows the result after the restore has finished.
+
+        Args:
+            restoring (Future): The result of the restore.
+            progress_window (ProgressWindow): The window that shows the restoring state.
+            entry (HistoryEntry): The restored revision.
+            target (str): The path of the restored file.
+        """
+        if not restoring.done():
+            self.after(
+                REVISION_POLL,
+                lambda: self._poll_restore(restoring, progress_window, entry, target),
+            )
+            return
+
+        progress_window.close()
+        self.grab_set()
+
+        if (error := restoring.exception()) is not None:
+            log.error(f"Failed to restore revision {entry.revision}: {error}")
+            tkmsg.showerror(
+                parent=self,
+                title=resource.settings.title,
+                message=f"Failed to restore revision {entry.revision}.\n\n{error}",
+            )
+            return
+
+        tkmsg.showinfo(
+            parent=self,
+            title=resource.settings.title,
+            message=f"Restored revision {entry.revision} to {target}.",
+        )
+
+    def close(self) -> None:
+        """Releases the grab and closes the window."""
+        self.grab_release()
+        self.destroy()
+
+
+class DiffWindow(Toplevel):
+    """A window that lists the properties that differ between two revisions."""
+
+    WIDTH = 720
+    HEIGHT = 320
+
+    def __init__(
+        self,
+        master: Toplevel,
+        old_title: str,
+        new_title: str,
+        diff: List[Tuple[str, str, str]],
+    ) -> None:
+        """
+        Inits the diff window and grabs all events of the app.
+
+        Args:
+            master (Toplevel): The history window.
+            old_title (str): The heading of the column of the older values.
+            new_title (str): The heading of the column of the newer values.
+            diff (List[Tuple[str, str, str]]): The name, the old and the new value of each \
+                property that differs.
+        """
+        Toplevel.__init__(self, master=master)
+        self.withdraw()
+        self.window_manager = WindowManager(self)
+
+        self.title(f"Compare {old_title} - {new_title}")
+        self.attributes("-topmost", True)
+        self.attributes("-toolwindow", True)
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        frame_table = Frame(master=self)
+        frame_table.grid(row=0, column=0, sticky="nsew", padx=10, pady=(10, 5))
+        frame_table.grid_columnconfigure(0, weight=1)
+        frame_table.grid_rowconfigure(0, weight=1)
+
+        table = Treeview(
+            frame_table,
+            columns=["property", "old", "new"],
+            show="headings",
+            selectmode="none",
+        )
+        table.grid(row=0, column=0, sticky="nsew")
+        for column, heading in zip(
+            ["property", "old", "new"], ["Property", old_title, new_title]
+        ):
+            table.heading(column, text=heading, anchor="w")
+            table.column(column, width=DiffWindow.WIDTH // 3)
+
+        scrollbar = Scrollbar(frame_table, orient="vertical", command=table.yview)
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        table.configure(yscrollcommand=scrollbar.set)
+
+        for name, old_value, new_value in diff:
+            table.insert("", "end", values=(name, old_value, new_value))
+        if not diff:
+            table.insert("", "end", values=("No differences", "", ""))
+
+        Button(
+            self,
+            text="Close",
+            style="outline",
+            width=12,
+            command=self.close,
+        ).grid(row=1, column=0, sticky="e", padx=10, pady=(5, 10))
+
+        screen_width = self.winfo_screenwidth()
+        screen_height = self.winfo_screenheight()
+        x_coordinate = int((screen_width / 2) - (DiffWindow.WIDTH / 2))
+        y_coordinate = int((screen_height / 2) - (DiffWindow.HEIGHT / 2))
+        self.geometry(
+            f"{DiffWindow.WIDTH}x{DiffWindow.HEIGHT}+{x_coordinate}+{y_coordinate}"
+        )
+
+        self.deiconify()
+        self.after_idle(self.window_manager.remove_window_buttons)
+        self.grab_set()
+
+    def close(self) -> None:
+        """Returns the grab to the history window and closes the window."""
+        self.grab_release()
+        self.master.grab_set()
+        self.destroy()
@@ -1,24 +1,31 @@
 """
-    Widget set for processes. Creates the processes in the process frame and provides
-    variables for all child widgets.
+    Widget set for processes. Creates the processes in the process frame and holds the values
+    of all processes.
 
     This submodule has two classes:
 
-    - ProcessWidget: Holds all widgets related to one process. Currently a label, a combobox and \
+    - ProcessWidget: Holds all widgets of one visible row. Currently a label, a combobox and \
         a note text widget.
-    - ProcessWidgets: Manages multiple instances of ProcessWidget. Has managing methods like add \
-        or delete.
+    - ProcessWidgets: Manages the values of all processes and the visible rows. Has managing \
+        methods like add or delete.
+
+    The processes are stored as a plain list of (process, note) values. Only the rows that fit
+    into the frame are real widgets, they are re-bound to other processes when the list is
+    scrolled. This way the cost of the frame doesn't depend on the maximum amount of processes.
 """
 
 import tkinter as tk
+from contextlib import AbstractContextManager
 from tkinter import StringVar
 from tkinter import messagebox as tkmsg
 from typing import Callable
-from typing import Dict
 from typing import List
 from typing import Literal
 from typing import Optional
+from typing import Tuple
 
+from helper.bulk import BulkUpdate
+from helper.scheduler import redraw
 from pytia.log import log
 from pytia_ui_tools.widgets.texts import ScrolledText
 from resources import resource
@@ -26,10 +33,13 @@ from ttkbootstrap import Combobox
 from ttkbootstrap import Frame
 from ttkbootstrap import Label
 from ttkbootstrap import Labelframe
+from ttkbootstrap import Scrollbar
+
+ProcessValue = Tuple[str, str]
 
 
 class ProcessWidget:
-    """The process widget class. Holds all widgets related to one process."""
+    """The process widget class. Holds all widgets of one visible row of the process list."""
 
     MARGIN_X = 10
     MARGIN_Y = 10
@@ -37,31 +47,41 @@ class ProcessWidget:
     def __init__(
         self,
         root: Frame | Labelframe,
-        pid: int,
+        slot: int,
         callback_combo: Callable,
         callback_process: Callable,
+        callback_note: Callable,
     ) -> None:
         """
-        Inits the ProcessWidget class. Holds all widgets for one process (label, combobox and note).
+        Inits the ProcessWidget class. Holds all widgets for one row (label, combobox and note).
 
         Args:
             root (tk.Tk | tk.Frame | ttk.Frame | ttk.Labelframe): The parent of all widgets (the \
                 tkinter parent frame).
-            pid (int): The id of this instance.
+            slot (int): The position of the row in the frame.
             callback_combo (Callable): The callback method for combobox selections.
             callback_process (Callable): The callback for the process variable trace.
+            callback_note (Callable): The callback for the note variable trace.
         """
         self._root = root
-        self._pid = pid
+        self._slot = slot
+        self._pid = resource.settings.processes.first + slot
+        self._row = self._slot * 2
         self._func_combo = callback_combo
         self._func_process = callback_process
+        self._func_note = callback_note
 
+        # Writes to the variables while the row is bound to a process must not be reported
+        # back, the values are already stored in the list of processes.
+        self._binding = False
         self._process_var = StringVar()
         self._process_var.trace_add("write", self._callback_process_var)
         self._note_var = StringVar()
+        self._note_var.trace_add("write", self._callback_note_var)
 
         self._state = tk.NORMAL
         self._bottom_space = False
+        self._visible = True
 
         self.lbl_process = Label(
             self._root,
@@ -69,15 +89,10 @@ class ProcessWidget:
             width=15,
         )
         self.lbl_process.grid(
-            row=(self._pid - resource.settings.processes.first) * 2,
+            row=self._row,
             column=0,
             padx=(ProcessWidget.MARGIN_X, 5),
-            pady=(
-                ProcessWidget.MARGIN_Y
-                if self._pid == resource.settings.processes.first
-                else 2,
-                2,
-            ),
+            pady=(ProcessWidget.MARGIN_Y if self._slot == 0 else 2, 2),
             sticky="nsew",
         )
 
@@ -90,15 +105,10 @@ class ProcessWidget:
             state="readonly",
         )
         self.combo_process.grid(
-            row=(self._pid - resource.settings.processes.first) * 2,
+            row=self._row,
             column=1,
             padx=(5, ProcessWidget.MARGIN_X),
-            pady=(
-                ProcessWidget.MARGIN_Y + 1
-                if self._pid == resource.settings.processes.first
-                else 2,
-                2,
-            ),
+            pady=(ProcessWidget.MARGIN_Y + 1 if self._slot == 0 else 2, 2),
             sticky="new",
         )
         self.combo_process.bind("<<ComboboxSelected>>", self._callback_combo)
@@ -112,16 +122,14 @@ class ProcessWidget:
             wrap=tk.WORD,
         )
         self.text_note_process.grid(
-            row=(self._pid - resource.settings.processes.first) * 2 + 1,
+            row=self._row + 1,
             column=1,
             padx=(3, ProcessWidget.MARGIN_X - 1),
             pady=2,
             sticky="nsew",
         )
 
-        self._root.grid_rowconfigure(
-            (self._pid - resource.settings.processes.first) * 2 + 1, weight=1
-        )
+        self._root.grid_rowconfigure(self._row + 1, weight=1)
 
     @property
     def parent(self) -> Frame | Labelframe:
@@ -130,7 +138,7 @@ class ProcessWidget:
 
     @property
     def pid(self) -> int:
-        """Returns the process id of this instance."""
+        """Returns the id of the process, which is currently bound to this row."""
         return self._pid
 
     @property
@@ -138,20 +146,19 @@ class ProcessWidget:
         """Returns the variable of the combobox selection."""
         return self._process_var
 
-    @process_var.setter
-    def process_var(self, value: str) -> None:
-        """Sets the value of the combobox variable."""
-        self._process_var.set(value)
-
     @property
     def note_var(self) -> StringVar:
         """Returns the variable of the note widget."""
         return self._note_var
 
-    @note_var.setter
-    def note_var(self, value: str) -> None:
-        """Sets the value of the note widgets variable."""
-        self._note_var.set(value)
+    @property
+    def height(self) -> int:
+        """Returns the requested height of this row in pixel."""
+        return (
+            self.combo_process.winfo_reqheight()
+            + self.text_note_process.winfo_reqheight()
+            + 8
+        )
 
     @property
     def state(self) -> str:
@@ -184,11 +191,58 @@ class ProcessWidget:
     @bottom_space.setter
     def bottom_space(self, value: bool) -> None:
         """Switches the bottom space value."""
-        self.text_note_process.grid_configure(
-            pady=(2, ProcessWidget.MARGIN_Y if value else 2)
-        )
+        if value != self._bottom_space:
+            self.text_note_process.grid_configure(
+                pady=(2, ProcessWidget.MARGIN_Y if value else 2)
+            )
         self._bottom_space = value
 
+    def bind_process(
+        self,
+        pid: int,
+        value: ProcessValue,
+        state: Literal["normal", "disabled"],
+    ) -> None:
+        """
+        Binds this row to a process: Shows the values of the process with the given pid.
+
+        Args:
+            pid (int): The id of the process.
+            value (ProcessValue): The process and the note of the process.
+            state (Literal["normal", "disabled"]): The state of the row.
+        """
+        process_value, note_value = value
+        self._binding = True
+        try:
+            if pid != self._pid:
+                self.lbl_process.configure(text=f"Process {pid}")
+                self._pid = pid
+            if self._process_var.get() != process_value:
+                self._process_var.set(process_value)
+            if self._note_var.get() != note_value:
+                self._note_var.set(note_value)
+            self.state = state
+        finally:
+            self._binding = False
+
+    def show(self) -> None:
+        """Shows the widgets of this row again, after they have been hidden."""
+        if not self._visible:
+            self.lbl_process.grid()
+            self.combo_process.grid()
+            self.text_note_process.grid()
+            self._root.grid_rowconfigure(self._row + 1, weight=1)
+            self._visible = True
+
+    def hide(self) -> None:
+        """Hides the widgets of this row. The widgets are kept for later use."""
+        if self._visible:
+            self.lbl_process.grid_remove()
+            self.combo_process.grid_remove()
+            self.text_note_process.grid_remove()
+            self._root.grid_rowconfigure(self._row + 1, weight=0)
+            self._visible = False
+
     def _callback_combo(self, event: tk.Event) -> None:
         """
         The combobox-selection callback.
@@ -201,11 +255,23 @@ class ProcessWidget:
         The process variable trace callback.
         Calls the `_callback_process` method of the `ProcessWidgets` class.
         """
-        self._func_process(self._pid, self._process_var.get())
+        if not self._binding:
+            self._func_process(self._pid, self._process_var.get())
+
+    def _callback_note_var(self, *_) -> None:
+        """
+        The note variable trace callback.
+        Calls the `_callback_note` method of the `ProcessWidgets` class.
+        """
+        if not self._binding:
+            self._func_note(self._pid, self._note_var.get())
 
 
 class ProcessWidgets:
-    """The process widgets class. Holds all process widgets."""
+    """The process widgets class. Holds the values of all processes and the visible rows."""
+
+    # The space of the frame, which can't be used for rows (label of the frame and margins).
+    FRAME_SPACE = 40
 
     def __init__(
         self,
@@ -213,7 +279,8 @@ class ProcessWidgets:
         material_metadata: StringVar,
     ) -> None:
         """
-        Inits the ProcessWidgets class. This class handles the ProcessWidget instances.
+        Inits the ProcessWidgets class. This class handles the values of the processes and the
+        ProcessWidget instances, which show them.
 
         Args:
             root (tk.Tk | tk.Frame | ttk.Frame | ttk.Labelframe): The parent of the widgets.
@@ -221,67 +288,73 @@ class ProcessWidgets:
         """
         self._root = root
         self._material_meta = material_metadata
+        self._first = resource.settings.processes.first
         self._init_amount = int(resource.settings.processes.min)
-        self._process_widgets: Dict[int, ProcessWidget] = {}
-        self._current_pid = resource.settings.processes.first - 1
+        self._max_amount = int(resource.settings.processes.max)
+        self._values: List[ProcessValue] = []
+        self._rows: List[ProcessWidget] = []
+        self._capacity = max(self._init_amount, 1)
+        self._offset = 0
+        self._state: Literal["normal", "disabled"] = tk.DISABLED
+        self._bulk = BulkUpdate()
 
         self._root.grid_columnconfigure(1, weight=1)
+        self._scrollbar = Scrollbar(self._root, command=self._on_scroll)
+        self._root.bind("<Configure>", self._on_configure)
+        self._root.bind("<MouseWheel>", self._on_mousewheel)
 
-        # On instantiation the minimum amount of widgets is created.
-        for _ in range(self._init_amount):
-            self.add()
-        self.state(tk.DISABLED)
+        # On instantiation the minimum amount of processes is created.
+        self._normalize()
+        self._render()
 
     @property
-    def process_vars(self) -> List[StringVar]:
-        """Returns a list of all StringVar variables of the process combobox-selections."""
-        return [p.process_var for p in self._process_widgets.values()]
+    def values(self) -> List[ProcessValue]:
+        """Returns the values (process and note) of all processes, ordered by their pid."""
+        return list(self._values)
 
-    @property
-    def note_vars(self) -> List[StringVar]:
-        """Returns a list of all StringVar variables for the process notes."""
-        return [p.note_var for p in self._process_widgets.values()]
+    def load(self, values: List[ProcessValue]) -> None:
+        """
+        Replaces all processes with the given values. Notes of empty processes are omitted.
+
+        Args:
+            values (List[ProcessValue]): The process and note values, ordered by their pid.
+        """
+        self._values = [
+            (process, note if process else "")
+            for process, note in values[: self._max_amount]
+        ]
+        self._offset = 0
+        self._normalize()
+        self._request_render()
 
     def add(
         self, process_value: Optional[str] = None, note_value: Optional[str] = None
-    ) -> Optional[ProcessWidget]:
-        """Adds the process combobox and the process note widgets."""
-        new_pid = self._current_pid + 1
-        if len(self._process_widgets) <= resource.settings.processes.max - 1:
-            widget = ProcessWidget(
-                root=self._root,
-                pid=new_pid,
-                callback_combo=self._callback_combo,
-                callback_process=self._callback_process,
-            )
-            widget.bottom_space = True
-            if new_pid > resource.settings.processes.first:
-                prev = self.get(pid=new_pid - 1)
-                prev.bottom_space = False
-                # Only allow the selection of the process if the previous
-                # process has been selected. This way we don't have to sort
-                # processes later, because there are no 'blank' processes.
-                if prev.process_var.get():
-                    widget.state = tk.NORMAL
-                else:
-                    widget.state = tk.DISABLED
-
-            # self._process_widgets.append(w)
-            self._process_widgets[new_pid] = widget
-            self._current_pid = new_pid
-
-            if process_value:
-                widget.process_var.set(process_value)
-            if process_value and note_value:
-                widget.note_var.set(note_value)
-
-            log.debug(f"Added new process {new_pid}")
-            return widget
-        return None
+    ) -> Optional[int]:
+        """
+        Adds a process to the end of the list.
+
+        Args:
+            process_value (Optional[str], optional): The value of the process. Defaults to None.
+            note_value (Optional[str], optional): The note of the process. Defaults to None.
+
+        Returns:
+            Optional[int]: The pid of the new process. None if the maximum amount is reached.
+        """
+        if len(self._values) >= self._max_amount:
+            return None
+
+        process_value = process_value or ""
+        self._values.append((process_value, note_value or "" if process_value else ""))
+        new_pid = self._first + len(self._values) - 1
+        self._normalize()
+        self._request_render()
+
+        log.debug(f"Added new process {new_pid}")
+        return new_pid
 
     def clear(self, pid: Optional[int] = None) -> None:
         """
-        Clears the content of the widgets with the given pid (process id).
+        Clears the values of the process with the given pid (process id).
         Clears all processes if no pid is provided.
 
         Args:
@@ -289,81 +362,50 @@ class ProcessWidgets:
             to be cleared. Defaults to None.
         """
         if pid:
-            process = self.get(pid)
-            process.process_var.set("")
-            process.note_var.set("")
+            self._values[pid - self._first] = ("", "")
         else:
-            for widget in self._process_widgets.values():
-                widget.process_var.set("")
-                widget.note_var.set("")
+            self._values = []
+            self._offset = 0
+            self._normalize()
+        self._request_render()
 
     def remove(self, pid: int) -> None:
         """
-        Removes the process combobox and the process note from the frame.
-        All widgets (all processes) are going to be deleted, and re-added,
-        except the one with the given pid (process-id). This ensures that
-        the tkinter grid will always work.
+        Removes the process with the given pid (process-id). All following processes move up
+        by one.
 
         Args:
             pid (int): The id of the process which will be deleted.
         """
-        process_store: List[str] = []
-        note_store: List[str] = []
-
-        # First: Destroy all widgets from the all processes.
-        # Store all processes temporarily.
-        for i, widget in enumerate(self._process_widgets.values()):
-            process_store.append(widget.process_var.get())
-            note_store.append(widget.note_var.get())
-
-            widget.lbl_process.grid_forget()
-            widget.combo_process.grid_forget()
-            widget.text_note_process.grid_forget()
-
-            widget.lbl_process.destroy()
-            widget.combo_process.destroy()
-            widget.text_note_process.destroy()
-            widget.parent.grid_rowconfigure(i * 2 + 1, weight=0)
-
-        # Remove the process which shall be removed from
-        # the list from the temporary store.
-        process_store.pop(pid - resource.settings.processes.first)
-        note_store.pop(pid - resource.settings.processes.first)
-
-        # Clear the process list that holds all widgets.
-        self._process_widgets.clear()
-
-        # Reset the pid counter
-        self._current_pid = resource.settings.processes.first - 1
+        self._values.pop(pid - self._first)
+        self._normalize()
+        self._request_render()
 
-        # Add all widgets from the process store.
-        # Remember: The process from the given pid isn't in the temp
-        # store anymore.
-        for i, _ in enumerate(process_store):
-            self.add(process_value=process_store[i], note_value=note_store[i])
+        log.debug(f"Removed process {pid}")
 
-        # Add all processes from the init_amount, if the amount
-        # of remaining processes is less than the init amount.
-        for i in range(len(process_store), self._init_amount):
-            self.add()
+    def get_process(self, pid: int) -> str:
+        """
+        Returns the value of the process with the given pid.
 
-        # Add another widget set, if the current one has a value.
-        if process_store[-1]:
-            self.add()
+        Args:
+            pid (int): The pid of the process.
 
-        log.debug(f"Removed process {pid}")
+        Returns:
+            str: The value of the process. Empty if the process doesn't exist.
+        """
+        return self._values[pid - self._first][0] if self.exists(pid=pid) else ""
 
-    def get(self, pid: int) -> ProcessWidget:
+    def get_note(self, pid: int) -> str:
         """
-        Returns a process widget by its pid.
+        Returns the note of the process with the given pid.
 
         Args:
-            pid (int): The pid of the desired ProcessWidget.
+            pid (int): The pid of the process.
 
         Returns:
-            ProcessWidget: The desired ProcessWidget.
+            str: The note of the process. Empty if the process doesn't exist.
         """
-        return self._process_widgets[pid]
+        return self._values[pid - self._first][1] if self.exists(pid=pid) else ""
 
     def exists(self, pid: int) -> bool:
         """
@@ -375,43 +417,162 @@ class ProcessWidgets:
         Returns:
             bool: True, if the process exists, False otherwise.
         """
-        # return True if len(self._process_widgets) > pid else False
-        return bool(pid in self._process_widgets)
+        return 0 <= pid - self._first < len(self._values)
 
-    def state(
-        self, state: Literal["normal", "disabled"], pid: Optional[int] = None
-    ) -> None:
+    def state(self, state: Literal["normal", "disabled"]) -> None:
         """
-        Sets the state of process widgets. A process widget is only set to state `NORMAL` if the
-        previous widget has a value. The state of the process note widgets is set via the
-        trace callback of the process widgets StringVar, see method `_callback_process`.
+        Sets the state of the processes. A process is only set to state `NORMAL` if the
+        previous process has a value. The state of a process note is only `NORMAL` if the
+        process has a value.
 
         Args:
             state (Literal[&quot;normal&quot;, &quot;disabled&quot;]): The tkinter-state.
-            pid (Optional[int], optional): The pid from which to set the process. \
-                If None, all processes will be set to the given state. Defaults to None.
         """
-        if pid:
-            self.get(pid).state = state
+        self._state = state
+        self._request_render()
+
+    def bulk_update(self) -> AbstractContextManager:
+        """
+        Returns a context manager that defers the rendering of the rows while many processes
+        are set. The rows are rendered once at the end.
+        """
+        return self._bulk()
+
+    def _normalize(self) -> None:
+        """
+        Keeps at least the init amount of processes, and one empty process after the last
+        process, as long as the maximum amount isn't reached.
+        """
+        while len(self._values) < self._init_amount:
+            self._values.append(("", ""))
+        if (
+            self._values
+            and self._values[-1][0]
+            and len(self._values) < self._max_amount
+        ):
+            self._values.append(("", ""))
+
+    def _request_render(self) -> None:
+        """
+        Requests the rendering of the rows. All requests of one turn of the event loop are
+        rendered together, when the app is idle.
+        """
+        self._bulk.call(self._render, lambda: redraw.request(self._root, self._render))
+
+    def _render(self) -> None:
+        """
+        Binds the visible rows to the processes, which are currently scrolled into view. A
+        process can only be selected if the previous process has been selected, and only the
+        last row has a bottom space.
+        """
+        visible = min(self._capacity, len(self._values))
+        self._offset = max(0, min(self._offset, len(self._values) - visible))
+
+        while len(self._rows) < visible:
+            self._build_row()
+
+        for slot, widget in enumerate(self._rows):
+            if slot >= visible:
+                widget.hide()
+                continue
+
+            index = self._offset + slot
+            if self._state == tk.NORMAL and (index == 0 or self._values[index - 1][0]):
+                state = tk.NORMAL
+            else:
+                state = tk.DISABLED
+            widget.bind_process(
+                pid=self._first + index, value=self._values[index], state=state
+            )
+            widget.bottom_space = slot == visible - 1
+            widget.show()
+
+        if visible < len(self._values):
+            self._scrollbar.grid(
+                row=0, column=2, rowspan=visible * 2, padx=(0, 2), pady=10, sticky="ns"
+            )
+            self._scrollbar.set(
+                self._offset / len(self._values),
+                (self._offset + visible) / len(self._values),
+            )
         else:
-            for _, widget in enumerate(self._process_widgets.values()):
-                if (
-                    state == tk.DISABLED
-                    or widget.pid == resource.settings.processes.first
-                    or (
-                        widget.pid > resource.settings.processes.first
-                        and self._process_widgets[widget.pid - 1].process_var.get()
-                    )
-                ):
-                    widget.state = state
+            self._scrollbar.grid_remove()
+
+    def _build_row(self) -> None:
+        """Builds the widgets of the next row."""
+        widget = ProcessWidget(
+            root=self._root,
+            slot=len(self._rows),
+            callback_combo=self._callback_combo,
+            callback_process=self._callback_process,
+            callback_note=self._callback_note,
+        )
+        widget.lbl_process.bind("<MouseWheel>", self._on_mousewheel)
+        widget.combo_process.bind("<MouseWheel>", self._on_mousewheel)
+        self._rows.append(widget)
+
+    def _scroll_to(self, offset: int) -> None:
+        """
+        Scrolls the list of processes, so that the process at the given index is the first
+        visible row.
+
+        Args:
+            offset (int): The index of the first visible process.
+        """
+        visible = min(self._capacity, len(self._values))
+        offset = max(0, min(offset, len(self._values) - visible))
+        if offset != self._offset:
+            self._offset = offset
+            self._request_render()
+
+    def _see(self, pid: int) -> None:
+        """
+        Scrolls the list of processes, so that the process with the given pid is visible.
+
+        Args:
+            pid (int): The pid of the process.
+        """
+        index = pid - self._first
+        if index < self._offset:
+            self._scroll_to(index)
+        elif index >= self._offset + self._capacity:
+            self._scroll_to(index - self._capacity + 1)
+
+    def _on_scroll(self, *args) -> None:
+        """Callback for the scrollbar. Handles the `moveto` and the `scroll` command."""
+        if args[0] == "moveto":
+            self._scroll_to(round(float(args[1]) * len(self._values)))
+        elif args[0] == "scroll":
+            step = self._capacity if args[2] == "pages" else 1
+            self._scroll_to(self._offset + int(args[1]) * step)
+
+    def _on_mousewheel(self, event: tk.Event) -> str:
+        """
+        Callback for the mouse wheel. Scrolls the list of processes. The event doesn't reach
+        the combobox, the mouse wheel would change its selection otherwise.
+        """
+        self._scroll_to(self._offset - int(event.delta / 120))
+        return "break"
+
+    def _on_configure(self, event: tk.Event) -> None:
+        """
+        Callback for size changes of the frame. Calculates the amount of rows that fit into
+        the frame.
+        """
+        if not self._rows:
+            return
+        row_height = max(self._rows[0].height, 1)
+        capacity = max(1, (event.height - ProcessWidgets.FRAME_SPACE) // row_height)
+        if capacity != self._capacity:
+            self._capacity = capacity
+            self._request_render()
 
     def _callback_combo(self, pid: int, value: str) -> None:
         """
         Callback for the process combobox.
 
-         - Removes the widget if the value is None.
-         - Adds a following widget if the value is set and no following widget exists yet.
-         - Clears the note text widget if the callback value is empty.
+         - Removes the process if the value is None.
+         - Adds a following process if the value is set and no following process exists yet.
          - Adds the process note to the note widget.
 
         Args:
@@ -419,82 +580,77 @@ class ProcessWidgets:
             value (str): The value of the combobox.
         """
         log.debug(f"Callback combobox process: pid={pid}, value={value}")
-        process = self._process_widgets[pid]
+        index = pid - self._first
 
-        if value:
-            c = len(self._process_widgets) + resource.settings.processes.first
+        if not value:
+            # Remove the process if it has no value
+            self.remove(pid)
+            return
+
+        # Adds another process and scrolls it into view
+        self._normalize()
+        if self.exists(pid=pid + 1):
+            self._see(pid + 1)
+
+        # Ask the user if the note value shall be replaced
+        if self._values[index][1]:
+            use_preset_note = tkmsg.askyesno(
+                title=resource.settings.title,
+                message=(
+                    f"There is already a note set for process {pid}.\n\n"
+                    "Do you want to replace the current note with a preset?"
+                ),
+            )
+        else:
+            use_preset_note = True
 
-            # Set the state of the following widget to NORMAL
-            if pid + 1 < c:
-                self.get(pid + 1).state = tk.NORMAL
+        # Write the preset note value
+        if use_preset_note:
+            note_value = resource.get_process_note(value)
+            meta_value = self._material_meta.get()
 
-            # Adds another widget set
-            if pid == c - 1:
-                self.add()
+            resource_process = resource.get_process_by_name(value)
+            metadata_required = bool(
+                resource_process and resource_process.metadata_required
+            )
 
-            # Ask the user if the note value shall be replaced
-            if process.note_var.get():
-                use_preset_note = tkmsg.askyesno(
-                    title=resource.settings.title,
+            if "$" in note_value and meta_value:
+                note_value = note_value.replace("$", meta_value)
+            elif "$" in note_value and metadata_required and not meta_value:
+                tkmsg.showwarning(
                     message=(
-                        f"There is already a note set for process {pid}.\n\n"
-                        "Do you want to replace the current note with a preset?"
-                    ),
+                        f"The process {value} requires metadata.\n\n"
+                        "Please select the correct metadata with the material manager. "
+                        "To do so, click the 'select' button besides the material input field."
+                    )
                 )
             else:
-                use_preset_note = True
+                note_value = note_value.replace("$", "-")
+            self._values[index] = (value, note_value)
 
-            # Write the preset note value
-            if use_preset_note:
-                note_value = resource.get_process_note(value)
-                meta_value = self._material_meta.get()
-
-                resource_process = resource.get_process_by_name(
-                    process.process_var.get()
-                )
-                metadata_required = (
-                    True
-                    if resource_process and resource_process.metadata_required
-                    else False
-                )
-
-                if "$" in note_value and meta_value:
-                    note_value = note_value.replace("$", meta_value)
-                elif "$" in note_value and metadata_required and not meta_value:
-                    tkmsg.showwarning(
-                        message=(
-                            f"The process {process.process_var.get()} requires metadata.\n\n"
-                            "Please select the correct metadata with the material manager. "
-                            "To do so, click the 'select' button besides the material input field."
-                        )
-                    )
-                else:
-                    note_value = note_value.replace("$", "-")
-                process.note_var.set(note_value)
-        else:
-            # Remove the widget set if the process has no value
-            self.remove(pid)
+        self._request_render()
 
     def _callback_process(self, pid: int, value: str) -> None:
         """
-        Callback for the process StringVar trace.
-
-         - Sets the note widget as disabled or normal depending of the value.
-         - Sets the state of the following process widgets dependent of the value.
+        Callback for the process StringVar trace of a row. Stores the value and clears the note
+        of an empty process. Updates the state of the note and the following process.
 
         Args:
             pid (int): The pid from which the trace callback is triggered.
             value (str): The value of the variable.
         """
         log.debug(f"Callback trace process: pid={pid}, value={value}")
+        index = pid - self._first
+        self._values[index] = (value, self._values[index][1] if value else "")
+        self._request_render()
 
-        process = self._process_widgets[pid]
-
-        if bool(value):
-            process.text_note_process.state = tk.NORMAL
-        else:
-            process.note_var.set("")
-            process.text_note_process.state = tk.DISABLED
+    def _callback_note(self, pid: int, value: str) -> None:
+        """
+        Callback for the note StringVar trace of a row. Stores the note of the process.
 
-        if self.exists(pid=pid + 1):
-            self.get(pid + 1).state = tk.NORMAL
+        Args:
+            pid (int): The pid from which the trace callback is triggered.
+            value (str): The value of the variable.
+        """
+        index = pid - self._first
+        self._values[index] = (self._values[index][0], value)
@@ -0,0 +1,120 @@
+"""
+    Progress window for long running operations of the main window.
+"""
+
+from tkinter import Tk
+from typing import Callable
+from typing import Optional
+
+from pytia_ui_tools.window_manager import WindowManager
+from ttkbootstrap import Button
+from ttkbootstrap import Frame
+from ttkbootstrap import Label
+from ttkbootstrap import Progressbar
+from ttkbootstrap import Toplevel
+
+
+class ProgressWindow(Toplevel):
+    """
+    A small modal window with a text and a progress bar. The user can't close it, unless the
+    operation can be cancelled.
+    """
+
+    WIDTH = 360
+    HEIGHT = 90
+    HEIGHT_CANCEL = 130
+
+    def __init__(
+        self,
+        master: Tk,
+        title: str,
+        text: str,
+        indeterminate: bool = False,
+        on_cancel: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Inits the progress window and grabs all events of the app.
+
+        Args:
+            master (Tk): The main window.
+            title (str): The title of the window.
+            text (str): The text above the progress bar.
+            indeterminate (bool, optional): Shows an animated progress bar, for operations
+                without a known progress. Defaults to False.
+            on_cancel (Optional[Callable[[], None]], optional): Called when the user cancels
+                the operation. Adds a cancel button, if given. Defaults to None.
+        """
+        Toplevel.__init__(self, master=master)
+        self.withdraw()
+        self.window_manager = WindowManager(self)
+
+        self.title(title)
+        self.attributes("-topmost", True)
+        self.attributes("-toolwindow", True)
+        self.resizable(False, False)
+        self.protocol("WM_DELETE_WINDOW", self._cancel if on_cancel else lambda: None)
+        self._on_cancel = on_cancel
+
+        frame = Frame(master=self)
+        frame.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
+        frame.grid_columnconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self._lbl_text = Label(frame, text=text)
+        self._lbl_text.grid(row=0, column=0, pady=(0, 5), sticky="nsew")
+
+        self._progressbar = Progressbar(
+            frame,
+            mode="indeterminate" if indeterminate else "determinate",
+            maximum=100,
+        )
+        self._progressbar.grid(row=1, column=0, pady=(5, 0), sticky="nsew")
+        if indeterminate:
+            self._progressbar.start()
+
+        height = ProgressWindow.HEIGHT
+        if on_cancel:
+            self._btn_cancel = Button(
+                frame,
+                text="Cancel",
+                style="outline",
+                width=12,
+                command=self._cancel,
+            )
+            self._btn_cancel.grid(row=2, column=0, pady=(10, 0), sticky="e")
+            height = ProgressWindow.HEIGHT_CANCEL
+
+        screen_width = self.winfo_screenwidth()
+        screen_height = self.winfo_screenheight()
+        x_coordinate = int((screen_width / 2) - (ProgressWindow.WIDTH / 2))
+        y_coordinate = int((screen_height / 2) - (height / 2))
+        self.geometry(f"{ProgressWindow.WIDTH}x{height}+{x_coordinate}+{y_coordinate}")
+
+        self.deiconify()
+        self.after_idle(self.window_manager.remove_window_buttons)
+        self.grab_set()
+
+    def set_progress(self, value: float, text: str | None = None) -> None:
+        """
+        Sets the progress.
+
+        Args:
+            value (float): The progress in percent.
+            text (str | None, optional): A new text above the progress bar. Defaults to None.
+        """
+        self._progressbar.configure(value=value)
+        if text is not None:
+            self._lbl_text.configure(text=text)
+
+    def _cancel(self) -> None:
+        """Cancels the operation. The window stays open until the operation has stopped."""
+        if self._on_cancel is not None:
+            self._btn_cancel.configure(state="disabled")
+            self._lbl_text.configure(text="Cancelling ...")
+            self._on_cancel()
+
+    def close(self) -> None:
+        """Releases the grab and closes the window."""
+        self._progressbar.stop()
+        self.grab_release()
+        self.destroy()
@@ -24,11 +24,24 @@ LOG = "app.log"
 PID = os.getpid()
 PID_FILE = f"{TEMP}\\{PYTIA_PROPERTY_MANAGER}.pid"
 PID_FILE_BOUNDING_BOX = f"{TEMP}\\{PYTIA_BOUNDING_BOX}.pid"
+BOUNDING_BOX_TIMEOUT = 120.0  # Seconds to wait for the bounding box app to open
+# Milliseconds between polls for the end of the bounding box app
+BOUNDING_BOX_POLL = 100
 VENV = f"\\.env\\{APP_VERSION}"
 VENV_PYTHON = Path(VENV, "Scripts\\python.exe")
 VENV_PYTHONW = Path(VENV, "Scripts\\pythonw.exe")
 PY_VERSION = APPDATA + "\\pyversion.txt"
 REVISION_FOLDER = ".rev"
+REVISION_CHUNK_SIZE = 1024 * 1024  # Bytes per read and write when copying a revision
+REVISION_STORE = "store"  # Sub folder of the revision folder for deduplicated revisions
+REVISION_STORE_MANIFEST = "store.json"
+REVISION_STORE_LOCK = "store.lock"  # Lock file for changes to the manifest
+REVISION_LOCK_TIMEOUT = 10.0  # Seconds after which a lock file of the manifest is stale
+# Seconds between attempts to acquire the lock of the manifest
+REVISION_LOCK_POLL = 0.05
+REVISION_HISTORY = "history.jsonl"  # Append-only history of the revision folder
+REVISION_PROPERTIES = ".props.json"  # Suffix of the property snapshot of a revision
+REVISION_POLL = 100  # Milliseconds between polls for the progress of a revision copy
 
 PROP_DRAWING_PATH = "pytia.drawing_path"
 
@@ -42,6 +55,17 @@ CONFIG_PROCESSES_DEFAULT = "processes.default.json"
 CONFIG_INFOS = "information.json"
 CONFIG_INFOS_DEFAULT = "information.default.json"
 CONFIG_USERS = "users.json"
+CACHE_MATERIALS = "materials.cache.json"
+# Formatted with the hash of the workspace folder
+CACHE_DRAWINGS = "drawings.{}.cache.json"
+
+# Seconds to wait for further changes before saving the appdata
+APPDATA_SAVE_DELAY = 2.0
+TRACE_DEBOUNCE_DELAY = 300  # Milliseconds without typing before a debounced trace runs
+DRAWING_INDEX_POLL = 100  # Milliseconds between polls for the drawing index to load
+FILE_CHECK_TIMEOUT = 5.0  # Seconds to wait for a file check on a (network) drive
+FILE_CHECK_TTL = 30.0  # Seconds for which the result of a file check is cached
+FILE_CHECK_POLL = 50  # Milliseconds between polls for the result of a file check
 
 VERIFY_CRITICAL = "critical"
 VERIFY_WARNING = "warning"
@@ -52,6 +76,9 @@ SUFFIX_DRAWING = ".CATDrawing"
 
 ISO_VIEW = "* iso"
 
+# Amount of recently used themes, which are built in idle time on startup
+RECENT_THEMES = 2
+
 STYLES = [
     "cosmo",
     "litera",
@@ -21,8 +21,11 @@ from const import LOGON
 from const import LOGS
 from decorators import timer
 from handler.properties import Properties
+from helper.appearance import prewarm_themes
+from helper.drawings import drawing_index
 from helper.lazy_loaders import LazyDocumentHelper
 from helper.messages import show_help
+from material_manager.catalog import material_catalog
 from pytia.exceptions import PytiaBodyEmptyError
 from pytia.exceptions import PytiaDifferentDocumentError
 from pytia.exceptions import PytiaDocumentNotSavedError
@@ -110,8 +113,8 @@ class GUI(tk.Tk):
         self.geometry(f"{GUI.WIDTH}x{GUI.HEIGHT}+{x_coordinate}+{y_coordinate}")
         self.minsize(width=GUI.WIDTH, height=GUI.HEIGHT)
 
-        self.update()
-        self.window_manager.remove_window_buttons()
+        # The window buttons can only be removed after the window has been mapped.
+        self.after_idle(self.window_manager.remove_window_buttons)
 
     def run(self) -> None:
         """Run the app."""
@@ -151,15 +154,24 @@ class GUI(tk.Tk):
             self.bindings()
             self.main_controller()
 
+        # The recently used themes are built after the first paint, when the app is idle.
+        prewarm_themes(self)
+
     def main_controller(self) -> None:
         """
         The main controller.
+        - Starts loading the drawing index of the workspace in the background.
         - Retrieves the properties from the document (part or product).
+        - Starts loading the material catalog in the background.
         - Loads all tooltips (some of them depend on some properties).
         - Sets the UI state based on the restrictions of the settings.json and the workspace file.
         """
         self.set_ui.loading()
+        if self.workspace.workspace_folder:
+            # Before the retrieval, the trace of the linked doc looks up the index.
+            drawing_index.prefetch(self.workspace.workspace_folder)
         self.properties.retrieve()
+        material_catalog.prefetch()
         self.tooltips()
 
         if not self.workspace.elements.active:
@@ -3,7 +3,9 @@
     Handles the documents properties: Loading, writing, and verifying.
 """
 
+from dataclasses import asdict
 from pathlib import Path
+from typing import Dict
 
 from app.layout import Layout
 from app.vars import Variables
@@ -117,6 +119,41 @@ class Properties:
         )
         log.info("Checked out custom properties.")
 
+    def snapshot(self) -> Dict[str, str]:
+        """
+        Returns the complete property set as shown in the UI, e.g. for the property snapshot of
+        a revision. Empty properties are omitted, as they are on the document (see `checkout`).
+
+        Returns:
+            Dict[str, str]: The values by the name of the property.
+        """
+        properties = {
+            "Definition": self.vars.definition.get(),
+            "Revision": self.vars.revision.get(),
+            "Nomenclature": translate_nomenclature(self.vars.source.get()),
+            "Source": self.vars.source.get(),
+            "Description": self.vars.description.get(),
+            PROP_DRAWING_PATH: self.vars.linked_doc.get(),
+        }
+        for key, name in asdict(resource.props.infra).items():
+            # The product number is the only variable that isn't named like its property key.
+            variable = "product_number" if key == "product" else key
+            properties[name] = getattr(self.vars, variable).get()
+        for key, name in asdict(resource.props.notes).items():
+            properties[name] = self.layout.notes.get(key).note_var.get()
+        for i in range(
+            resource.settings.processes.first,
+            resource.settings.processes.max + resource.settings.processes.first,
+        ):
+            pid = str(i)
+            properties[
+                resource.props.production.process_n.replace("$", pid)
+            ] = self.layout.processes.get_process(pid=i)
+            properties[
+                resource.props.production.note_process_n.replace("$", pid)
+            ] = self.layout.processes.get_note(pid=i)
+        return {name: value for name, value in properties.items() if value}
+
     def verify(self) -> bool:
         """Verifies all properties that need verification. Returns True if everything is ok."""
         critical = []
@@ -238,101 +275,106 @@ class Properties:
     def retrieve(self) -> None:
         """Loads the properties from the document into the UI via the main apps variables."""
         log.info("Retrieving properties from the document...")
-        self.doc_helper.setvar_combo_property(
-            variable=self.vars.project,
-            property_name=resource.props.infra.project,
-            widget=self.layout.input_project,
-            default=(
-                self.workspace.elements.projects[0]
-                if self.workspace.elements.projects
-                else None
-            ),
-            items=self.workspace.elements.projects,
-        )
+        # All traces are muted while the form is populated, each trace runs once at the end.
+        with self.vars.bulk_update(), self.layout.processes.bulk_update():
+            self.doc_helper.setvar_combo_property(
+                variable=self.vars.project,
+                property_name=resource.props.infra.project,
+                widget=self.layout.input_project,
+                default=(
+                    self.workspace.elements.projects[0]
+                    if self.workspace.elements.projects
+                    else None
+                ),
+                items=self.workspace.elements.projects,
+            )
 
-        if (
-            resource.settings.restrictions.strict_product
-            and self.workspace.elements.product
-        ):
-            self.doc_helper.setvar(
-                variable=self.vars.product_number,
-                value=self.workspace.elements.product,
+            if (
+                resource.settings.restrictions.strict_product
+                and self.workspace.elements.product
+            ):
+                self.doc_helper.setvar(
+                    variable=self.vars.product_number,
+                    value=self.workspace.elements.product,
+                )
+            else:
+                self.doc_helper.setvar_property(
+                    self.vars.product_number,
+                    resource.props.infra.product,
+                    default=self.workspace.elements.product,
+                )
+
+            self.doc_helper.setvar_material(self.vars.material, self.vars.material_meta)
+            self.doc_helper.setvar_property(
+                self.vars.base_size, resource.props.infra.base_size
             )
-        else:
             self.doc_helper.setvar_property(
-                self.vars.product_number,
-                resource.props.infra.product,
-                default=self.workspace.elements.product,
+                self.vars.base_size_preset, resource.props.infra.base_size_preset
             )
+            self.doc_helper.setvar_mass(self.vars.mass)
 
-        self.doc_helper.setvar_material(self.vars.material, self.vars.material_meta)
-        self.doc_helper.setvar_property(
-            self.vars.base_size, resource.props.infra.base_size
-        )
-        self.doc_helper.setvar_property(
-            self.vars.base_size_preset, resource.props.infra.base_size_preset
-        )
-        self.doc_helper.setvar_mass(self.vars.mass)
-
-        self.doc_helper.setvar_property(
-            self.vars.order_number, resource.props.infra.order_number
-        )
-        self.doc_helper.setvar_property(
-            self.vars.manufacturer, resource.props.infra.manufacturer
-        )
-        self.doc_helper.setvar_property(
-            self.vars.supplier, resource.props.infra.supplier
-        )
-        self.doc_helper.setvar_property(self.vars.weblink, resource.props.infra.weblink)
-        self.doc_helper.setvar_combo_property(
-            variable=self.vars.group,
-            property_name=resource.props.infra.group,
-            widget=self.layout.input_group,
-            items=self.workspace.elements.groups,
-        )
-        self.doc_helper.setvar_combo_property(
-            variable=self.vars.tolerance,
-            property_name=resource.props.infra.tolerance,
-            widget=self.layout.input_tolerance,
-        )
-        self.doc_helper.setvar_property(
-            self.vars.spare_part_level, resource.props.infra.spare_part_level
-        )
-        self.doc_helper.setvar_user(self.vars.creator, resource.props.infra.creator)
-        self.doc_helper.setvar_user(self.vars.modifier, resource.props.infra.modifier)
+            self.doc_helper.setvar_property(
+                self.vars.order_number, resource.props.infra.order_number
+            )
+            self.doc_helper.setvar_property(
+                self.vars.manufacturer, resource.props.infra.manufacturer
+            )
+            self.doc_helper.setvar_property(
+                self.vars.supplier, resource.props.infra.supplier
+            )
+            self.doc_helper.setvar_property(
+                self.vars.weblink, resource.props.infra.weblink
+            )
+            self.doc_helper.setvar_combo_property(
+                variable=self.vars.group,
+                property_name=resource.props.infra.group,
+                widget=self.layout.input_group,
+                items=self.workspace.elements.groups,
+            )
+            self.doc_helper.setvar_combo_property(
+                variable=self.vars.tolerance,
+                property_name=resource.props.infra.tolerance,
+                widget=self.layout.input_tolerance,
+            )
+            self.doc_helper.setvar_property(
+                self.vars.spare_part_level, resource.props.infra.spare_part_level
+            )
+            self.doc_helper.setvar_user(self.vars.creator, resource.props.infra.creator)
+            self.doc_helper.setvar_user(
+                self.vars.modifier, resource.props.infra.modifier
+            )
 
-        self.doc_helper.setvar_property(self.vars.linked_doc, PROP_DRAWING_PATH)
+            self.doc_helper.setvar_property(self.vars.linked_doc, PROP_DRAWING_PATH)
 
-        self.doc_helper.setvar_notes(self.layout.notes)
+            self.doc_helper.setvar_notes(self.layout.notes)
 
-        self.doc_helper.setvar_process(self.layout.processes)
-        self.doc_helper.setvar_process_notes(self.layout.processes)
+            self.doc_helper.setvar_process(self.layout.processes)
 
-        # Default properties
-        # We retrieve the default catia properties after the user properties, because the source
-        # property has a trace, which set the state of the UI.
-        self.doc_helper.setvar(self.vars.partnumber, self.doc_helper.partnumber)
-        self.doc_helper.setvar(
-            self.vars.revision,
-            self.doc_helper.revision,
-            default=resource.settings.revision,
-        )
-        self.doc_helper.setvar(
-            self.vars.source, translate_source(self.doc_helper.source)
-        )
-        self.doc_helper.setvar(self.vars.description, self.doc_helper.description)
-
-        # Lastly the definition is set. This is depends on the settings.
-        if resource.settings.auto_definition:
-            _definition = calculate_definition(
-                product_number=self.vars.product_number,
-                partnumber=self.vars.partnumber,
-                revision=self.vars.revision,
-                prefix=self.workspace.elements.definition_prefix
-                or resource.settings.auto_definition.prefix,
+            # Default properties
+            # We retrieve the default catia properties after the user properties, because the
+            # source property has a trace, which set the state of the UI.
+            self.doc_helper.setvar(self.vars.partnumber, self.doc_helper.partnumber)
+            self.doc_helper.setvar(
+                self.vars.revision,
+                self.doc_helper.revision,
+                default=resource.settings.revision,
             )
-        else:
-            _definition = self.doc_helper.definition
-        self.doc_helper.setvar(self.vars.definition, _definition)
+            self.doc_helper.setvar(
+                self.vars.source, translate_source(self.doc_helper.source)
+            )
+            self.doc_helper.setvar(self.vars.description, self.doc_helper.description)
+
+            # Lastly the definition is set. This is depends on the settings.
+            if resource.settings.auto_definition:
+                _definition = calculate_definition(
+                    product_number=self.vars.product_number,
+                    partnumber=self.vars.partnumber,
+                    revision=self.vars.revision,
+                    prefix=self.workspace.elements.definition_prefix
+                    or resource.settings.auto_definition.prefix,
+                )
+            else:
+                _definition = self.doc_helper.definition
+            self.doc_helper.setvar(self.vars.definition, _definition)
 
         log.info("Retrieved all properties.")
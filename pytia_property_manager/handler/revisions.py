@@ -0,0 +1,607 @@
+"""
+    Handler for the revisions of a document. Old revisions are stored read-only in the hidden
+    revision folder next to the document, either as full copy or deduplicated in the revision
+    store (see the `revision_store` setting):
+
+    - `.rev/{revision}.{name}`: The revision file. In the store mode it's a hardlink to the blob.
+    - `.rev/store/{sha256}`: A blob, stored once per content.
+    - `.rev/store/{sha256}.z`: A zlib compressed blob, if the file system doesn't allow hardlinks.
+    - `.rev/store.json`: The manifest, maps the revision file names to their blobs.
+    - `.rev/store.lock`: The lock file, exists while the manifest is changed.
+    - `.rev/{revision}.{name}.props.json`: The property snapshot of the revision.
+    - `.rev/history.jsonl`: The history, one line per revision. Lines are only ever appended.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from dataclasses import asdict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from stat import S_IREAD
+from stat import S_IRGRP
+from stat import S_IROTH
+from stat import S_IWUSR
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from const import LOGON
+from const import REVISION_CHUNK_SIZE
+from const import REVISION_HISTORY
+from const import REVISION_LOCK_POLL
+from const import REVISION_LOCK_TIMEOUT
+from const import REVISION_PROPERTIES
+from const import REVISION_STORE
+from const import REVISION_STORE_LOCK
+from const import REVISION_STORE_MANIFEST
+from pytia.log import log
+from resources.utils import write_file_atomic
+
+SUFFIX_COMPRESSED = ".z"
+
+_manifest_lock = threading.Lock()
+
+
+@dataclass(slots=True, kw_only=True)
+class StoreEntry:
+    """Dataclass for a revision in the manifest of the revision store."""
+
+    sha256: str
+    size: int
+    blob: str
+
+    @property
+    def compressed(self) -> bool:
+        """Returns True if the blob is zlib compressed."""
+        return self.blob.endswith(SUFFIX_COMPRESSED)
+
+
+@dataclass(slots=True, kw_only=True)
+class HistoryEntry:
+    """Dataclass for a revision in the history of the revision folder."""
+
+    name: str
+    revision: str
+    file: str
+    timestamp: str
+    user: str
+    sha256: str
+    size: int
+    description: str
+
+
+def hash_file(path: Path) -> str:
+    """
+    Returns the sha256 hash of the file. The file is read in chunks.
+
+    Args:
+        path (Path): The path of the file.
+
+    Returns:
+        str: The hex digest of the hash.
+    """
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(REVISION_CHUNK_SIZE):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def read_store_manifest(revision_folder: Path) -> Dict[str, StoreEntry]:
+    """
+    Reads the manifest of the revision store.
+
+    Args:
+        revision_folder (Path): The revision folder.
+
+    Returns:
+        Dict[str, StoreEntry]: The entries of the manifest by the revision file name. Empty if
+            there's no manifest.
+    """
+    manifest = Path(revision_folder, REVISION_STORE_MANIFEST)
+    if not manifest.exists():
+        return {}
+    with open(manifest, "r", encoding="utf8") as f:
+        return {name: StoreEntry(**entry) for name, entry in json.load(f).items()}
+
+
+def write_store_manifest(revision_folder: Path, entries: Dict[str, StoreEntry]) -> None:
+    """
+    Writes the manifest of the revision store. The file is replaced atomically.
+
+    Args:
+        revision_folder (Path): The revision folder.
+        entries (Dict[str, StoreEntry]): The entries of the manifest.
+    """
+    write_file_atomic(
+        Path(revision_folder, REVISION_STORE_MANIFEST),
+        json.dumps({name: asdict(entry) for name, entry in entries.items()}, indent=4),
+    )
+
+
+@contextmanager
+def lock_store_manifest(revision_folder: Path) -> Iterator[None]:
+    """
+    Serializes changes to the manifest of the revision store. Threads of this app are
+    serialized by a lock, other instances of the app by a lock file in the revision folder.
+    A lock file older than `REVISION_LOCK_TIMEOUT` has been left by a killed app and is
+    replaced.
+
+    Args:
+        revision_folder (Path): The revision folder.
+
+    Raises:
+        TimeoutError: Raised if the lock file isn't released in time.
+    """
+    lock_file = Path(revision_folder, REVISION_STORE_LOCK)
+    with _manifest_lock:
+        deadline = time.monotonic() + REVISION_LOCK_TIMEOUT
+        while True:
+            try:
+                os.close(os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                pass
+            try:
+                if time.time() - os.path.getmtime(lock_file) > REVISION_LOCK_TIMEOUT:
+                    log.warning(f"Removing the stale lock file {str(lock_file)!r}.")
+                    os.remove(lock_file)
+                    continue
+            except OSError:
+                continue  # Released in the meantime
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"The manifest {str(lock_file)!r} is locked.")
+            time.sleep(REVISION_LOCK_POLL)
+
+        try:
+            yield
+        finally:
+            try:
+                os.remove(lock_file)
+            except OSError as e:
+                log.warning(f"Failed to remove the lock file {str(lock_file)!r}: {e}")
+
+
+def append_history(revision_folder: Path, entry: HistoryEntry) -> None:
+    """
+    Appends an entry to the history of the revision folder. Existing lines are never rewritten.
+
+    Args:
+        revision_folder (Path): The revision folder.
+        entry (HistoryEntry): The entry to append.
+    """
+    with open(Path(revision_folder, REVISION_HISTORY), "a", encoding="utf8") as f:
+        f.write(json.dumps(asdict(entry)) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def read_history(
+    revision_folder: Path, name: Optional[str] = None
+) -> List[HistoryEntry]:
+    """
+    Reads the history of the revision folder. Lines that can't be read are skipped.
+
+    Args:
+        revision_folder (Path): The revision folder.
+        name (Optional[str], optional): Only returns the entries of the document with this \
+            name. Defaults to None.
+
+    Returns:
+        List[HistoryEntry]: The entries of the history, oldest first. Empty if there's no \
+            history.
+    """
+    history = Path(revision_folder, REVISION_HISTORY)
+    if not history.exists():
+        return []
+
+    entries: List[HistoryEntry] = []
+    with open(history, "r", encoding="utf8") as f:
+        for number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                entry = HistoryEntry(**json.loads(line))
+            except (ValueError, TypeError) as e:
+                log.warning(f"Skipped line {number} of the revision history: {e}")
+                continue
+            if name is None or entry.name == name:
+                entries.append(entry)
+    return entries
+
+
+def get_properties_path(revision_file: Path) -> Path:
+    """Returns the path of the property snapshot of the revision file."""
+    return revision_file.with_name(revision_file.name + REVISION_PROPERTIES)
+
+
+def write_revision_properties(revision_file: Path, properties: Dict[str, str]) -> None:
+    """
+    Writes the property snapshot of a revision. The file is replaced atomically.
+
+    Args:
+        revision_file (Path): The path of the revision file, e.g. `.rev/1.Part.CATPart`.
+        properties (Dict[str, str]): The properties of the document by their name.
+    """
+    write_file_atomic(
+        get_properties_path(revision_file),
+        json.dumps(properties, sort_keys=True, separators=(",", ":")),
+    )
+
+
+def read_revision_properties(revision_file: Path) -> Optional[Dict[str, str]]:
+    """
+    Reads the property snapshot of a revision.
+
+    Args:
+        revision_file (Path): The path of the revision file, e.g. `.rev/1.Part.CATPart`.
+
+    Returns:
+        Optional[Dict[str, str]]: The properties of the document by their name. None if the \
+            revision has no snapshot, e.g. if it was created with an older version of the app.
+    """
+    path = get_properties_path(revision_file)
+    if not path.exists():
+        return None
+    with open(path, "r", encoding="utf8") as f:
+        return json.load(f)
+
+
+def diff_properties(
+    old: Dict[str, str], new: Dict[str, str]
+) -> List[Tuple[str, str, str]]:
+    """
+    Compares two property snapshots.
+
+    Args:
+        old (Dict[str, str]): The properties of the older revision.
+        new (Dict[str, str]): The properties of the newer revision.
+
+    Returns:
+        List[Tuple[str, str, str]]: The name, the old and the new value of all properties that \
+            differ, sorted by name. A missing property has an empty value.
+    """
+    return [
+        (name, old.get(name, ""), new.get(name, ""))
+        for name in sorted(old.keys() | new.keys())
+        if old.get(name, "") != new.get(name, "")
+    ]
+
+
+def restore_revision(revision_file: Path, target: Path) -> None:
+    """
+    Restores a revision to the target path. The revision file is used if it exists, otherwise
+    the content is restored from the revision store. The restored content is verified against
+    the hash of the manifest, if the revision is in the store. A revision file that isn't a
+    hardlink into the store is a full copy and isn't verified.
+
+    Args:
+        revision_file (Path): The path of the revision file, e.g. `.rev/1.Part.CATPart`.
+        target (Path): The path of the restored file.
+
+    Raises:
+        FileNotFoundError: Raised if the revision is neither a file nor in the store.
+        OSError: Raised if the restored content doesn't match the hash of the manifest.
+    """
+    entry = read_store_manifest(revision_file.parent).get(revision_file.name)
+    sha256 = hashlib.sha256()
+
+    if revision_file.is_file():
+        source = revision_file
+        if entry is not None:
+            blob = Path(revision_file.parent, REVISION_STORE, entry.sha256)
+            if not (blob.exists() and os.path.samefile(source, blob)):
+                # A full copy, the entry belongs to an earlier revision with the same name.
+                entry = None
+    elif entry is not None:
+        source = Path(revision_file.parent, REVISION_STORE, entry.blob)
+    else:
+        raise FileNotFoundError(f"The revision {str(revision_file)!r} doesn't exist.")
+
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        if entry is not None and entry.compressed and source != revision_file:
+            decompressor = zlib.decompressobj()
+            while chunk := src.read(REVISION_CHUNK_SIZE):
+                data = decompressor.decompress(chunk)
+                sha256.update(data)
+                dst.write(data)
+            data = decompressor.flush()
+            sha256.update(data)
+            dst.write(data)
+        else:
+            while chunk := src.read(REVISION_CHUNK_SIZE):
+                sha256.update(chunk)
+                dst.write(chunk)
+
+    if entry is not None and sha256.hexdigest() != entry.sha256:
+        os.remove(target)
+        raise OSError(
+            f"The restored revision {revision_file.name!r} doesn't match its hash "
+            f"(sha256 {sha256.hexdigest()} != {entry.sha256})."
+        )
+    log.info(f"Restored revision {str(revision_file)!r} to {str(target)!r}.")
+
+
+def _make_writable(path: Path) -> None:
+    """Removes the read-only flag of a file, if the file exists."""
+    if os.path.exists(path):
+        os.chmod(path, S_IWUSR | S_IREAD)
+
+
+def _make_readonly(path: Path) -> None:
+    """Sets the read-only flag of a file."""
+    os.chmod(path, S_IREAD | S_IRGRP | S_IROTH)
+
+
+class RevisionSnapshot:
+    """
+    Copies a document into the revision folder on a background thread. The copy is done in
+    chunks, which allows to show the progress, and is verified with a streaming hash before
+    it's made read-only. In the store mode the content is stored only once per hash.
+    """
+
+    def __init__(
+        self,
+        source: Path,
+        target: Path,
+        revision: str,
+        description: str,
+        properties: Optional[Dict[str, str]] = None,
+        store: bool = False,
+    ) -> None:
+        """
+        Inits the RevisionSnapshot class.
+
+        Args:
+            source (Path): The path of the document.
+            target (Path): The path of the revision file.
+            revision (str): The revision of the document, written to the history.
+            description (str): The description of the changes, written to the history.
+            properties (Optional[Dict[str, str]], optional): The properties of the document,
+                written to the property snapshot of the revision. Defaults to None.
+            store (bool, optional): Stores the revision in the deduplicated revision store.
+                Defaults to False.
+        """
+        self.source = source
+        self.target = target
+        self.revision = revision
+        self.description = description
+        self.properties = properties
+        self.store = store
+        self.total = 0
+        self.copied = 0
+        self.sha256: Optional[str] = None
+        self.error: Optional[Exception] = None
+        self._done = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        """Returns True if the copy has finished, successfully or not."""
+        return self._done.is_set()
+
+    @property
+    def progress(self) -> float:
+        """Returns the progress of the copy in percent."""
+        return 100 * self.copied / self.total if self.total else 0
+
+    def start(self) -> None:
+        """Starts the copy on a background thread."""
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _run(self) -> None:
+        """
+        Copies and verifies the document, writes the property snapshot and appends the
+        revision to the history. A failed copy is removed.
+        """
+        try:
+            self.total = os.path.getsize(self.source)
+            self._remove_revision_file(self.target)
+
+            if self.store:
+                self._store()
+            else:
+                self._remove_store_entry()
+                self.sha256 = self._copy(self.target)
+                _make_readonly(self.target)
+            log.info(f"Copied {str(self.source)!r} to {str(self.target)!r}.")
+        except Exception as e:  # pylint: disable=W0718
+            log.error(f"Failed to copy the revision: {e}")
+            self.error = e
+            try:
+                self._remove_revision_file(self.target)
+            except OSError as err:
+                log.warning(f"Failed to remove {str(self.target)!r}: {err}")
+            self._remove(get_properties_path(self.target))
+        else:
+            self._write_properties()
+            self._append_history()
+        finally:
+            self._done.set()
+
+    def _remove_store_entry(self) -> None:
+        """
+        Removes the manifest entry of the revision file. An entry is left if a revision with
+        the same name has been stored in the revision store before.
+        """
+        if not Path(self.target.parent, REVISION_STORE_MANIFEST).exists():
+            return
+        with lock_store_manifest(self.target.parent):
+            entries = read_store_manifest(self.target.parent)
+            if entries.pop(self.target.name, None) is not None:
+                write_store_manifest(self.target.parent, entries)
+
+    def _write_properties(self) -> None:
+        """
+        Writes the property snapshot of the revision. A failed write is only logged, the
+        revision itself is safe at this point.
+        """
+        if self.properties is None:
+            return
+        try:
+            write_revision_properties(self.target, self.properties)
+        except OSError as e:
+            log.error(f"Failed to write the property snapshot of the revision: {e}")
+
+    def _append_history(self) -> None:
+        """
+        Appends the verified revision to the history of the revision folder. A failed write
+        is only logged, the revision itself is safe at this point.
+        """
+        try:
+            append_history(
+                self.target.parent,
+                HistoryEntry(
+                    name=self.source.name,
+                    revision=self.revision,
+                    file=self.target.name,
+                    timestamp=datetime.now().isoformat(timespec="seconds"),
+                    user=LOGON,
+                    sha256=str(self.sha256),
+                    size=self.total,
+                    description=self.description,
+                ),
+            )
+        except OSError as e:
+            log.error(f"Failed to write the revision history: {e}")
+
+    def _copy(self, target: Path) -> str:
+        """
+        Copies the document to the target in chunks and verifies the copy.
+
+        Args:
+            target (Path): The path of the copy.
+
+        Raises:
+            OSError: Raised if the copy doesn't match the document.
+
+        Returns:
+            str: The sha256 hash of the document.
+        """
+        sha256 = hashlib.sha256()
+        with open(self.source, "rb") as src, open(target, "wb") as dst:
+            while chunk := src.read(REVISION_CHUNK_SIZE):
+                sha256.update(chunk)
+                dst.write(chunk)
+                self.copied += len(chunk)
+            dst.flush()
+            os.fsync(dst.fileno())
+
+        if (target_hash := hash_file(target)) != sha256.hexdigest():
+            raise OSError(
+                f"The copy {str(target)!r} doesn't match the document "
+                f"(sha256 {target_hash} != {sha256.hexdigest()})."
+            )
+        return sha256.hexdigest()
+
+    def _store(self) -> None:
+        """
+        Stores the document in the revision store. The document is copied into the store, if
+        its content isn't stored yet. The revision file is a hardlink to the blob. If the file
+        system doesn't allow hardlinks, the blob is compressed instead and all revisions of the
+        content refer to the compressed blob. A blob stored by an earlier revision is kept.
+        """
+        store_folder = Path(self.target.parent, REVISION_STORE)
+        os.makedirs(store_folder, exist_ok=True)
+
+        created = False
+        temp_blob = Path(store_folder, f".{self.target.name}.tmp")
+        try:
+            self.sha256 = self._copy(temp_blob)
+            blob = Path(store_folder, self.sha256)
+            compressed_blob = Path(store_folder, self.sha256 + SUFFIX_COMPRESSED)
+            if blob.exists() or compressed_blob.exists():
+                log.info(f"Content of {self.target.name!r} is already in the store.")
+            else:
+                os.replace(temp_blob, blob)
+                _make_readonly(blob)
+                created = True
+        finally:
+            self._remove(temp_blob)
+
+        stored_blob = compressed_blob
+        if blob.exists():
+            try:
+                os.link(blob, self.target)
+                stored_blob = blob
+            except OSError as e:
+                log.info(f"Cannot create a hardlink, compressing the revision: {e}")
+                if not compressed_blob.exists():
+                    self._compress(blob, compressed_blob)
+
+        with lock_store_manifest(self.target.parent):
+            entries = read_store_manifest(self.target.parent)
+            entries[self.target.name] = StoreEntry(
+                sha256=self.sha256, size=self.total, blob=stored_blob.name
+            )
+            if stored_blob == compressed_blob:
+                for entry in entries.values():
+                    if entry.sha256 == self.sha256:
+                        entry.blob = compressed_blob.name
+            write_store_manifest(self.target.parent, entries)
+
+        if stored_blob == compressed_blob and created:
+            self._remove(blob)
+
+    def _compress(self, blob: Path, compressed_blob: Path) -> None:
+        """
+        Compresses the blob with zlib and verifies the compressed blob.
+
+        Args:
+            blob (Path): The path of the blob.
+            compressed_blob (Path): The path of the compressed blob.
+
+        Raises:
+            OSError: Raised if the compressed blob doesn't match the blob.
+        """
+        compressor = zlib.compressobj()
+        with open(blob, "rb") as src, open(compressed_blob, "wb") as dst:
+            while chunk := src.read(REVISION_CHUNK_SIZE):
+                dst.write(compressor.compress(chunk))
+            dst.write(compressor.flush())
+            dst.flush()
+            os.fsync(dst.fileno())
+
+        sha256 = hashlib.sha256()
+        decompressor = zlib.decompressobj()
+        with open(compressed_blob, "rb") as f:
+            while chunk := f.read(REVISION_CHUNK_SIZE):
+                sha256.update(decompressor.decompress(chunk))
+            sha256.update(decompressor.flush())
+        if sha256.hexdigest() != self.sha256:
+            self._remove(compressed_blob)
+            raise OSError(f"The compressed blob {compressed_blob.name!r} is corrupt.")
+        _make_readonly(compressed_blob)
+
+    @staticmethod
+    def _remove_revision_file(path: Path) -> None:
+        """
+        Removes a revision file, if it exists. A hardlink shares its read-only flag with the
+        blob in the store, therefore the flag of the blob is restored after the removal.
+        """
+        if not os.path.exists(path):
+            return
+        blob = None
+        if os.stat(path).st_nlink > 1:
+            blob = Path(path.parent, REVISION_STORE, hash_file(path))
+        _make_writable(path)
+        os.remove(path)
+        if blob is not None and blob.exists():
+            _make_readonly(blob)
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        """Removes a (read-only) file, if it exists."""
+        try:
+            _make_writable(path)
+            if os.path.exists(path):
+                os.remove(path)
+        except OSError as e:
+            log.warning(f"Failed to remove {str(path)!r}: {e}")
@@ -2,12 +2,20 @@
     Helper functions for messages.
 """
 
+import tkinter as tk
+from typing import List
+from typing import Set
+
+from const import RECENT_THEMES
 from const import STYLES
 from pytia.log import log
 from resources import resource
 from ttkbootstrap import Menu
 from ttkbootstrap import Style
 
+# Themes, which have been built by ttkbootstrap in this session.
+_built_themes: Set[str] = set()
+
 
 def set_appearance_menu(appearance_menu: Menu) -> None:
     """Binds all callbacks to the appearance menubar."""
@@ -22,6 +30,62 @@ def change_theme(index: int) -> None:
         index (int): The index of the theme from the STYLES list.
     """
     theme_name = STYLES[index]
-    Style(theme=theme_name)
+    previous_theme = resource.appdata.theme
+    Style.get_instance().theme_use(theme_name)
+    _built_themes.add(theme_name)
+
     resource.appdata.theme = theme_name
+    resource.appdata.recent_themes = _get_recent_themes(previous_theme)
+    resource.save_appdata()
     log.info(f"Changed theme to {theme_name} ({index}).")
+
+
+def prewarm_themes(root: tk.Misc) -> None:
+    """
+    Builds the recently used themes in idle time, one theme per idle cycle. ttkbootstrap
+    generates all element images of a theme when it's used for the first time, which stalls
+    the UI if this happens on the first switch to the theme.
+
+    Args:
+        root (tk.Misc): The main window.
+    """
+    _built_themes.add(resource.appdata.theme)
+    pending = [
+        theme
+        for theme in resource.appdata.recent_themes
+        if theme in STYLES and theme not in _built_themes
+    ]
+    if pending:
+        root.after_idle(lambda: _prewarm_theme(root, pending))
+
+
+def _prewarm_theme(root: tk.Misc, pending: List[str]) -> None:
+    """
+    Builds the first theme of the pending themes and switches back to the current theme. The
+    UI isn't redrawn in between, because both switches happen within one idle callback.
+    """
+    theme_name = pending.pop(0)
+    if theme_name not in _built_themes:
+        style = Style.get_instance()
+        current_theme = style.theme.name
+        style.theme_use(theme_name)
+        style.theme_use(current_theme)
+        _built_themes.add(theme_name)
+        log.debug(f"Pre-built theme {theme_name}.")
+    if pending:
+        root.after_idle(lambda: _prewarm_theme(root, pending))
+
+
+def _get_recent_themes(previous_theme: str) -> List[str]:
+    """
+    Returns the recently used themes, without the current theme, most recent first.
+
+    Args:
+        previous_theme (str): The theme that has been used before the current theme.
+    """
+    recent = [previous_theme, *resource.appdata.recent_themes]
+    themes: List[str] = []
+    for theme in recent:
+        if theme != resource.appdata.theme and theme not in themes:
+            themes.append(theme)
+    return themes[:RECENT_THEMES]
@@ -0,0 +1,52 @@
+"""
+    Helper for bulk updates of tkinter variables.
+"""
+
+from contextlib import contextmanager
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Iterator
+
+
+class BulkUpdate:
+    """
+    Mutes trace callbacks during bulk updates. Muted callbacks are collected by their key and
+    each of them runs once when the bulk update ends, with the final values of the variables.
+    """
+
+    def __init__(self) -> None:
+        self._depth = 0
+        self._pending: Dict[Hashable, Callable[[], None]] = {}
+
+    @property
+    def active(self) -> bool:
+        """Returns True if a bulk update is running."""
+        return self._depth > 0
+
+    def call(self, key: Hashable, callback: Callable[[], None]) -> None:
+        """
+        Runs the callback, or defers it if a bulk update is running. A deferred callback
+        replaces any previously deferred callback with the same key, but keeps its position.
+
+        Args:
+            key (Hashable): The key of the callback, e.g. the trace callback itself.
+            callback (Callable[[], None]): The callback to run.
+        """
+        if self._depth:
+            self._pending[key] = callback
+        else:
+            callback()
+
+    @contextmanager
+    def __call__(self) -> Iterator[None]:
+        """Context manager for a bulk update. Nested bulk updates are merged into one."""
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            if not self._depth:
+                pending, self._pending = self._pending, {}
+                for callback in pending.values():
+                    callback()
@@ -0,0 +1,299 @@
+"""
+    Drawing index submodule for the app.
+
+    Maps the stem of every drawing file under the workspace folder to the paths of the
+    drawings, e.g. `Part1` -> [`.../drawings/Part1.CATDrawing`]. Scanning a large workspace
+    on a network share is expensive, therefore the scanned folders are cached on the local
+    disk. A folder is only listed again if its modification time has changed, unchanged
+    folders cost one stat call.
+
+    The `drawing_index` instance is shared within the app. It loads and updates the index in
+    the background, lookups are dictionary lookups once the index is loaded.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import tkinter as tk
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from const import APPDATA
+from const import CACHE_DRAWINGS
+from const import DRAWING_INDEX_POLL
+from const import SUFFIX_DRAWING
+from pytia.log import log
+from resources.utils import write_file_atomic
+
+# The modification time, the sub folders and the drawing files of a folder.
+FolderEntry = Tuple[int, List[str], List[str]]
+StemIndex = Dict[str, List[str]]
+
+
+def _get_cache_file(workspace_folder: Path) -> str:
+    """Returns the path of the index cache of the workspace folder."""
+    digest = hashlib.sha1(str(workspace_folder).lower().encode("utf8")).hexdigest()
+    return f"{APPDATA}\\{CACHE_DRAWINGS.format(digest[:16])}"
+
+
+def _read_disk_cache(workspace_folder: Path) -> Dict[str, FolderEntry]:
+    """
+    Reads the scanned folders of the workspace folder from the appdata folder.
+
+    Args:
+        workspace_folder (Path): The workspace folder.
+
+    Returns:
+        Dict[str, FolderEntry]: The scanned folders by their path. Empty if there's no valid
+            cache for the workspace folder.
+    """
+    cache_file = _get_cache_file(workspace_folder)
+    if not os.path.exists(cache_file):
+        return {}
+
+    try:
+        with open(cache_file, "r", encoding="utf8") as f:
+            cache = json.load(f)
+        if cache["root"] == str(workspace_folder):
+            return {
+                folder: (int(mtime), list(folders), list(files))
+                for folder, (mtime, folders, files) in cache["folders"].items()
+            }
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        log.warning(f"Ignoring the drawing index cache, failed to read it: {e}")
+    return {}
+
+
+def _write_disk_cache(workspace_folder: Path, folders: Dict[str, FolderEntry]) -> None:
+    """
+    Writes the scanned folders of the workspace folder to the appdata folder.
+
+    Args:
+        workspace_folder (Path): The workspace folder.
+        folders (Dict[str, FolderEntry]): The scanned folders by their path.
+    """
+    try:
+        os.makedirs(APPDATA, exist_ok=True)
+        write_file_atomic(
+            _get_cache_file(workspace_folder),
+            json.dumps({"root": str(workspace_folder), "folders": folders}),
+        )
+    except OSError as e:
+        log.warning(f"Failed to write the drawing index cache: {e}")
+
+
+def _scan_folder(folder: str) -> Tuple[List[str], List[str]]:
+    """
+    Lists the sub folders and the drawing files of a folder. Hidden folders, like the
+    revision folder, are skipped.
+
+    Args:
+        folder (str): The path of the folder.
+
+    Returns:
+        Tuple[List[str], List[str]]: The names of the sub folders and of the drawing files.
+    """
+    folders: List[str] = []
+    files: List[str] = []
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not entry.name.startswith("."):
+                    folders.append(entry.name)
+            elif entry.name.lower().endswith(SUFFIX_DRAWING.lower()):
+                files.append(entry.name)
+    return folders, files
+
+
+def update_folders(
+    workspace_folder: Path, cached: Dict[str, FolderEntry]
+) -> Dict[str, FolderEntry]:
+    """
+    Updates the scanned folders of the workspace folder. Only folders whose modification
+    time differs from the cached one are listed again. Folders that can't be accessed are
+    skipped.
+
+    Args:
+        workspace_folder (Path): The workspace folder.
+        cached (Dict[str, FolderEntry]): The previously scanned folders by their path.
+
+    Returns:
+        Dict[str, FolderEntry]: The scanned folders by their path.
+    """
+    folders: Dict[str, FolderEntry] = {}
+    rescanned = 0
+    pending = [str(workspace_folder)]
+    while pending:
+        folder = pending.pop()
+        try:
+            mtime = os.stat(folder).st_mtime_ns
+            if (entry := cached.get(folder)) is not None and entry[0] == mtime:
+                sub_folders, files = entry[1], entry[2]
+            else:
+                sub_folders, files = _scan_folder(folder)
+                rescanned += 1
+        except OSError as e:
+            log.warning(f"Skipped folder {folder!r} of the drawing index: {e}")
+            continue
+        folders[folder] = (mtime, sub_folders, files)
+        pending.extend(os.path.join(folder, name) for name in sub_folders)
+
+    log.info(
+        f"Updated the drawing index of {str(workspace_folder)!r}: "
+        f"{len(folders)} folder(s), {rescanned} rescanned."
+    )
+    return folders
+
+
+def build_stem_index(folders: Dict[str, FolderEntry]) -> StemIndex:
+    """
+    Builds the stem index from the scanned folders.
+
+    Args:
+        folders (Dict[str, FolderEntry]): The scanned folders by their path.
+
+    Returns:
+        StemIndex: The paths of the drawings by the lowercase stem of the drawing.
+    """
+    index: StemIndex = {}
+    for folder, (_, _, files) in folders.items():
+        for name in files:
+            index.setdefault(Path(name).stem.lower(), []).append(
+                os.path.join(folder, name)
+            )
+    return index
+
+
+class DrawingIndex:
+    """Holds the drawing index of the workspace folder, loads it in the background."""
+
+    def __init__(self) -> None:
+        """Inits the drawing index."""
+        self._workspace_folder: Optional[Path] = None
+        self._index: Optional[StemIndex] = None
+        self._loaded: Optional[Future] = None
+        self._pending: Dict[Callable[[List[Path]], None], str] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loading(self) -> bool:
+        """Returns True if the index is currently updated in the background."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def prefetch(self, workspace_folder: Path) -> None:
+        """
+        Starts loading and updating the index of the workspace folder in the background, if
+        not already running.
+
+        Args:
+            workspace_folder (Path): The workspace folder.
+        """
+        with self._lock:
+            if self.loading:
+                return
+            if workspace_folder != self._workspace_folder:
+                self._workspace_folder = workspace_folder
+                self._index = None
+            if self._index is None:
+                self._loaded = Future()
+            self._thread = threading.Thread(
+                target=self._prefetch_worker,
+                args=(workspace_folder, self._loaded),
+                name="DrawingIndexPrefetch",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _prefetch_worker(
+        self, workspace_folder: Path, loaded: Optional[Future]
+    ) -> None:
+        """
+        The worker of the prefetch thread. The cached index is available for lookups before
+        the workspace folder has been checked for changes. The `loaded` future is resolved as
+        soon as the index is available, or fails if the index can't be built.
+        """
+        try:
+            cached = _read_disk_cache(workspace_folder)
+            if cached and self._index is None:
+                self._index = build_stem_index(cached)
+                if loaded is not None:
+                    loaded.set_result(None)
+            folders = update_folders(workspace_folder, cached)
+            self._index = build_stem_index(folders)
+            if loaded is not None and not loaded.done():
+                loaded.set_result(None)
+            if folders != cached:
+                _write_disk_cache(workspace_folder, folders)
+        except Exception as e:  # pylint: disable=W0718
+            log.warning(f"Failed to update the drawing index: {e}")
+            if loaded is not None and not loaded.done():
+                loaded.set_exception(e)
+
+    def lookup(self, stem: str) -> Optional[List[Path]]:
+        """
+        Returns the drawings with the given stem.
+
+        Args:
+            stem (str): The stem of the drawing, e.g. `Part1`. Case insensitive.
+
+        Returns:
+            Optional[List[Path]]: The paths of the drawings. None if the index isn't loaded.
+        """
+        if (index := self._index) is None:
+            return None
+        return [Path(path) for path in index.get(stem.lower(), [])]
+
+    def find(
+        self,
+        widget: tk.Misc,
+        stem: str,
+        callback: Callable[[List[Path]], None],
+    ) -> None:
+        """
+        Looks up the drawings with the given stem. The callback is called on the tkinter
+        thread: Immediately if the index is loaded, otherwise as soon as it's loaded. It's not
+        called if the index can't be loaded. Pending lookups are polled in a single chain, a
+        further lookup with the same callback replaces the pending one.
+
+        Args:
+            widget (tk.Misc): The widget on which the index is polled.
+            stem (str): The stem of the drawing, e.g. `Part1`. Case insensitive.
+            callback (Callable[[List[Path]], None]): The callback, which receives the paths of
+                the drawings.
+        """
+        if (paths := self.lookup(stem)) is not None:
+            callback(paths)
+            return
+        if (loaded := self._loaded) is None:
+            return
+        if loaded.done():
+            # The index may have been loaded since the lookup above.
+            if loaded.exception() is None:
+                callback(self.lookup(stem) or [])
+            return
+
+        polling = bool(self._pending)
+        self._pending[callback] = stem
+        if polling:
+            return
+
+        def poll() -> None:
+            if not loaded.done():
+                widget.after(DRAWING_INDEX_POLL, poll)
+                return
+            pending, self._pending = self._pending, {}
+            if loaded.exception() is None:
+                for pending_callback, pending_stem in pending.items():
+                    pending_callback(self.lookup(pending_stem) or [])
+
+        widget.after(DRAWING_INDEX_POLL, poll)
+
+
+drawing_index = DrawingIndex()
@@ -0,0 +1,119 @@
+"""
+    Helper for file system checks, which must not block the user interface.
+"""
+
+import threading
+import time
+import tkinter as tk
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from const import FILE_CHECK_POLL
+from const import FILE_CHECK_TIMEOUT
+from const import FILE_CHECK_TTL
+from pytia.log import log
+
+
+class FileChecker:
+    """
+    Checks the existence of files on a background thread. Paths on a slow or offline network
+    share would freeze the user interface for the timeout of the operating system otherwise.
+    Positive and negative results are cached per path for a short time.
+    """
+
+    def __init__(self, timeout: float, ttl: float) -> None:
+        """
+        Inits the FileChecker class.
+
+        Args:
+            timeout (float): The time in seconds after which a check is treated as unanswered.
+            ttl (float): The time in seconds for which a result is cached.
+        """
+        self.timeout = timeout
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._cache: Dict[str, Tuple[float, bool]] = {}
+        self._running: Dict[str, Future] = {}
+
+    def cached(self, path: Path) -> Optional[bool]:
+        """
+        Returns the cached result for the path.
+
+        Args:
+            path (Path): The path of the file.
+
+        Returns:
+            Optional[bool]: The cached result. None, if there's no valid result in the cache.
+        """
+        with self._lock:
+            if (entry := self._cache.get(str(path))) and time.monotonic() < entry[0]:
+                return entry[1]
+        return None
+
+    def check(
+        self,
+        widget: tk.Misc,
+        path: Path,
+        callback: Callable[[Optional[bool]], None],
+    ) -> None:
+        """
+        Checks whether the path is an existing file. The callback is called on the tkinter
+        thread: Immediately if the result is cached, otherwise when the background check
+        finishes or the timeout has expired.
+
+        Args:
+            widget (tk.Misc): The widget on which the result is polled.
+            path (Path): The path of the file.
+            callback (Callable[[Optional[bool]], None]): The callback, which receives True if the
+                file exists, False if it doesn't exist and None if the check timed out.
+        """
+        if (result := self.cached(path)) is not None:
+            callback(result)
+            return
+
+        future = self._start(path)
+        deadline = time.monotonic() + self.timeout
+
+        def poll() -> None:
+            if future.done():
+                callback(future.result())
+            elif time.monotonic() >= deadline:
+                log.warning(f"Timed out checking {str(path)!r} after {self.timeout}s.")
+                callback(None)
+            else:
+                widget.after(FILE_CHECK_POLL, poll)
+
+        widget.after(FILE_CHECK_POLL, poll)
+
+    def _start(self, path: Path) -> Future:
+        """
+        Starts the check of the path on a background thread. Returns the running check, if
+        there's already one for this path.
+        """
+        key = str(path)
+        with self._lock:
+            if future := self._running.get(key):
+                return future
+            future = Future()
+            self._running[key] = future
+
+        def run() -> None:
+            try:
+                result = path.is_file()
+            except OSError as e:
+                log.warning(f"Failed checking {key!r}: {e}")
+                result = False
+            with self._lock:
+                self._cache[key] = (time.monotonic() + self.ttl, result)
+                del self._running[key]
+            future.set_result(result)
+
+        threading.Thread(target=run, daemon=True).start()
+        return future
+
+
+file_checker = FileChecker(timeout=FILE_CHECK_TIMEOUT, ttl=FILE_CHECK_TTL)
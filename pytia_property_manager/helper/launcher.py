@@ -6,7 +6,15 @@ import os
 import subprocess
 import time
 from tkinter import messagebox as tkmsg
+from typing import List
+from typing import Optional
 
+import pywintypes
+import win32api
+import win32con
+import win32event
+import win32file
+import win32process
 from const import CNEXT
 from const import PID_FILE_BOUNDING_BOX
 from const import PYTIA_BOUNDING_BOX
@@ -14,12 +22,45 @@ from pytia.log import log
 from resources import resource
 
 
-def launch_bounding_box_app() -> None:
-    """Starts the pytia bounding box application."""
+class CancelEvent:
+    """
+    A manual-reset event, which cancels a wait for the bounding box app. It's backed by a
+    win32 event, so a waiting thread wakes up the moment the event is set.
+    """
+
+    def __init__(self) -> None:
+        self.handle = win32event.CreateEvent(None, True, False, None)
+
+    def set(self) -> None:
+        """Sets the event."""
+        win32event.SetEvent(self.handle)
+
+    def is_set(self) -> bool:
+        """Returns True if the event is set."""
+        return (
+            win32event.WaitForSingleObject(self.handle, 0) == win32event.WAIT_OBJECT_0
+        )
+
+    def close(self) -> None:
+        """Closes the win32 event. Must not be called while a thread waits for the event."""
+        win32api.CloseHandle(self.handle)
+
+
+def launch_bounding_box_app() -> Optional[float]:
+    """
+    Starts the pytia bounding box application. Use `wait_for_bounding_box_app` to wait for
+    the app to close.
+
+    Returns:
+        Optional[float]: The launch time (`time.time`) if the app has been started, None if
+            the app isn't available.
+    """
     log.info(f"Running {PYTIA_BOUNDING_BOX} app.")
     path = f"{resource.settings.paths.release}\\{resource.settings.files.bounding_box_launcher}"
 
     if resource.settings.files.bounding_box_launcher and os.path.exists(path):
+        _remove_stale_pid_file()
+        launched_at = time.time()
         subprocess.Popen(
             [
                 f"{resource.settings.paths.catia}\\{CNEXT}",
@@ -28,15 +69,151 @@ def launch_bounding_box_app() -> None:
                 path,
             ]
         )
-        log.info("Waiting for the bounding box app to open...")
-        while not os.path.exists(PID_FILE_BOUNDING_BOX):
-            time.sleep(1)
-        log.info("Waiting for the bounding box app to close...")
-        while os.path.exists(PID_FILE_BOUNDING_BOX):
-            time.sleep(1)
-        log.info(f"The {PYTIA_BOUNDING_BOX} app has been closed.")
+        return launched_at
+
+    tkmsg.showinfo(
+        title="Launcher",
+        message="Cannot launch the bounding box app: The app is not available.",
+    )
+    return None
+
+
+def _wait(handles: List[int], deadline: Optional[float]) -> Optional[int]:
+    """
+    Waits until one of the handles is signaled or the deadline has passed.
+
+    Args:
+        handles (List[int]): The win32 handles to wait for.
+        deadline (Optional[float]): The deadline (`time.monotonic`), None waits infinitely.
+
+    Returns:
+        Optional[int]: The index of the signaled handle, None if the deadline has passed.
+    """
+    if deadline is None:
+        timeout = win32event.INFINITE
     else:
-        tkmsg.showinfo(
-            title="Launcher",
-            message="Cannot launch the bounding box app: The app is not available.",
-        )
+        timeout = max(0, int((deadline - time.monotonic()) * 1000))
+    result = win32event.WaitForMultipleObjects(handles, False, timeout)
+    if result == win32event.WAIT_TIMEOUT:
+        return None
+    return result - win32event.WAIT_OBJECT_0
+
+
+def _open_process(pid: int) -> Optional[int]:
+    """Returns a handle to wait for the process, None if the process isn't running."""
+    try:
+        return win32api.OpenProcess(win32con.SYNCHRONIZE, False, pid)
+    except pywintypes.error:
+        return None
+
+
+def _is_bounding_box_app(pid: int) -> bool:
+    """
+    Returns True if the process with the PID is the bounding box app, which wrote the PID
+    file. PIDs are reused: A process that has been started after the PID file has been
+    written is another process.
+    """
+    try:
+        process = win32api.OpenProcess(win32con.PROCESS_QUERY_INFORMATION, False, pid)
+    except pywintypes.error:
+        return False
+    try:
+        created = win32process.GetProcessTimes(process)["CreationTime"].timestamp()
+        return created <= os.path.getmtime(PID_FILE_BOUNDING_BOX)
+    except (pywintypes.error, OSError):
+        return False
+    finally:
+        win32api.CloseHandle(process)
+
+
+def _remove_stale_pid_file() -> None:
+    """
+    Removes the PID file of the bounding box app, unless it belongs to a running instance of
+    the app. The file is left over if the app has been killed, and its PID may belong to an
+    unrelated process by now.
+    """
+    if not os.path.exists(PID_FILE_BOUNDING_BOX):
+        return
+    if (pid := _read_pid()) is not None and _is_bounding_box_app(pid):
+        return
+    try:
+        os.remove(PID_FILE_BOUNDING_BOX)
+        log.info("Removed the stale PID file of the bounding box app.")
+    except OSError as e:
+        log.warning(f"Failed to remove the stale PID file {PID_FILE_BOUNDING_BOX}: {e}")
+
+
+def _read_pid(written_after: Optional[float] = None) -> Optional[int]:
+    """
+    Returns the PID from the PID file of the bounding box app.
+
+    Args:
+        written_after (Optional[float], optional): Ignores a PID file that has been written
+            before this time (`time.time`). Defaults to None.
+
+    Returns:
+        Optional[int]: The PID, None if it's not written.
+    """
+    try:
+        if written_after is not None:
+            if os.path.getmtime(PID_FILE_BOUNDING_BOX) < written_after:
+                return None
+        with open(PID_FILE_BOUNDING_BOX, "r", encoding="utf8") as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def wait_for_bounding_box_app(
+    timeout: float, launched_at: float, cancel: Optional[CancelEvent] = None
+) -> bool:
+    """
+    Waits for the bounding box app to open and to close again. Nothing is polled: The folder
+    of the PID file is watched until the app has written its PID, then the process of the
+    app is waited for. If the process has ended before, the wait ends immediately. Blocks
+    the calling thread.
+
+    Args:
+        timeout (float): The time in seconds for the app to open, the time the app stays open
+            is not limited.
+        launched_at (float): The launch time of the app, from `launch_bounding_box_app`. Only
+            a PID file written after the launch is accepted.
+        cancel (Optional[CancelEvent], optional): Cancels the wait when set. Defaults to None.
+
+    Returns:
+        bool: True if the app has been closed. False if the app didn't open in time or the
+            wait has been cancelled.
+    """
+    cancel_handles = [cancel.handle] if cancel is not None else []
+    deadline = time.monotonic() + timeout
+
+    log.info("Waiting for the bounding box app to open...")
+    change = win32file.FindFirstChangeNotification(
+        os.path.dirname(PID_FILE_BOUNDING_BOX),
+        False,
+        win32con.FILE_NOTIFY_CHANGE_FILE_NAME | win32con.FILE_NOTIFY_CHANGE_LAST_WRITE,
+    )
+    try:
+        while (pid := _read_pid(written_after=launched_at)) is None:
+            signaled = _wait([change] + cancel_handles, deadline)
+            if signaled is None:
+                log.warning(f"The {PYTIA_BOUNDING_BOX} app didn't open in {timeout}s.")
+                return False
+            if signaled == 1:
+                log.info("Cancelled waiting for the bounding box app.")
+                return False
+            win32file.FindNextChangeNotification(change)
+
+        log.info("Waiting for the bounding box app to close...")
+        if (process := _open_process(pid)) is not None:
+            try:
+                if _wait([process] + cancel_handles, None) == 1:
+                    log.info("Cancelled waiting for the bounding box app.")
+                    return False
+            finally:
+                win32api.CloseHandle(process)
+    finally:
+        win32file.FindCloseChangeNotification(change)
+
+    log.info(f"The {PYTIA_BOUNDING_BOX} app has been closed.")
+    return True
@@ -11,8 +11,10 @@ from pathlib import Path
 from tkinter import StringVar
 from tkinter import messagebox as tkmsg
 from tkinter import ttk
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from app.vars import Variables
 from app.widgets.notes import NoteWidgets
@@ -214,6 +216,75 @@ class LazyDocumentHelper:
             open_windows.append(self.framework.catia.windows.item(i).name)
         return open_windows
 
+    def get_loaded_parts(self) -> Dict[str, Path]:
+        """
+        Returns all part documents that are loaded in the CATIA session (e.g. the parts of the
+        current product), except the current document.
+
+        Returns:
+            Dict[str, Path]: The names of the part documents and their paths.
+        """
+        parts: Dict[str, Path] = {}
+        for i in range(1, self.framework.catia.documents.count + 1):
+            document = self.framework.catia.documents.item(i)
+            if document.name.endswith(".CATPart") and document.name != self.name:
+                parts[document.name] = Path(document.full_name)
+        return parts
+
+    def apply_material_on_loaded_part(
+        self, path: Path, material: str, catalog_path: Path
+    ) -> bool:
+        """
+        Applies the material to a part document of the CATIA session. If the part already has
+        a window, that window is activated and left open. Otherwise the part is opened in its
+        own window for this and the window is closed afterwards. Use `activate` to return to
+        the current document when done.
+
+        Args:
+            path (Path): The path of the part document.
+            material (str): The name of the material (including the metadata).
+            catalog_path (Path): The path to the material catalog.
+
+        Returns:
+            bool: False, if the material was already applied to the part, True otherwise.
+        """
+        # pylint: disable=C0415
+        from pytia.utilities.material import apply_material_on_part
+        from pytia.utilities.material import get_material_from_part
+        from pytia.wrapper.documents.part_documents import PyPartDocument
+
+        # pylint: enable=C0415
+
+        # Opening a document that has a window would prompt to open the document again.
+        opened = path.name not in self.get_all_open_windows()
+        if opened:
+            self.framework.catia.documents.open(path)
+        else:
+            self.framework.catia.windows.item(path.name).activate()
+        try:
+            if get_material_from_part() == material:
+                return False
+
+            part_document = PyPartDocument(
+                strict_naming=False, material_link=resource.settings.link_material
+            )
+            part_document.current()
+            apply_material_on_part(
+                material=material,
+                catalog_path=catalog_path,
+                part_document=part_document,
+            )
+            return True
+        finally:
+            if opened:
+                self.framework.catia.windows.item(path.name).close()
+
+    def activate(self) -> None:
+        """Activates the window of the current document again."""
+        if self.name in self.get_all_open_windows():
+            self.framework.catia.windows.item(self.name).activate()
+        self.document.current()
+
     def setup_main_body(self, variables: Variables) -> None:
         """
         Sets up the main body of the document (if the document is a part document).
@@ -388,12 +459,7 @@ class LazyDocumentHelper:
             resource.settings.processes.max + resource.settings.processes.first,
         ):
             property_name = resource.props.production.process_n.replace("$", str(i))
-            if processes.exists(pid=i):
-                self.write_property(
-                    property_name, processes.get(pid=i).process_var.get()
-                )
-            else:
-                self.write_property(property_name, "")
+            self.write_property(property_name, processes.get_process(pid=i))
 
     def write_process_notes(self, processes: ProcessWidgets) -> None:
         """
@@ -409,10 +475,7 @@ class LazyDocumentHelper:
             property_name = resource.props.production.note_process_n.replace(
                 "$", str(i)
             )
-            if processes.exists(pid=i):
-                self.write_property(property_name, processes.get(pid=i).note_var.get())
-            else:
-                self.write_property(property_name, "")
+            self.write_property(property_name, processes.get_note(pid=i))
 
     @staticmethod
     def setvar(
@@ -543,55 +606,24 @@ class LazyDocumentHelper:
 
     def setvar_process(self, processes: ProcessWidgets) -> None:
         """
-        Sets the value of all processes-tkinter variables.
+        Sets the values of all processes and their notes. Reads the processes until the first
+        process, which doesn't exist in the documents properties.
 
         Args:
-            notes (NoteWidgets): The process widgets object.
+            processes (ProcessWidgets): The process widgets object.
         """
-        index = resource.settings.processes.first
-
-        while True:
-            process_name = resource.props.production.process_n.replace("$", str(index))
-
-            if self.document.properties.exists(process_name):
-                if not processes.exists(pid=index):
-                    processes.add()
-                process = processes.get(pid=index)
-
-                self.setvar_property(
-                    variable=process.process_var, property_name=process_name
-                )
-                index += 1
-            else:
-                break
-
-        if not processes.exists(pid=index):
-            processes.add()
+        values: List[Tuple[str, str]] = []
 
-    def setvar_process_notes(self, processes: ProcessWidgets) -> None:
-        """
-        Sets the value of all processes-notes-tkinter variables.
-
-        Args:
-            notes (NoteWidgets): The process widgets object.
-        """
-        index = resource.settings.processes.first
-
-        while True:
+        for index in range(
+            resource.settings.processes.first,
+            resource.settings.processes.max + resource.settings.processes.first,
+        ):
             process_name = resource.props.production.process_n.replace("$", str(index))
             note_name = resource.props.production.note_process_n.replace(
                 "$", str(index)
             )
-
-            # Ignore notes for non-existent processes
-            if self.document.properties.exists(process_name) and processes.exists(
-                pid=index
-            ):
-                if self.document.properties.exists(note_name):
-                    process = processes.get(pid=index)
-                    self.setvar_property(
-                        variable=process.note_var, property_name=note_name
-                    )
-                index += 1
-            else:
+            if (process_value := self.get_property(process_name)) is None:
                 break
+            values.append((process_value, self.get_property(note_name) or ""))
+
+        processes.load(values)
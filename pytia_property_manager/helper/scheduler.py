@@ -0,0 +1,108 @@
+"""
+    Helper for scheduling work on the tkinter event loop.
+"""
+
+import tkinter as tk
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Optional
+from typing import Tuple
+
+from pytia.log import log
+
+
+class RedrawScheduler:
+    """
+    Coalesces visual refresh requests. All requests of one turn of the event loop are flushed
+    together in a single idle callback, a request with the same key is flushed only once.
+    """
+
+    def __init__(self) -> None:
+        self._root: Optional[tk.Misc] = None
+        self._after_id: Optional[str] = None
+        self._pending: Dict[Hashable, Callable[[], None]] = {}
+
+    def request(
+        self,
+        widget: tk.Misc,
+        callback: Callable[[], None],
+        key: Optional[Hashable] = None,
+    ) -> None:
+        """
+        Requests a visual refresh. The callback runs when the app is idle.
+
+        Args:
+            widget (tk.Misc): Any widget of the app, the flush is scheduled on its root window.
+            callback (Callable[[], None]): The refresh callback.
+            key (Optional[Hashable], optional): The key of the request. A request replaces any
+                pending request with the same key. Defaults to the callback itself.
+        """
+        self._pending[callback if key is None else key] = callback
+        if self._after_id is None:
+            # The flush is scheduled on the root window, other widgets may be destroyed before
+            # the app becomes idle.
+            self._root = widget.nametowidget(".")
+            self._after_id = self._root.after_idle(self._flush)
+
+    def flush(self) -> None:
+        """Runs all pending requests immediately."""
+        if self._after_id is not None and self._root is not None:
+            self._root.after_cancel(self._after_id)
+        self._flush()
+
+    def _flush(self) -> None:
+        """Runs all pending requests. Requests made while flushing are scheduled anew."""
+        self._after_id = None
+        pending, self._pending = self._pending, {}
+        for callback in pending.values():
+            callback()
+        if pending:
+            log.debug(f"Flushed {len(pending)} redraw request(s).")
+
+
+class Debouncer:
+    """
+    Collapses bursts of calls into one call. A call runs after the delay has passed without
+    any further call with the same key, e.g. when the user stopped typing.
+    """
+
+    def __init__(self, widget: tk.Misc, delay: int) -> None:
+        """
+        Inits the Debouncer class.
+
+        Args:
+            widget (tk.Misc): The widget on which the calls are scheduled.
+            delay (int): The idle interval in milliseconds.
+        """
+        self._widget = widget
+        self._delay = delay
+        self._pending: Dict[Hashable, Tuple[str, Callable[[], None]]] = {}
+
+    def call(self, key: Hashable, callback: Callable[[], None]) -> None:
+        """
+        Schedules the callback. A pending callback with the same key is replaced and its
+        delay starts anew.
+
+        Args:
+            key (Hashable): The key of the callback.
+            callback (Callable[[], None]): The callback to run.
+        """
+        if key in self._pending:
+            self._widget.after_cancel(self._pending[key][0])
+        after_id = self._widget.after(self._delay, lambda: self._run(key))
+        self._pending[key] = (after_id, callback)
+
+    def flush(self) -> None:
+        """Runs all pending callbacks immediately."""
+        for key, (after_id, _) in list(self._pending.items()):
+            self._widget.after_cancel(after_id)
+            self._run(key)
+
+    def _run(self, key: Hashable) -> None:
+        """Runs the pending callback with the given key."""
+        if pending := self._pending.pop(key, None):
+            pending[1]()
+
+
+redraw = RedrawScheduler()
@@ -3,13 +3,16 @@
 """
 
 from copy import deepcopy
+from pathlib import Path
 from string import ascii_lowercase
 from string import ascii_uppercase
 from tkinter import StringVar
+from typing import Optional
 from zlib import adler32
 
 from pytia.exceptions import PytiaValueError
 from resources import resource
+from resources.utils import expand_env_vars
 
 
 def get_new_revision(variable: StringVar) -> str:
@@ -121,3 +124,20 @@ def set_perceived_brightness(rgb: tuple, brightness: float) -> tuple:
         t += 1
 
     return color
+
+
+def get_linked_doc_path(value: str, workspace_folder: Optional[Path]) -> Path:
+    """
+    Returns the path of the linked document. Paths starting with `.\\` are relative to the
+    workspace folder, all others may contain environment variables.
+
+    Args:
+        value (str): The value of the linked document property.
+        workspace_folder (Optional[Path]): The folder of the workspace.
+
+    Returns:
+        Path: The path of the linked document.
+    """
+    if value.startswith(".\\") and workspace_folder:
+        return Path(workspace_folder, value[2:])
+    return Path(expand_env_vars(value, ignore_not_found=True))
@@ -34,9 +34,8 @@ def verify_process(
     layout: Layout,
     msg: str,
 ) -> None:
-    if (
-        settings_verification is not None
-        and not layout.processes.get(process_id).process_var.get()
+    if settings_verification is not None and not layout.processes.get_process(
+        process_id
     ):
         if settings_verification == VERIFY_CRITICAL:
             critical.append(msg)
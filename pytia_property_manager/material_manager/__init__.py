@@ -3,13 +3,15 @@
     TODO: Move this to pytia-ui-tools.
 """
 
-from pathlib import Path
+import tkinter as tk
+from tkinter import Tk
 from tkinter import font
 
 from app.state_setter import UISetter
 from decorators import timer
 from helper.lazy_loaders import LazyDocumentHelper
 from material_manager.callbacks import Callbacks
+from material_manager.catalog import material_catalog
 from material_manager.frames import Frames
 from material_manager.layout import Layout
 from material_manager.traces import Traces
@@ -18,31 +20,37 @@ from pytia.exceptions import PytiaMaterialNotFound
 from pytia.log import log
 from pytia_ui_tools.window_manager import WindowManager
 from resources import resource
-from ttkbootstrap import Style
 from ttkbootstrap import Toplevel
 
 
 class MaterialManager(Toplevel):
-    """The user interface of the material manager window."""
+    """
+    The user interface of the material manager window.
+
+    The window is built once per main window and hidden afterwards. Use `show` to open the
+    material manager, the apply and abort buttons hide it again (see callbacks).
+    """
 
     WIDTH = 320
-    HEIGHT = 160
+    HEIGHT = 280
 
     @timer
     def __init__(
         self,
+        master: Tk,
         doc_helper: LazyDocumentHelper,
         ui_setter: UISetter,
     ) -> None:
         """
-        Inits the material manager window.
+        Inits the material manager window. The window is hidden after instantiation.
 
         Args:
+            master (Tk): The main window.
             doc_helper (LazyDocumentHelper): The doc helper.
             ui_setter (UISetter): The main apps state setter.
         """
-        Toplevel.__init__(self)
-        Style()
+        Toplevel.__init__(self, master=master)
+        self.withdraw()
 
         self.doc_helper = doc_helper
         self.window_manager = WindowManager(self)
@@ -50,15 +58,22 @@ class MaterialManager(Toplevel):
         self.frames = Frames(root=self)
         self.layout = Layout(root=self, frames=self.frames, variables=self.vars)
         self.set_parent_ui = ui_setter
+        self._controllers_initialized = False
 
         self.title("Material Manager")
         self.attributes("-topmost", True)
         self.attributes("-toolwindow", True)
         self.resizable(False, False)
-        self.configure(cursor="wait")
+        self.protocol("WM_DELETE_WINDOW", self.layout.button_abort.invoke)
+        if not self.doc_helper.is_document:
+            # Applying the material to multiple parts is only available for products.
+            self.layout.button_batch.grid_remove()
         self.default_font = font.nametofont("TkDefaultFont")
         self.default_font.configure(family="Segoe UI", size=9)
-        self.update()
+
+    def show(self) -> None:
+        """Shows the material manager window and grabs all events of the app."""
+        self.set_parent_ui.loading()
 
         screen_width = self.winfo_screenwidth()
         screen_height = self.winfo_screenheight()
@@ -68,37 +83,35 @@ class MaterialManager(Toplevel):
             f"{MaterialManager.WIDTH}x{MaterialManager.HEIGHT}+{x_coordinate}+{y_coordinate}"
         )
 
-        self.set_parent_ui.loading()
-        self.update()
+        self.vars.search.set("")
+        self.vars.sel_family.set("")
+        self.configure(cursor="wait")
+        self.deiconify()
+        # The window buttons can only be removed after the window has been mapped.
+        self.after_idle(self.window_manager.remove_window_buttons)
         self.grab_set()
-        self.window_manager.remove_window_buttons()
-        self.after(200, self.run_controller)
-        self.mainloop()
+        self.after_idle(self.run_controller)
 
     def run_controller(self) -> None:
-        """Runs all controllers. Initializes all lazy loaders."""
+        """
+        Runs all controllers. Loads the material data on every call, the callbacks and traces
+        are initialized only once.
+        """
         self.retrieve_material_data()
-        self.callbacks()
-        self.traces()
+        if not self._controllers_initialized:
+            self.callbacks()
+            self.traces()
+            self._controllers_initialized = True
 
         self.config(cursor="arrow")
-        self.update_idletasks()
 
     @timer
     def retrieve_material_data(self) -> None:
         """Lazy loads the material families for ui loading improvement."""
-        # pylint: disable=C0415
-        from pytia.utilities.material import get_materials
-
-        # pylint: enable=C0415
-
-        self.vars.material_data = get_materials(
-            Path(
-                resource.settings.paths.material,
-                resource.settings.files.material,
-            )
-        )
+        self.vars.material_data = material_catalog.get()
+        self.vars.material_index = material_catalog.get_index()
         if self.vars.material_data:
+            self.layout.input_search.config(state=tk.NORMAL)
             self.layout.input_family.config(state="readonly")
             self.layout.input_family.config(values=list(self.vars.material_data.keys()))
             log.info(
@@ -0,0 +1,165 @@
+"""
+    Batch submodule for the material manager.
+    Applies one material to multiple parts of the CATIA session (e.g. the parts of the current
+    product) in one go.
+"""
+
+import tkinter as tk
+from typing import List
+
+from helper.lazy_loaders import LazyDocumentHelper
+from material_manager.catalog import material_catalog
+from pytia.log import log
+from pytia_ui_tools.window_manager import WindowManager
+from ttkbootstrap import Button
+from ttkbootstrap import Frame
+from ttkbootstrap import Label
+from ttkbootstrap import Progressbar
+from ttkbootstrap import Toplevel
+
+
+class BatchWindow(Toplevel):
+    """The batch window. Lists all loaded parts and applies the material to the selected ones."""
+
+    WIDTH = 420
+    HEIGHT = 360
+
+    def __init__(
+        self, master: Toplevel, doc_helper: LazyDocumentHelper, material: str
+    ) -> None:
+        """
+        Inits the batch window.
+
+        Args:
+            master (Toplevel): The material manager window.
+            doc_helper (LazyDocumentHelper): The doc helper.
+            material (str): The material to apply (including the metadata).
+        """
+        Toplevel.__init__(self, master=master)
+        self.withdraw()
+
+        self.doc_helper = doc_helper
+        self.material = material
+        self.window_manager = WindowManager(self)
+        self.part_names: List[str] = sorted(
+            self.doc_helper.get_loaded_parts(), key=str.lower
+        )
+
+        self.title("Apply Material To Parts")
+        self.attributes("-topmost", True)
+        self.attributes("-toolwindow", True)
+        self.resizable(False, False)
+        self.protocol("WM_DELETE_WINDOW", self.on_btn_close)
+
+        frame_data = Frame(master=self)
+        frame_data.grid(row=0, column=0, sticky="nsew", padx=10, pady=(10, 5))
+        frame_data.grid_columnconfigure(0, weight=1)
+        frame_data.grid_rowconfigure(1, weight=1)
+
+        frame_footer = Frame(master=self, height=30)
+        frame_footer.grid(row=1, column=0, sticky="swe", padx=10, pady=(5, 10))
+        frame_footer.grid_columnconfigure(0, weight=1)
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        lbl_material = Label(frame_data, text=f"Material: {material}")
+        lbl_material.grid(row=0, column=0, pady=(0, 5), sticky="nsew")
+
+        self._list_parts = tk.Listbox(
+            frame_data, selectmode=tk.EXTENDED, activestyle="none", height=12
+        )
+        self._list_parts.grid(row=1, column=0, pady=2, sticky="nsew")
+
+        self._progress_var = tk.StringVar(master=self, value="Select the parts.")
+        lbl_progress = Label(frame_data, textvariable=self._progress_var)
+        lbl_progress.grid(row=2, column=0, pady=(5, 2), sticky="nsew")
+
+        self._progressbar = Progressbar(frame_data, mode="determinate")
+        self._progressbar.grid(row=3, column=0, pady=(2, 0), sticky="nsew")
+
+        self._btn_apply = Button(frame_footer, text="Apply", style="outline", width=10)
+        self._btn_apply.grid(row=0, column=0, padx=(5, 2), pady=0, sticky="e")
+        self._btn_apply.configure(command=self.on_btn_apply)
+
+        self._btn_close = Button(frame_footer, text="Close", style="outline", width=10)
+        self._btn_close.grid(row=0, column=1, padx=(2, 0), pady=0, sticky="e")
+        self._btn_close.configure(command=self.on_btn_close)
+
+        for name in self.part_names:
+            self._list_parts.insert(tk.END, name)
+
+        screen_width = self.winfo_screenwidth()
+        screen_height = self.winfo_screenheight()
+        x_coordinate = int((screen_width / 2) - (BatchWindow.WIDTH / 2))
+        y_coordinate = int((screen_height / 2) - (BatchWindow.HEIGHT / 2))
+        self.geometry(
+            f"{BatchWindow.WIDTH}x{BatchWindow.HEIGHT}+{x_coordinate}+{y_coordinate}"
+        )
+
+        self.deiconify()
+        self.update_idletasks()
+        self.window_manager.remove_window_buttons()
+        self.grab_set()
+
+    def _set_progress(self, text: str, value: int) -> None:
+        """Updates the progress label and bar, and redraws the window."""
+        self._progress_var.set(text)
+        self._progressbar.configure(value=value)
+        self.update_idletasks()
+
+    def on_btn_apply(self) -> None:
+        """
+        Callback for the apply button. Applies the material to all selected parts, skips parts
+        which have the material already applied.
+        """
+        selected: List[int] = list(self._list_parts.curselection())
+        if not selected:
+            return
+
+        loaded_parts = self.doc_helper.get_loaded_parts()
+        applied, skipped, failed = 0, 0, 0
+
+        self.configure(cursor="wait")
+        self._btn_apply.configure(state=tk.DISABLED)
+        self._btn_close.configure(state=tk.DISABLED)
+        self._progressbar.configure(maximum=len(selected))
+
+        try:
+            for step, list_index in enumerate(selected):
+                name = self.part_names[list_index]
+                self._set_progress(f"Applying material to {name}...", step)
+                try:
+                    if self.doc_helper.apply_material_on_loaded_part(
+                        path=loaded_parts[name],
+                        material=self.material,
+                        catalog_path=material_catalog.path,
+                    ):
+                        applied += 1
+                        status = "applied"
+                    else:
+                        skipped += 1
+                        status = "skipped, already applied"
+                except Exception as e:  # pylint: disable=W0718
+                    failed += 1
+                    status = "failed"
+                    log.error(f"Failed to apply material to {name}: {e}")
+
+                log.info(f"Batch material {self.material!r} on {name}: {status}.")
+                self._list_parts.delete(list_index)
+                self._list_parts.insert(list_index, f"{name}  ({status})")
+        finally:
+            self.doc_helper.activate()
+            self.configure(cursor="arrow")
+            self._btn_close.configure(state=tk.NORMAL)
+
+        self._set_progress(
+            f"Done: {applied} applied, {skipped} skipped, {failed} failed.",
+            len(selected),
+        )
+
+    def on_btn_close(self) -> None:
+        """Callback for the close button. Returns the event grab to the material manager."""
+        self.grab_release()
+        self.destroy()
+        self.master.grab_set()  # type: ignore
@@ -7,6 +7,7 @@ from tkinter import Toplevel
 
 from app.state_setter import UISetter
 from helper.lazy_loaders import LazyDocumentHelper
+from material_manager.batch import BatchWindow
 from material_manager.layout import Layout
 from material_manager.vars import Variables
 from pytia.wrapper.documents.part_documents import PyPartDocument
@@ -45,13 +46,53 @@ class Callbacks:
         self.doc_helper = doc_helper
 
         self._bind_button_callbacks()
+        self._bind_widget_callbacks()
 
     def _bind_button_callbacks(self) -> None:
         """Binds all callbacks."""
+        self.layout.button_batch.configure(command=self.on_btn_batch)
         self.layout.button_save.configure(command=self.on_btn_save)
         self.layout.button_abort.configure(command=self.on_btn_abort)
         # TODO: Bind callbacks for the combobox widgets for logging.
 
+    def _bind_widget_callbacks(self) -> None:
+        """Binds all callbacks to the widgets."""
+        self.layout.list_search.bind("<<ListboxSelect>>", self.on_search_select)
+
+    def on_search_select(self, *_) -> None:
+        """
+        Callback for the selection of a search result.
+        Fills the family, the material and the metadata with the selected result.
+        """
+        if not (selection := self.layout.list_search.curselection()):
+            return
+
+        result = self.vars.search_results[selection[0]]
+        # The order matters: The traces of the family and the material reset the following
+        # selections and provide the values for the comboboxes.
+        self.vars.sel_family.set(result.family)
+        self.vars.sel_material.set(result.material)
+        self.vars.sel_color.set(result.metadata)
+
+    def get_selected_material(self) -> str:
+        """Returns the selected material, including the selected metadata."""
+        selected_material = self.layout.input_material.get()
+        if selected_metadata := self.layout.input_metadata.get():
+            return f"{selected_material}{resource.settings.separators.metadata}{selected_metadata}"
+        return selected_material
+
+    def on_btn_batch(self) -> None:
+        """
+        Callback for the batch button.
+        Opens the batch window to apply the selected material to multiple parts.
+        """
+        if self.layout.input_material.get():
+            BatchWindow(
+                master=self.root,
+                doc_helper=self.doc_helper,
+                material=self.get_selected_material(),
+            )
+
     def on_btn_save(self) -> None:
         """
         Callback for the save button.
@@ -98,10 +139,10 @@ class Callbacks:
         # main UI object.
 
         self.root.grab_release()
-        self.root.destroy()
+        self.root.withdraw()
 
     def on_btn_abort(self) -> None:
-        """Callback for the abort button. Closes the material manager interface."""
+        """Callback for the abort button. Hides the material manager interface."""
         self.set_parent_ui.reset()
         self.root.grab_release()
-        self.root.destroy()
+        self.root.withdraw()
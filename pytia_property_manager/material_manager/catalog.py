@@ -0,0 +1,310 @@
+"""
+    Material catalog submodule for the material manager.
+
+    Parsing the material catalog is expensive, therefore the family-to-materials map of the
+    catalog is cached on the local disk. The cache is keyed by the path, the size and the
+    modification time of the catalog, and is reused as long as the catalog doesn't change.
+
+    The `material_catalog` instance is shared within the app. It allows loading the material
+    data in the background, before the material manager is opened. Only the cache is loaded
+    in the background: Parsing the catalog uses the CATIA COM objects of the main thread,
+    which must not be called from another thread.
+
+    For the material manager the data is indexed once per catalog load: Family -> base
+    material -> metadata. See `MaterialIndex`.
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from const import APPDATA
+from const import CACHE_MATERIALS
+from pytia.log import log
+from resources import resource
+from resources.utils import write_file_atomic
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class IndexedMaterial:
+    """Dataclass for a base material of the material index."""
+
+    metadata: List[str]
+    has_base: bool
+
+    @property
+    def options(self) -> List[str]:
+        """
+        Returns the selectable metadata options of the material. The empty option (the base
+        material without metadata) is only available if the catalog contains the base material.
+        """
+        return [""] + self.metadata if self.has_base else self.metadata
+
+
+CatalogKey = Dict[str, str | int]
+MaterialData = Dict[str, List[str]]
+MaterialIndex = Dict[str, Dict[str, IndexedMaterial]]
+
+_memory_cache: Dict[str, Tuple[CatalogKey, MaterialData]] = {}
+_index_cache: Dict[str, Tuple[MaterialData, MaterialIndex]] = {}
+
+
+def _get_catalog_key(path: Path) -> CatalogKey:
+    """
+    Returns the cache key of the catalog. Costs one stat call.
+
+    Args:
+        path (Path): The path to the material catalog.
+
+    Returns:
+        CatalogKey: The key, made of the path, the size and the modification time.
+    """
+    stat = os.stat(path)
+    return {"path": str(path), "size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+
+def _read_disk_cache(key: CatalogKey) -> Optional[MaterialData]:
+    """
+    Reads the cached material data from the appdata folder.
+
+    Args:
+        key (CatalogKey): The key of the current catalog.
+
+    Returns:
+        Optional[MaterialData]: The cached data, None if there's no valid cache for the key.
+    """
+    cache_file = f"{APPDATA}\\{CACHE_MATERIALS}"
+    if not os.path.exists(cache_file):
+        return None
+
+    try:
+        with open(cache_file, "r", encoding="utf8") as f:
+            cache = json.load(f)
+        if cache["key"] == key:
+            return {family: list(items) for family, items in cache["data"].items()}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        log.warning(f"Ignoring the material cache, failed to read it: {e}")
+    return None
+
+
+def _write_disk_cache(key: CatalogKey, data: MaterialData) -> None:
+    """
+    Writes the material data to the appdata folder.
+
+    Args:
+        key (CatalogKey): The key of the current catalog.
+        data (MaterialData): The material data of the current catalog.
+    """
+    try:
+        os.makedirs(APPDATA, exist_ok=True)
+        write_file_atomic(
+            f"{APPDATA}\\{CACHE_MATERIALS}", json.dumps({"key": key, "data": data})
+        )
+    except OSError as e:
+        log.warning(f"Failed to write the material cache: {e}")
+
+
+def get_cached_material_data(path: Path) -> Optional[MaterialData]:
+    """
+    Returns the material data of the given material catalog from the cache. Doesn't parse
+    the catalog, therefore it's safe to call from any thread.
+
+    Args:
+        path (Path): The path to the material catalog.
+
+    Returns:
+        Optional[MaterialData]: The map of material families to their materials. None if
+            the catalog isn't cached, has changed or can't be accessed.
+    """
+    try:
+        key = _get_catalog_key(path)
+    except OSError as e:
+        log.warning(f"Cannot access the material catalog {str(path)!r}: {e}")
+        return None
+
+    if (cached := _memory_cache.get(str(path))) and cached[0] == key:
+        return cached[1]
+
+    if (data := _read_disk_cache(key)) is None:
+        return None
+    log.info(f"Loaded material data of {path.name!r} from the cache.")
+    _memory_cache[str(path)] = (key, data)
+    return data
+
+
+def get_material_data(path: Path) -> MaterialData:
+    """
+    Returns the material families and their materials from the given material catalog.
+    The catalog is only parsed if it has changed since the last time it was parsed. Must be
+    called from the main thread, parsing the catalog uses CATIA.
+
+    Args:
+        path (Path): The path to the material catalog.
+
+    Returns:
+        MaterialData: The map of material families to their materials.
+    """
+    # pylint: disable=C0415
+    from pytia.utilities.material import get_materials
+
+    # pylint: enable=C0415
+
+    if (data := get_cached_material_data(path)) is not None:
+        return data
+
+    try:
+        key = _get_catalog_key(path)
+    except OSError:
+        return get_materials(path)
+
+    data = {family: list(items) for family, items in get_materials(path).items()}
+    _write_disk_cache(key, data)
+    log.info(f"Parsed material catalog {path.name!r} and updated the cache.")
+    _memory_cache[str(path)] = (key, data)
+    return data
+
+
+def build_material_index(data: MaterialData) -> MaterialIndex:
+    """
+    Builds the material index from the material data. Splits the materials of each family
+    into the base material and its metadata.
+
+    Args:
+        data (MaterialData): The map of material families to their materials.
+
+    Returns:
+        MaterialIndex: The map of families to their base materials (sorted), each with the \
+            sorted list of its metadata.
+    """
+    separator = resource.settings.separators.metadata
+    index: MaterialIndex = {}
+
+    for family, items in data.items():
+        metadata: Dict[str, set] = {}
+        base_materials: set = set()
+        for item in items:
+            material, found, datum = item.partition(separator)
+            metadata.setdefault(material, set())
+            if found:
+                metadata[material].add(datum)
+            else:
+                base_materials.add(material)
+
+        index[family] = {
+            material: IndexedMaterial(
+                metadata=sorted(metadata[material] - {""}),
+                has_base=material in base_materials,
+            )
+            for material in sorted(metadata)
+        }
+    return index
+
+
+def get_material_index(path: Path) -> MaterialIndex:
+    """
+    Returns the material index of the given material catalog. The index is built once per
+    catalog load.
+
+    Args:
+        path (Path): The path to the material catalog.
+
+    Returns:
+        MaterialIndex: The material index.
+    """
+    return _get_index(path, get_material_data(path))
+
+
+def _get_index(path: Path, data: MaterialData) -> MaterialIndex:
+    """Returns the material index of the material data, builds it once per catalog load."""
+    if (cached := _index_cache.get(str(path))) and cached[0] is data:
+        return cached[1]
+
+    index = build_material_index(data)
+    _index_cache[str(path)] = (data, index)
+    return index
+
+
+class MaterialCatalog:
+    """Holds the material data of a material catalog, loads it in the background on demand."""
+
+    def __init__(self, path: Path) -> None:
+        """
+        Inits the material catalog.
+
+        Args:
+            path (Path): The path to the material catalog.
+        """
+        self._path = path
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        """Returns the path of the material catalog."""
+        return self._path
+
+    @property
+    def loading(self) -> bool:
+        """Returns True if the material data is currently loaded in the background."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def prefetch(self) -> None:
+        """Starts loading the material data in the background, if not already running."""
+        with self._lock:
+            if self.loading:
+                return
+            self._thread = threading.Thread(
+                target=self._prefetch_worker, name="MaterialPrefetch", daemon=True
+            )
+            self._thread.start()
+
+    def _prefetch_worker(self) -> None:
+        """
+        The worker of the prefetch thread. Loads the cached data and builds its index. If the
+        catalog isn't cached, it's parsed on the main thread by the `get` method.
+        """
+        try:
+            if (data := get_cached_material_data(self._path)) is None:
+                log.warning(
+                    "Material data isn't cached, the catalog is parsed on the main "
+                    "thread when the material manager opens."
+                )
+                return
+            _get_index(self._path, data)
+            log.info("Prefetched the material data.")
+        except Exception as e:  # pylint: disable=W0718
+            log.warning(f"Failed to prefetch the material data: {e}")
+
+    def get(self) -> MaterialData:
+        """
+        Returns the material data. Waits for the prefetch to finish, if it's still running.
+        Loads the data on the calling thread, if the prefetch didn't succeed.
+
+        Returns:
+            MaterialData: The map of material families to their materials.
+        """
+        if self._thread is not None:
+            self._thread.join()
+        return get_material_data(self._path)
+
+    def get_index(self) -> MaterialIndex:
+        """
+        Returns the material index. Waits for the prefetch to finish, if it's still running.
+
+        Returns:
+            MaterialIndex: The material index.
+        """
+        if self._thread is not None:
+            self._thread.join()
+        return get_material_index(self._path)
+
+
+material_catalog = MaterialCatalog(
+    Path(resource.settings.paths.material, resource.settings.files.material)
+)
@@ -26,8 +26,30 @@ class Layout:
             frames (Frames): The material manager frames.
             variables (Variables): The material manager variables.
         """ """"""
+        lbl_search = Label(frames.data, text="Search")
+        lbl_search.grid(row=0, column=0, padx=(0, 15), pady=(0, 2), sticky="nsew")
+
+        self._entry_search = Entry(
+            frames.data,
+            textvariable=variables.search,
+            state=tk.DISABLED,
+        )
+        self._entry_search.grid(
+            row=0, column=1, padx=(5, 0), pady=(0, 2), sticky="nsew"
+        )
+
+        self._list_search = tk.Listbox(
+            frames.data,
+            height=5,
+            activestyle="none",
+            exportselection=False,
+        )
+        self._list_search.grid(
+            row=1, column=1, padx=(5, 0), pady=(2, 10), sticky="nsew"
+        )
+
         lbl_family = Label(frames.data, text="Family")
-        lbl_family.grid(row=0, column=0, padx=(0, 15), pady=(0, 2), sticky="nsew")
+        lbl_family.grid(row=2, column=0, padx=(0, 15), pady=(0, 2), sticky="nsew")
 
         self._combo_family = Combobox(
             frames.data,
@@ -36,11 +58,11 @@ class Layout:
             state=tk.DISABLED,
         )
         self._combo_family.grid(
-            row=0, column=1, padx=(5, 0), pady=(0, 2), sticky="nsew"
+            row=2, column=1, padx=(5, 0), pady=(0, 2), sticky="nsew"
         )
 
         lbl_material = Label(frames.data, text="Material")
-        lbl_material.grid(row=1, column=0, padx=(0, 15), pady=(2, 2), sticky="nsew")
+        lbl_material.grid(row=3, column=0, padx=(0, 15), pady=(2, 2), sticky="nsew")
 
         self._combo_material = Combobox(
             frames.data,
@@ -49,11 +71,11 @@ class Layout:
             state=tk.DISABLED,
         )
         self._combo_material.grid(
-            row=1, column=1, padx=(5, 0), pady=(2, 2), sticky="nsew"
+            row=3, column=1, padx=(5, 0), pady=(2, 2), sticky="nsew"
         )
 
         lbl_color = Label(frames.data, text="Metadata")
-        lbl_color.grid(row=2, column=0, padx=(0, 15), pady=(2, 2), sticky="nsew")
+        lbl_color.grid(row=4, column=0, padx=(0, 15), pady=(2, 2), sticky="nsew")
 
         self._combo_color = Combobox(
             frames.data,
@@ -61,7 +83,16 @@ class Layout:
             textvariable=variables.sel_color,
             state=tk.DISABLED,
         )
-        self._combo_color.grid(row=2, column=1, padx=(5, 0), pady=(2, 2), sticky="nsew")
+        self._combo_color.grid(row=4, column=1, padx=(5, 0), pady=(2, 2), sticky="nsew")
+
+        self._btn_batch = Button(
+            frames.footer,
+            text="Parts...",
+            style="outline",
+            width=10,
+            state=tk.DISABLED,
+        )
+        self._btn_batch.grid(row=0, column=0, padx=(0, 2), pady=0, sticky="w")
 
         self._btn_save = Button(
             frames.footer,
@@ -70,7 +101,7 @@ class Layout:
             width=10,
             state=tk.DISABLED,
         )
-        self._btn_save.grid(row=0, column=0, padx=(5, 2), pady=0, sticky="e")
+        self._btn_save.grid(row=0, column=1, padx=(5, 2), pady=0, sticky="e")
 
         self._btn_abort = Button(
             frames.footer,
@@ -78,7 +109,17 @@ class Layout:
             style="outline",
             width=10,
         )
-        self._btn_abort.grid(row=0, column=1, padx=(2, 0), pady=0, sticky="e")
+        self._btn_abort.grid(row=0, column=2, padx=(2, 0), pady=0, sticky="e")
+
+    @property
+    def input_search(self) -> Entry:
+        """Returns the input widget for the material search."""
+        return self._entry_search
+
+    @property
+    def list_search(self) -> tk.Listbox:
+        """Returns the list widget of the material search results."""
+        return self._list_search
 
     @property
     def input_family(self) -> Combobox:
@@ -95,6 +136,11 @@ class Layout:
         """Returns the input widget for the metadata."""
         return self._combo_color
 
+    @property
+    def button_batch(self) -> Button:
+        """Returns the button for applying the material to multiple parts."""
+        return self._btn_batch
+
     @property
     def button_save(self) -> Button:
         """Returns the save button."""
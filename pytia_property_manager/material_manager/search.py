@@ -0,0 +1,147 @@
+"""
+    Search submodule for the material manager.
+
+    Provides a type-ahead search over all materials and metadata variants of all families.
+    Every searchable text is split into its n-grams (up to the length of `SEARCH_GRAM`),
+    which map to the entries that contain them. Short queries are answered by a single
+    lookup, longer queries intersect the posting lists of their trigrams.
+"""
+
+from dataclasses import dataclass
+from itertools import islice
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from material_manager.catalog import MaterialIndex
+from resources import resource
+
+SEARCH_GRAM = 3
+SEARCH_LIMIT = 50
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class SearchEntry:
+    """Dataclass for one selectable result of the material search."""
+
+    family: str
+    material: str
+    metadata: str
+
+    @property
+    def text(self) -> str:
+        """Returns the material as it's named in the catalog."""
+        if self.metadata:
+            return (
+                f"{self.material}{resource.settings.separators.metadata}{self.metadata}"
+            )
+        return self.material
+
+    @property
+    def display(self) -> str:
+        """Returns the text of the entry in the result list."""
+        return f"{self.text}  ({self.family})"
+
+
+class MaterialSearch:
+    """The material search index. Built once per material index."""
+
+    def __init__(self, index: MaterialIndex) -> None:
+        """
+        Inits the search index.
+
+        Args:
+            index (MaterialIndex): The material index from which to build the search index.
+        """
+        self._entries: List[SearchEntry] = []
+        self._keys: List[str] = []
+        self._grams: Dict[str, List[int]] = {}
+        self._prefixes: Dict[str, List[int]] = {}
+
+        for family, materials in index.items():
+            for material, indexed in materials.items():
+                for metadata in indexed.options or [""]:
+                    self._entries.append(
+                        SearchEntry(family=family, material=material, metadata=metadata)
+                    )
+
+        self._entries.sort(key=lambda e: (e.text.lower(), e.family.lower()))
+        for entry_id, entry in enumerate(self._entries):
+            key = entry.text.lower()
+            self._keys.append(key)
+            # Keys shorter than SEARCH_GRAM have the same prefix for several n.
+            for prefix in {key[:n] for n in range(1, SEARCH_GRAM + 1)}:
+                self._prefixes.setdefault(prefix, []).append(entry_id)
+            for n in range(1, SEARCH_GRAM + 1):
+                for gram in {key[i : i + n] for i in range(len(key) - n + 1)}:
+                    self._grams.setdefault(gram, []).append(entry_id)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _prefix_matches(self, query: str) -> Iterator[int]:
+        """Yields the ids of all entries which start with the query."""
+        for entry_id in self._prefixes.get(query[:SEARCH_GRAM], []):
+            if self._keys[entry_id].startswith(query):
+                yield entry_id
+
+    def _substring_matches(self, query: str) -> Iterator[int]:
+        """Yields the ids of all entries which contain the query, but don't start with it."""
+        if len(query) <= SEARCH_GRAM:
+            candidates = self._grams.get(query, [])
+        else:
+            postings = sorted(
+                (
+                    self._grams.get(query[i : i + SEARCH_GRAM], [])
+                    for i in range(len(query) - SEARCH_GRAM + 1)
+                ),
+                key=len,
+            )
+            candidates = sorted(set(postings[0]).intersection(*postings[1:]))
+
+        for entry_id in candidates:
+            key = self._keys[entry_id]
+            if query in key and not key.startswith(query):
+                yield entry_id
+
+    def search(self, query: str, limit: int = SEARCH_LIMIT) -> List[SearchEntry]:
+        """
+        Searches all materials and metadata variants for the query (case insensitive).
+        Entries that start with the query are listed before entries that contain it.
+
+        Args:
+            query (str): The text to search for.
+            limit (int, optional): The maximum amount of results. Defaults to SEARCH_LIMIT.
+
+        Returns:
+            List[SearchEntry]: The matching entries.
+        """
+        if not (query := query.strip().lower()):
+            return []
+
+        ids = list(islice(self._prefix_matches(query), limit))
+        if len(ids) < limit:
+            ids.extend(islice(self._substring_matches(query), limit - len(ids)))
+        return [self._entries[entry_id] for entry_id in ids]
+
+
+_search_cache: Optional[Tuple[MaterialIndex, MaterialSearch]] = None
+
+
+def get_material_search(index: MaterialIndex) -> MaterialSearch:
+    """
+    Returns the search index of the given material index. The search index is built once per
+    material index.
+
+    Args:
+        index (MaterialIndex): The material index.
+
+    Returns:
+        MaterialSearch: The search index.
+    """
+    global _search_cache  # pylint: disable=W0603
+    if _search_cache is None or _search_cache[0] is not index:
+        _search_cache = (index, MaterialSearch(index))
+    return _search_cache[1]
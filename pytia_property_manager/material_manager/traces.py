@@ -3,11 +3,10 @@
 """
 
 import tkinter as tk
-from typing import List
 
 from material_manager.layout import Layout
+from material_manager.search import get_material_search
 from material_manager.vars import Variables
-from resources import resource
 
 
 class Traces:
@@ -27,28 +26,28 @@ class Traces:
 
     def _add_traces(self) -> None:
         """Adds variable traces."""
+        self.vars.search.trace_add("write", self.trace_search)
         self.vars.sel_family.trace_add("write", self.trace_material_family)
         self.vars.sel_material.trace_add("write", self.trace_material_selection)
 
+    def trace_search(self, *_) -> None:
+        """The trace for the material search. Updates the list of search results."""
+        search = get_material_search(self.vars.material_index)
+        self.vars.search_results = search.search(self.vars.search.get())
+
+        self.layout.list_search.delete(0, tk.END)
+        if self.vars.search_results:
+            self.layout.list_search.insert(
+                tk.END, *(result.display for result in self.vars.search_results)
+            )
+
     def trace_material_family(self, *_) -> None:
         """The trace for the material family."""
         self.vars.sel_material.set("")
 
         if selected_family := self.vars.sel_family.get():
-            data = list(self.vars.material_data[selected_family])
-            materials: List[str] = []
-
-            for item in data:
-                if resource.settings.separators.metadata in item:
-                    material = item.split(resource.settings.separators.metadata)[0]
-                else:
-                    material = item
-
-                if material not in materials:
-                    materials.append(material)
-
             self.layout.input_material.config(
-                state="readonly", values=sorted(materials)
+                state="readonly", values=list(self.vars.material_index[selected_family])
             )
         else:
             self.layout.input_material.config(state=tk.DISABLED, values=[])
@@ -58,30 +57,21 @@ class Traces:
         self.vars.sel_color.set("")
 
         if selected_material := self.vars.sel_material.get():
-            data = list(self.vars.material_data[self.vars.sel_family.get()])
-            metadata: List[str] = [""]
-            for item in data:
-                if (
-                    f"{selected_material}{resource.settings.separators.metadata}"
-                    in item
-                ):
-                    datum = item.split(resource.settings.separators.metadata)[1]
-                    if datum not in metadata:
-                        metadata.append(datum)
-            if len(metadata) > 1:
-                # Check if there is a material without metadata (the base material, if you will),
-                # if not: Pop the option to select a material without metadata from the metadata
-                # list. In other words: Pop the empty option.
-                if selected_material not in data:
-                    metadata.remove("")
-
+            material = self.vars.material_index[self.vars.sel_family.get()][
+                selected_material
+            ]
+            # The empty option (the base material without metadata) is only part of the
+            # options, if the base material exists in the catalog.
+            if material.metadata:
                 self.layout.input_metadata.config(
-                    state="readonly", values=sorted(metadata)
+                    state="readonly", values=material.options
                 )
                 self.layout.input_metadata.current(0)
             else:
                 self.layout.input_metadata.config(state=tk.DISABLED, values=[])
 
             self.layout.button_save.configure(state=tk.NORMAL)
+            self.layout.button_batch.configure(state=tk.NORMAL)
         else:
             self.layout.button_save.configure(state=tk.DISABLED)
+            self.layout.button_batch.configure(state=tk.DISABLED)
@@ -8,6 +8,9 @@ from tkinter import Toplevel
 from typing import Dict
 from typing import List
 
+from material_manager.catalog import MaterialIndex
+from material_manager.search import SearchEntry
+
 
 @dataclass(slots=True, kw_only=True)
 class Variables:
@@ -16,18 +19,26 @@ class Variables:
     material: StringVar
     metadata: StringVar
 
+    search: StringVar
+    search_results: List[SearchEntry]
+
     sel_family: StringVar
     sel_material: StringVar
     sel_color: StringVar
 
     material_data: Dict[str, List[str]]
+    material_index: MaterialIndex
 
     def __init__(self, root: Toplevel):
         self.material = StringVar(master=root)
         self.metadata = StringVar(master=root)
 
+        self.search = StringVar(master=root)
+        self.search_results = []
+
         self.sel_family = StringVar(master=root)
         self.sel_material = StringVar(master=root)
         self.sel_color = StringVar(master=root)
 
         self.material_data = {}
+        self.material_index = {}
@@ -9,6 +9,7 @@ import atexit
 import importlib.resources
 import json
 import os
+import threading
 import tkinter.messagebox as tkmsg
 from dataclasses import asdict
 from dataclasses import dataclass
@@ -18,9 +19,11 @@ from pathlib import Path
 from typing import List
 from typing import Literal
 from typing import Optional
+from typing import get_args
 
 from const import APP_VERSION
 from const import APPDATA
+from const import APPDATA_SAVE_DELAY
 from const import CONFIG_APPDATA
 from const import CONFIG_INFOS
 from const import CONFIG_INFOS_DEFAULT
@@ -33,6 +36,7 @@ from const import CONFIG_USERS
 from const import LOGON
 from const import STYLES
 from resources.utils import expand_env_vars
+from resources.utils import write_file_atomic
 
 
 @dataclass(slots=True, kw_only=True, frozen=True)
@@ -172,6 +176,9 @@ class SettingsMails:
     admin: str
 
 
+RevisionStore = Literal["copy", "dedup"]
+
+
 @dataclass(slots=True, kw_only=True)
 class Settings:  # pylint: disable=R0902
     """Dataclass for settings (settings.json)."""
@@ -182,6 +189,7 @@ class Settings:  # pylint: disable=R0902
     link_material: bool
     min_brightness: int | None
     revision: int | str
+    revision_store: RevisionStore = "copy"
     restrictions: SettingsRestrictions
     verifications: SettingsVerifications
     separators: SettingsSeparators
@@ -209,6 +217,11 @@ class Settings:  # pylint: disable=R0902
         self.urls = SettingsUrls(**dict(self.urls))  # type: ignore
         self.mails = SettingsMails(**dict(self.mails))  # type: ignore
 
+        if self.revision_store not in get_args(RevisionStore):
+            raise ValueError(
+                f"Invalid revision store {self.revision_store!r} in {CONFIG_SETTINGS}."
+            )
+
 
 @dataclass(slots=True, kw_only=True, frozen=True)
 class PropsInfra:
@@ -363,6 +376,7 @@ class AppData:
     version: str = field(default=APP_VERSION)
     counter: int = 0
     theme: str = STYLES[0]
+    recent_themes: List[str] = field(default_factory=list)
     set_view: bool = True
     sync_color: bool = True
 
@@ -383,9 +397,16 @@ class Resources:  # pylint: disable=R0902
         "_users",
         "_infos",
         "_appdata",
+        "_appdata_saved",
+        "_appdata_timer",
+        "_appdata_lock",
     )
 
     def __init__(self) -> None:
+        self._appdata_saved: Optional[str] = None
+        self._appdata_timer: Optional[threading.Timer] = None
+        self._appdata_lock = threading.Lock()
+
         self._read_settings()
         self._read_props()
         self._read_users()
@@ -469,24 +490,52 @@ class Resources:  # pylint: disable=R0902
         """Reads the json config file from the appdata folder."""
         if os.path.exists(appdata_file := f"{APPDATA}\\{CONFIG_APPDATA}"):
             with open(appdata_file, "r", encoding="utf8") as f:
-                try:
-                    value = AppData(**json.load(f))
-                except Exception:
-                    value = AppData()
-                    tkmsg.showwarning(
-                        title="Configuration warning",
-                        message="The AppData config file has been corrupted. \
-                            You may need to apply your preferences again.",
-                    )
-                self._appdata = value
+                content = f.read()
+            try:
+                value = AppData(**json.loads(content))
+                self._appdata_saved = content
+            except Exception:
+                value = AppData()
+                tkmsg.showwarning(
+                    title="Configuration warning",
+                    message="The AppData config file has been corrupted. \
+                        You may need to apply your preferences again.",
+                )
+            self._appdata = value
         else:
             self._appdata = AppData()
 
     def _write_appdata(self) -> None:
-        """Saves appdata config to file."""
-        os.makedirs(APPDATA, exist_ok=True)
-        with open(f"{APPDATA}\\{CONFIG_APPDATA}", "w", encoding="utf8") as f:
-            json.dump(asdict(self._appdata), f)
+        """
+        Saves appdata config to file. The file is replaced atomically, and the write is
+        skipped if the content of the file wouldn't change.
+        """
+        with self._appdata_lock:
+            if self._appdata_timer is not None:
+                self._appdata_timer.cancel()
+                self._appdata_timer = None
+
+            content = json.dumps(asdict(self._appdata))
+            if content == self._appdata_saved:
+                return
+
+            os.makedirs(APPDATA, exist_ok=True)
+            write_file_atomic(f"{APPDATA}\\{CONFIG_APPDATA}", content)
+            self._appdata_saved = content
+
+    def save_appdata(self) -> None:
+        """
+        Requests saving the appdata config to file. Multiple requests within a short time
+        are collapsed into one write. Pending requests are written when the app exits.
+        """
+        with self._appdata_lock:
+            if self._appdata_timer is not None:
+                self._appdata_timer.cancel()
+            self._appdata_timer = threading.Timer(
+                APPDATA_SAVE_DELAY, self._write_appdata
+            )
+            self._appdata_timer.daemon = True
+            self._appdata_timer.start()
 
     def get_user_by_logon(self, logon: Optional[str] = None) -> User:
         """
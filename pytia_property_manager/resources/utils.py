@@ -8,8 +8,53 @@
 import os
 import re
 import sys
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from tkinter import messagebox as tkmsg
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+
+_ENV_VAR_PATTERN = re.compile(r"\%(.*?)\%")
+_DRIVE_PATTERN = re.compile(r"[a-z]:")
+_env_version = 0
+
+
+def refresh_env_vars() -> None:
+    """
+    Invalidates the cached expansions and the reverse index of the environment variables.
+    Call this after the environment of the process has been changed.
+    """
+    global _env_version  # pylint: disable=W0603
+    _env_version += 1
+    _get_env_path_index.cache_clear()
+
+
+@lru_cache(maxsize=256)
+def _expand_env_vars(
+    value: str, env_version: int  # pylint: disable=W0613
+) -> Tuple[str, Optional[str]]:
+    """
+    Expands all environment variables of the value in a single pass. The environment
+    version is only part of the cache key.
+
+    Returns:
+        Tuple[str, Optional[str]]: The expanded value and the first variable that isn't set,
+            None if all variables are set.
+    """
+    missing: List[str] = []
+
+    def replace(match: re.Match) -> str:
+        if (key := match.group(1)) in os.environ:
+            return os.environ[key]
+        missing.append(key)
+        return match.group(0)
+
+    return _ENV_VAR_PATTERN.sub(replace, value), missing[0] if missing else None
 
 
 def expand_env_vars(value: str, ignore_not_found: bool = False) -> str:
@@ -18,33 +63,102 @@ def expand_env_vars(value: str, ignore_not_found: bool = False) -> str:
     E.g.: Expands %ONEDRIVE%/foo/bar to "C:/Users/.../OneDrive/foo/bar
 
     The variable to replace must be between two percentage symbols.
+    All variables of the value are expanded. The result is cached, see `refresh_env_vars`.
 
     Terminates the app if the given value has a variable, that
     cannot be found in the system variables (and ignore_not_found is False),
     return the original value otherwise.
     """
-    output = value
-    filter_result = re.findall(r"\%(.*?)\%", value)
-    for key in filter_result:
-        if key in os.environ:
-            output = value.replace(f"%{key}%", os.environ[key])  # type: ignore
-        elif ignore_not_found:
-            return value
-        else:
-            tkmsg.showerror(
-                title="Environment Variables",
-                message=(
-                    f"The environment variable {key!r} is not set on your machine. "
-                    "Depending on your system it may be required to setup the "
-                    "environment variable in capitals only.\n\n"
-                    "Please contact your system administrator."
-                ),
-            )
-            sys.exit()
-    return output
+    output, key = _expand_env_vars(value, _env_version)
+    if key is None:
+        return output
+    if ignore_not_found:
+        return value
+    tkmsg.showerror(
+        title="Environment Variables",
+        message=(
+            f"The environment variable {key!r} is not set on your machine. "
+            "Depending on your system it may be required to setup the "
+            "environment variable in capitals only.\n\n"
+            "Please contact your system administrator."
+        ),
+    )
+    sys.exit()
+
+
+def write_file_atomic(path: Path | str, content: str) -> None:
+    """
+    Writes the content to the given file. The content is written to a temporary file in
+    the same folder first, which then replaces the target file. This way the target file
+    is never left half-written, even if the app is killed during the write.
+
+    Args:
+        path (Path | str): The file to write.
+        content (str): The text content of the file.
+    """
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path), prefix=".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf8") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def _normalize_path(value: str) -> str:
+    """
+    Normalizes a path for case-insensitive comparison: Lowercase, backslashes as separators
+    and no trailing separator. E.g.: `C:/Users/Foo/` becomes `c:\\users\\foo`.
+    """
+    return value.replace("/", "\\").rstrip("\\").lower()
 
 
-def create_path_symlink(path: Path, alway_apply_symlink: bool) -> str:
+def _is_root(normalized: str) -> bool:
+    """
+    Returns True if the normalized path is a root, e.g. `c:` or `/`. Variables like
+    `HOMEDRIVE` point to a root and would match every path on the drive.
+    """
+    return not normalized or _DRIVE_PATTERN.fullmatch(normalized) is not None
+
+
+@lru_cache(maxsize=None)
+def _get_env_path_index(preference: Tuple[str, ...] = ()) -> Dict[str, str]:
+    """
+    Returns the reverse map of the environment variables: The normalized value of each
+    variable maps to the name of the variable. The map is built once per process and
+    preference order, see `refresh_env_vars`. Variables that point to a root are left out.
+
+    If several variables have the same value, the first variable of the preference order
+    wins, otherwise the variable that comes first alphabetically.
+
+    Args:
+        preference (Tuple[str, ...], optional): The preferred variable names, most preferred
+            first. Defaults to ().
+
+    Returns:
+        Dict[str, str]: The variable names by their normalized value.
+    """
+    ranks = {key.upper(): rank for rank, key in enumerate(preference)}
+    index: Dict[str, str] = {}
+    for key in sorted(
+        os.environ, key=lambda k: (ranks.get(k.upper(), len(ranks)), k.upper())
+    ):
+        if not _is_root(value := _normalize_path(os.environ[key])):
+            index.setdefault(value, key)
+    return index
+
+
+def create_path_symlink(
+    path: Path,
+    alway_apply_symlink: bool,
+    preference: Optional[Sequence[str]] = None,
+) -> str:
     """
     Replaces paths of the given path with the environment variable, if exists
     and the users agrees. Starts with the deepest folder and runs upwards.
@@ -52,31 +166,43 @@ def create_path_symlink(path: Path, alway_apply_symlink: bool) -> str:
     E.g.: Replaces `C:/Users/.../OneDrive/foo/bar` with `%ONEDRIVE%/foo/bar`
 
     The environment variable will be encapsuled within two percentage symbols.
+    Paths are compared case-insensitive and regardless of the separators. Roots, like
+    `C:/`, are never replaced.
 
     Return the original path if no symlink is found.
+
+    Args:
+        path (Path): The path to replace.
+        alway_apply_symlink (bool): Replaces the path without asking the user.
+        preference (Optional[Sequence[str]], optional): The preferred variable names, if
+            several variables point to the same folder, most preferred first. Defaults to None.
+
+    Returns:
+        str: The path with the environment variable, or the original path.
     """
     path_str = str(path)
+    index = _get_env_path_index(tuple(preference or ()))
 
     for parent in path.parents:
-        for key, value in os.environ.items():
-            if str(parent) == value:
-                symlinked = path_str.replace(str(parent), f"%{key}%")
-                if alway_apply_symlink or tkmsg.askyesno(
-                    title="Symlink has been found.",
-                    message=(
-                        "A symlink has been found for the drawing documents path:\n"
-                        f" - Path: {str(parent)!r}.\n"
-                        f" - Symlink: {key!r}\n\n"
-                        "Do you want to save the symlink to the linked documents path?\n\n"
-                        "Depending on your choice, the following path will be written "
-                        "to the linked document:\n"
-                        f" - Yes: {symlinked!r}\n"
-                        f" - No:  {path_str!r}"
-                    ),
-                ):
-                    return symlinked
-                else:
-                    return path_str
+        normalized = _normalize_path(str(parent))
+        if _is_root(normalized) or (key := index.get(normalized)) is None:
+            continue
+        symlinked = os.path.join(f"%{key}%", path.relative_to(parent))
+        if alway_apply_symlink or tkmsg.askyesno(
+            title="Symlink has been found.",
+            message=(
+                "A symlink has been found for the drawing documents path:\n"
+                f" - Path: {str(parent)!r}.\n"
+                f" - Symlink: {key!r}\n\n"
+                "Do you want to save the symlink to the linked documents path?\n\n"
+                "Depending on your choice, the following path will be written "
+                "to the linked document:\n"
+                f" - Yes: {symlinked!r}\n"
+                f" - No:  {path_str!r}"
+            ),
+        ):
+            return symlinked
+        return path_str
     return path_str
 
 
@@ -0,0 +1,39 @@
+"""
+    Test the material_manager/catalog.py file.
+"""
+
+import os
+
+
+def test_get_catalog_key(tmp_path):
+    from pytia_property_manager.material_manager.catalog import _get_catalog_key
+
+    catalog = tmp_path / "Materials.CATMaterial"
+    catalog.write_bytes(b"catalog")
+    key = _get_catalog_key(catalog)
+    assert key["path"] == str(catalog)
+    assert key["size"] == 7
+    assert _get_catalog_key(catalog) == key
+
+    os.utime(catalog, ns=(0, key["mtime"] + 1_000_000_000))
+    assert _get_catalog_key(catalog) != key
+
+
+def test_disk_cache(tmp_path, monkeypatch):
+    from pytia_property_manager.material_manager import catalog as module
+
+    monkeypatch.setattr(module, "APPDATA", str(tmp_path))
+    monkeypatch.setattr(module, "_memory_cache", {})
+    path = tmp_path / "Materials.CATMaterial"
+    path.write_bytes(b"catalog")
+    data = {"Steel": ["S235", "S235|Galvanized"]}
+
+    assert module.get_cached_material_data(path) is None
+    module._write_disk_cache(module._get_catalog_key(path), data)
+    assert module._read_disk_cache(module._get_catalog_key(path)) == data
+    assert module.get_cached_material_data(path) == data
+
+    # A changed catalog invalidates the cache.
+    path.write_bytes(b"changed catalog")
+    assert module._read_disk_cache(module._get_catalog_key(path)) is None
+    assert module.get_cached_material_data(path) is None
@@ -0,0 +1,43 @@
+"""
+    Test the helper/drawings.py file.
+"""
+
+import os
+
+
+def test_update_folders(tmp_path):
+    from pytia_property_manager.helper.drawings import update_folders
+
+    (tmp_path / "sub").mkdir()
+    (tmp_path / ".rev").mkdir()
+    (tmp_path / "Part1.CATDrawing").touch()
+    (tmp_path / "Part1.CATPart").touch()
+    (tmp_path / "sub" / "Part2.catdrawing").touch()
+    (tmp_path / ".rev" / "1.Part1.CATDrawing").touch()
+
+    folders = update_folders(tmp_path, {})
+    assert sorted(folders) == sorted([str(tmp_path), os.path.join(tmp_path, "sub")])
+    assert folders[str(tmp_path)][1:] == (["sub"], ["Part1.CATDrawing"])
+    assert folders[os.path.join(tmp_path, "sub")][1:] == ([], ["Part2.catdrawing"])
+
+    # Unchanged folders are taken from the cache without listing them.
+    cached = {str(tmp_path): (folders[str(tmp_path)][0], [], ["Cached.CATDrawing"])}
+    assert update_folders(tmp_path, cached) == cached
+
+
+def test_build_stem_index():
+    from pytia_property_manager.helper.drawings import build_stem_index
+
+    index = build_stem_index(
+        {
+            "a": (0, ["b"], ["Part1.CATDrawing"]),
+            "b": (0, [], ["part1.CATDrawing", "Part2.CATDrawing"]),
+        }
+    )
+    assert index == {
+        "part1": [
+            os.path.join("a", "Part1.CATDrawing"),
+            os.path.join("b", "part1.CATDrawing"),
+        ],
+        "part2": [os.path.join("b", "Part2.CATDrawing")],
+    }
@@ -0,0 +1,61 @@
+"""
+    Test the handler/revisions.py file.
+"""
+
+
+def test_diff_properties():
+    from pytia_property_manager.handler.revisions import diff_properties
+
+    old = {"number": "A-100", "material": "S235", "notes": "old", "weight": "1.0"}
+    new = {"number": "A-100", "material": "S355", "weight": "", "source": "made"}
+
+    assert diff_properties(old, new) == [
+        ("material", "S235", "S355"),
+        ("notes", "old", ""),
+        ("source", "", "made"),
+        ("weight", "1.0", ""),
+    ]
+    assert diff_properties(new, new) == []
+    assert diff_properties({"a": ""}, {}) == []
+
+
+def test_revision_properties(tmp_path):
+    from pytia_property_manager.handler.revisions import read_revision_properties
+    from pytia_property_manager.handler.revisions import write_revision_properties
+
+    revision_file = tmp_path / "1.Part.CATPart"
+    assert read_revision_properties(revision_file) is None
+
+    write_revision_properties(revision_file, {"number": "A-100", "material": "S235"})
+    assert (tmp_path / "1.Part.CATPart.props.json").exists()
+    assert read_revision_properties(revision_file) == {
+        "number": "A-100",
+        "material": "S235",
+    }
+
+
+def test_restore_copy_after_store(tmp_path):
+    from pytia_property_manager.handler.revisions import RevisionSnapshot
+    from pytia_property_manager.handler.revisions import read_store_manifest
+    from pytia_property_manager.handler.revisions import restore_revision
+
+    document = tmp_path / "Part.CATPart"
+    revision_folder = tmp_path / ".rev"
+    revision_folder.mkdir()
+    revision_file = revision_folder / "1.Part.CATPart"
+
+    for content, store in ((b"stored", True), (b"copied", False)):
+        document.write_bytes(content)
+        snapshot = RevisionSnapshot(
+            source=document,
+            target=revision_file,
+            revision="1",
+            description="",
+            store=store,
+        )
+        snapshot._run()
+        assert snapshot.error is None
+
+    assert revision_file.name not in read_store_manifest(revision_folder)
+    restore_revision(revision_file, tmp_path / "restored.CATPart")
+    assert (tmp_path / "restored.CATPart").read_bytes() == b"copied"
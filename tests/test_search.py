@@ -0,0 +1,34 @@
+"""
+    Test the material_manager/search.py file.
+"""
+
+
+def _build_search(materials):
+    from pytia_property_manager.material_manager.catalog import IndexedMaterial
+    from pytia_property_manager.material_manager.search import MaterialSearch
+
+    return MaterialSearch(
+        {
+            family: {
+                material: IndexedMaterial(metadata=[], has_base=True)
+                for material in names
+            }
+            for family, names in materials.items()
+        }
+    )
+
+
+def test_search_short_material():
+    search = _build_search({"Plastics": ["PE", "PEEK", "PA6"]})
+
+    assert [e.text for e in search.search("pe")] == ["PE", "PEEK"]
+    assert [e.text for e in search.search("p")] == ["PA6", "PE", "PEEK"]
+
+
+def test_search_ranking():
+    search = _build_search({"Steel": ["S235", "1.4301 S235"], "Plastics": ["POM"]})
+
+    assert [e.text for e in search.search("s235")] == ["S235", "1.4301 S235"]
+    assert [e.text for e in search.search("om")] == ["POM"]
+    assert search.search("  ") == []
+    assert len(search.search("s", limit=1)) == 1
@@ -0,0 +1,77 @@
+"""
+    Test the resources/utils.py file.
+"""
+
+import os
+from pathlib import Path
+from pathlib import PureWindowsPath
+
+
+def test_create_path_symlink(monkeypatch):
+    from pytia_property_manager.resources.utils import _get_env_path_index
+    from pytia_property_manager.resources.utils import create_path_symlink
+
+    monkeypatch.setenv("PYTIA_TEST_ROOT", "/Pytia/Test/")
+    monkeypatch.setenv("PYTIA_TEST_DEEP", "/pytia/test/deep")
+    _get_env_path_index.cache_clear()
+
+    assert create_path_symlink(
+        Path("/pytia/test/deep/drawing.CATDrawing"), alway_apply_symlink=True
+    ) == os.path.join("%PYTIA_TEST_DEEP%", "drawing.CATDrawing")
+    assert create_path_symlink(
+        Path("/PYTIA/TEST/foo/drawing.CATDrawing"), alway_apply_symlink=True
+    ) == os.path.join("%PYTIA_TEST_ROOT%", "foo", "drawing.CATDrawing")
+    assert create_path_symlink(
+        Path("/elsewhere/drawing.CATDrawing"), alway_apply_symlink=True
+    ) == str(Path("/elsewhere/drawing.CATDrawing"))
+
+
+def test_create_path_symlink_preference(monkeypatch):
+    from pytia_property_manager.resources.utils import _get_env_path_index
+    from pytia_property_manager.resources.utils import create_path_symlink
+
+    monkeypatch.setenv("PYTIA_TEST_A", "/pytia/test")
+    monkeypatch.setenv("PYTIA_TEST_B", "/pytia/test")
+    _get_env_path_index.cache_clear()
+
+    path = Path("/pytia/test/drawing.CATDrawing")
+    assert create_path_symlink(path, alway_apply_symlink=True).startswith(
+        "%PYTIA_TEST_A%"
+    )
+    assert create_path_symlink(
+        path, alway_apply_symlink=True, preference=["pytia_test_b"]
+    ).startswith("%PYTIA_TEST_B%")
+
+
+def test_create_path_symlink_drive_root(monkeypatch):
+    from pytia_property_manager.resources.utils import _get_env_path_index
+    from pytia_property_manager.resources.utils import create_path_symlink
+
+    monkeypatch.setenv("HOMEDRIVE", "C:")
+    monkeypatch.setenv("SYSTEMDRIVE", "C:\\")
+    _get_env_path_index.cache_clear()
+
+    path = PureWindowsPath("C:\\Projects\\Foo\\drawing.CATDrawing")
+    assert create_path_symlink(path, alway_apply_symlink=True) == str(path)
+
+
+def test_expand_env_vars(monkeypatch):
+    from pytia_property_manager.resources.utils import expand_env_vars
+    from pytia_property_manager.resources.utils import refresh_env_vars
+
+    monkeypatch.setenv("PYTIA_TEST_DRIVE", "C:")
+    monkeypatch.setenv("PYTIA_TEST_USER", "foo")
+    refresh_env_vars()
+
+    assert expand_env_vars("%PYTIA_TEST_DRIVE%/%PYTIA_TEST_USER%/bar") == "C:/foo/bar"
+    assert expand_env_vars("C:/foo/bar") == "C:/foo/bar"
+    assert (
+        expand_env_vars(
+            "%PYTIA_TEST_DRIVE%/%PYTIA_TEST_MISSING%", ignore_not_found=True
+        )
+        == "%PYTIA_TEST_DRIVE%/%PYTIA_TEST_MISSING%"
+    )
+
+    monkeypatch.setenv("PYTIA_TEST_USER", "baz")
+    refresh_env_vars()
+    assert expand_env_vars("%PYTIA_TEST_DRIVE%/%PYTIA_TEST_USER%/bar") == "C:/baz/bar"